@@ -1,11 +1,82 @@
+import functools
 import os
 import sys
-from flask import Flask, request, render_template
+import time
+from flask import Flask, Response, g, request, render_template, stream_with_context
 import sbom.info as sbom
 import rubik.dispatch as dispatch
+import rubik.batch as batch
+import rubik.solverPool as solverPool
+import rubik.metrics as metrics
+import rubik.requestLog as requestLog
+import rubik.responseFormat as responseFormat
+import rubik.runtimeChecks as runtimeChecks
+
+# params are validated by dispatch, so the cube model skips its per-access checks
+# unless RUBIK_RUNTIME_CHECKS=1 asks to keep them for debugging
+runtimeChecks.configure(default = False)
 
 app = Flask(__name__)
 
+requestsInFlight = metrics.gauge('rubik_http_requests_in_flight', 'HTTP requests currently being served')
+
+@app.before_request
+def countRequestIn():
+    requestsInFlight.inc()
+
+@app.teardown_request
+def countRequestOut(exception):
+    requestsInFlight.dec()
+
+def negotiateFormat():
+    """Choose the response format from the 'format' param or the Accept header."""
+    return responseFormat._negotiate(request.args.get(responseFormat.FORMAT_PARAM),
+        request.headers.get('Accept'))
+
+def formatResponse(result):
+    """Serialize a result in the negotiated format."""
+    (body, contentType) = responseFormat._formatResponse(result, negotiateFormat())
+    return Response(body, mimetype = contentType)
+
+def batchErrorResponse(result):
+    """Serialize a batch that could not be dispatched as a JSON error with a client error status."""
+    return Response(responseFormat._dumps(result), status = 400, mimetype = batch.JSON_CONTENT_TYPE)
+
+def logRequests(route):
+    """Log every request a route serves once its response is done, including ones that raise."""
+    @functools.wraps(route)
+    def loggedRoute(*args, **kwargs):
+        startTime = time.perf_counter()
+        response = None
+        error = None
+        try:
+            response = app.make_response(route(*args, **kwargs))
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            # routes record what they dispatched, and any exception they turned into a response, in g
+            path = request.path
+            op = g.get('op')
+            status = g.get('status')
+            error = error or g.get('error')
+            
+            def log():
+                # exceptions that escape are served as 500, unless they are HTTP errors with their own code
+                statusCode = response.status_code if response is not None else getattr(error, 'code', None) or 500
+                requestLog.logRequest(op, time.perf_counter() - startTime,
+                    status or ('ok' if statusCode < 400 and error is None else 'error'),
+                    response.content_length if response is not None else None,
+                    route = path, statusCode = statusCode, error = error)
+            
+            # streamed responses are only done once the server has sent their whole body
+            if response is not None:
+                response.call_on_close(log)
+            else:
+                log()
+    return loggedRoute
+
 def getAbout():
     return {'platform': sys.platform,
             'version': sys.version,
@@ -18,6 +89,7 @@ def getAbout():
 #  
 #
 @app.route('/')
+@logRequests
 def hello():
     """Return a friendly HTTP greeting."""
     aboutInfo = getAbout()
@@ -34,9 +106,10 @@ def hello():
 #  It results in 
 #
 @app.route('/about')
+@logRequests
 def about():
     """Return about information"""
-    return str(getAbout())
+    return formatResponse(getAbout())
     
     
 #-----------------------------------
@@ -46,18 +119,89 @@ def about():
 #  Parameters are passed as a URL query:
 #        /rubik?parm1=value1&parm2=value2
 #
+#  Results are returned as JSON, pretty-printed with format=pretty.
+#  The str(dict) repr of older releases is returned with format=legacy,
+#  or to clients whose Accept header prefers text/plain.
+#
 @app.route('/rubik')
+@logRequests
 def server():
     """Return dispatched solution."""
     try:
         userParms = {}
         for key in request.args:
-            userParms[key] = str(request.args.get(key, ''))
+            if key != responseFormat.FORMAT_PARAM:
+                userParms[key] = str(request.args.get(key, ''))
+        g.op = userParms.get('op')
         result=dispatch._dispatch(userParms)
-        print("Response -->", str(result))
-        return str(result)
+        g.status = result.get('status')
+        return formatResponse(result)
     except Exception as e:
-        return str(e)
+        g.error = e
+        if negotiateFormat() == responseFormat.LEGACY_FORMAT:
+            return str(e)
+        return formatResponse({'status': 'error: ' + str(e)})
+    
+    
+#-----------------------------------
+#  The following code is invoked when the path portion of the URL matches 
+#         /rubik/batch
+#
+#  Items are POSTed as a JSON array, or as NDJSON with the content type
+#  application/x-ndjson, each of the form:
+#        {"op": ..., "cube": ..., "dir": ...}
+#  Results are returned in order, in the same format as the items.
+#  A body that is not a list of items is rejected with status 400 and
+#  a JSON error of the form {"status": "error: ..."}.
+#
+@app.route('/rubik/batch', methods=['POST'])
+@logRequests
+def batchServer():
+    """Return dispatched solutions for a batch of items."""
+    g.op = 'batch'
+    try:
+        isNdjson = (request.mimetype == batch.NDJSON_CONTENT_TYPE)
+        items = batch._parseItems(request.get_data(as_text=True), isNdjson)
+        results = batch._batch(items, solverPool.getPool())
+        if not isinstance(results, list):
+            g.status = results.get(batch.STATUS)
+            return batchErrorResponse(results)
+        return Response(batch._formatResults(results, isNdjson),
+            mimetype = batch.NDJSON_CONTENT_TYPE if isNdjson else batch.JSON_CONTENT_TYPE)
+    except Exception as e:
+        g.error = e
+        return batchErrorResponse({batch.STATUS: 'error: ' + str(e)})
+    
+    
+#-----------------------------------
+#  The following code is invoked when the path portion of the URL matches 
+#         /rubik/stream
+#
+#  Items are POSTed as NDJSON, one per line, and dispatched as they are
+#  read. Results are streamed back as NDJSON in the same order, so job
+#  files of any length go through one connection in constant memory.
+#
+@app.route('/rubik/stream', methods=['POST'])
+@logRequests
+def streamServer():
+    """Stream dispatched solutions for a stream of items."""
+    g.op = 'stream'
+    results = batch._streamResults(request.stream, solverPool.getPool())
+    return Response(stream_with_context(results), mimetype = batch.NDJSON_CONTENT_TYPE)
+    
+    
+#-----------------------------------
+#  The following code is invoked when the path portion of the URL matches 
+#         /metrics
+#
+#  It results in this worker process's metrics, in the text format
+#  Prometheus scrapes.
+#
+@app.route('/metrics')
+@logRequests
+def metricsServer():
+    """Return metrics for Prometheus to scrape."""
+    return Response(metrics.render(), content_type = metrics.CONTENT_TYPE)
     
     
 #-----------------------------------
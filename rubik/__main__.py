@@ -0,0 +1,155 @@
+import argparse
+import contextlib
+import mmap
+import os
+import sys
+import time
+
+import rubik.batch as batch
+import rubik.runtimeChecks as runtimeChecks
+import rubik.solveCache as solveCache
+import rubik.solutionStore as solutionStore
+from rubik.solverPool import SolverPool
+
+# solves JSONL files of dispatch parameters offline, without standing up the HTTP service:
+#
+#     python -m rubik jobs.jsonl -o results.jsonl --workers 8
+
+# how often progress is reported, in seconds
+DEFAULT_PROGRESS_INTERVAL = 5.0
+
+def main(argv = None) -> int:
+    """ runs the command line, returning its exit status """
+    
+    args = _parseArgs(argv)
+    
+    # params are validated by dispatch, so the cube model skips its per-access checks
+    # unless the environment asks to keep them, before any worker processes start
+    runtimeChecks.configure(default = False)
+    
+    # configure caching before any solve, so worker processes inherit it too
+    if args.cache_size is not None:
+        os.environ[solveCache.CACHE_SIZE_VARIABLE] = str(args.cache_size)
+    
+    if args.store is not None:
+        os.environ[solutionStore.STORE_PATH_VARIABLE] = args.store
+    
+    with contextlib.ExitStack() as stack:
+        lines = stack.enter_context(_openLines(args.input, args.mmap))
+        output = stack.enter_context(_openOutput(args.output))
+        pool = stack.enter_context(SolverPool(args.workers)) if args.workers else None
+        
+        progress = _Progress(sys.stderr, args.progress_interval, args.quiet)
+        
+        for results in batch._streamResults(lines, pool, args.window):
+            output.write(results)
+            progress.advance(results.count('\n'))
+        
+        progress.finish()
+    
+    return 0
+
+def _parseArgs(argv):
+    """ parses the command line arguments """
+    
+    parser = argparse.ArgumentParser(
+        prog = 'python -m rubik',
+        description = 'dispatch each line of a JSONL file of params, writing a JSONL file of results in order'
+    )
+    
+    parser.add_argument('input', nargs = '?', default = '-', help = 'JSONL file of params, or - for stdin (default)')
+    parser.add_argument('-o', '--output', default = '-', help = 'JSONL file of results, or - for stdout (default)')
+    parser.add_argument('--mmap', action = 'store_true', help = 'memory-map the input file instead of reading it')
+    parser.add_argument('--workers', type = int, default = 0, help = 'worker processes to solve with, 0 to solve in-process (default)')
+    parser.add_argument('--window', type = int, default = batch.STREAM_WINDOW_SIZE, help = 'lines read ahead for the workers at a time')
+    parser.add_argument('--cache-size', type = int, help = 'solutions cached per process')
+    parser.add_argument('--store', help = 'path of a persistent solution store to read and populate')
+    parser.add_argument('--progress-interval', type = float, default = DEFAULT_PROGRESS_INTERVAL, help = 'seconds between progress reports')
+    parser.add_argument('-q', '--quiet', action = 'store_true', help = 'do not report progress or throughput')
+    
+    args = parser.parse_args(argv)
+    
+    if args.workers < 0 or args.window < 1:
+        parser.error('--workers must not be negative, and --window must be positive')
+    
+    if args.mmap and args.input == '-':
+        parser.error('--mmap needs an input file')
+    
+    return args
+
+@contextlib.contextmanager
+def _openLines(path: str, useMmap: bool = False):
+    """ opens the input as an iterable of lines of bytes """
+    
+    if path == '-':
+        yield sys.stdin.buffer
+        return
+    
+    with open(path, 'rb') as file:
+        
+        # an empty file cannot be mapped, and has no lines anyway
+        if not useMmap or os.fstat(file.fileno()).st_size == 0:
+            yield file
+            return
+        
+        with mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as mapped:
+            yield iter(mapped.readline, b'')
+
+@contextlib.contextmanager
+def _openOutput(path: str):
+    """ opens the output for writing text """
+    
+    if path == '-':
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    
+    with open(path, 'w') as file:
+        yield file
+
+class _Progress:
+    """ reports how many lines have been dispatched, and how fast """
+    
+    def __init__(self, stream, interval: float, quiet: bool = False, clock = time.monotonic):
+        """ starts timing, reporting to a stream at most once per interval """
+        
+        self._stream = stream
+        self._interval = interval
+        self._quiet = quiet
+        self._clock = clock
+        
+        self._startTime = clock()
+        self._lastReportTime = self._startTime
+        
+        self.count = 0
+    
+    def advance(self, count: int):
+        """ counts more dispatched lines, reporting progress if an interval has passed """
+        
+        self.count += count
+        
+        now = self._clock()
+        
+        if now - self._lastReportTime >= self._interval:
+            self._lastReportTime = now
+            self._report('dispatched', now)
+    
+    def finish(self):
+        """ reports the final count and throughput """
+        
+        self._report('done:', self._clock())
+    
+    def _report(self, label: str, now: float):
+        """ writes the count and throughput so far """
+        
+        if self._quiet:
+            return
+        
+        elapsed = now - self._startTime
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        
+        self._stream.write('%s %d lines in %.1fs, %.1f lines/s\n' % (label, self.count, elapsed, rate))
+        self._stream.flush()
+
+if __name__ == '__main__':
+    sys.exit(main())
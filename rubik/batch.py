@@ -0,0 +1,93 @@
+import itertools
+import json
+
+import rubik.dispatch as dispatch
+import rubik.responseFormat as responseFormat
+
+ERROR_INVALID_BATCH = 'error: batch is not a list'
+ERROR_INVALID_ITEM = 'error: item is not valid json'
+STATUS = 'status'
+
+JSON_CONTENT_TYPE = 'application/json'
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+# batches smaller than this are dispatched in-process, where IPC would outweigh the parallelism
+MIN_PARALLEL_BATCH_SIZE = 8
+
+# how many streamed items are read ahead and dispatched together when a solver pool is supplied
+STREAM_WINDOW_SIZE = 256
+
+def _batch(items, pool = None):
+    """Return the dispatched result of each item, in order"""
+    
+    # validate that the batch is a list of items
+    if not isinstance(items, list):
+        return {STATUS: ERROR_INVALID_BATCH}
+    
+    # fan large batches out across the worker processes of a solver pool, if supplied
+    if pool is not None and len(items) >= MIN_PARALLEL_BATCH_SIZE:
+        return pool.dispatch(items)
+    
+    return [_dispatchItem(item) for item in items]
+
+def _dispatchItem(item):
+    """Dispatch one batch item, reporting any failure as its own status"""
+    
+    # items that could not be parsed are reported as such
+    if isinstance(item, _Unparsable):
+        return {STATUS: ERROR_INVALID_ITEM}
+    
+    try:
+        return dispatch._dispatch(item)
+    except Exception as e:
+        return {STATUS: 'error: ' + str(e)}
+
+def _streamResults(lines, pool = None, windowSize: int = STREAM_WINDOW_SIZE):
+    """Dispatch NDJSON lines as they are read, yielding the NDJSON result of each in order"""
+    
+    items = (_parseLine(line) for line in lines if line.strip())
+    
+    # without a pool each item is dispatched as soon as it is read, with one
+    # a window of items is read ahead to keep its worker processes busy
+    if pool is None:
+        windowSize = 1
+    
+    # only one window of items and results is held in memory at a time
+    while True:
+        window = list(itertools.islice(items, windowSize))
+        
+        if not window:
+            return
+        
+        yield _formatResults(_batch(window, pool), isNdjson = True)
+
+def _parseItems(body: str, isNdjson: bool = False):
+    """Parse a request body holding either a JSON array or NDJSON lines of items"""
+    
+    # NDJSON holds one item per line, each parsed independently
+    if isNdjson:
+        return [_parseLine(line) for line in body.splitlines() if line.strip()]
+    
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+def _parseLine(line: str | bytes):
+    """Parse one NDJSON line into an item"""
+    
+    try:
+        return json.loads(line)
+    except ValueError:
+        return _Unparsable()
+
+def _formatResults(results, isNdjson: bool = False) -> str:
+    """Serialize batch results in the same format the items were sent in"""
+    
+    if isNdjson and isinstance(results, list):
+        return ''.join(responseFormat._dumps(result) + '\n' for result in results)
+    
+    return responseFormat._dumps(results)
+
+class _Unparsable:
+    """Marks an NDJSON line that is not valid JSON, and survives pickling to a worker process"""
@@ -0,0 +1,352 @@
+import fcntl
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from multiprocessing import resource_tracker, shared_memory
+
+from rubik.cubeCode import CubeCode
+
+# backends that a solve cache can be kept in, from the heap of one process to memory shared
+# by every worker process on a host or a cache server shared by every host
+
+# name of the shared memory segment that worker processes attach to by default
+DEFAULT_SHARED_NAME = 'rubik_solve_cache'
+
+# how many solutions a shared memory cache holds by default
+DEFAULT_SHARED_SLOTS = 16384
+
+# the longest rotation codes a shared memory cache holds, longer solutions are not cached
+SHARED_VALUE_WIDTH = 256
+
+# how many slots a cube code may occupy in a shared memory cache before an entry is evicted
+SHARED_MAX_PROBES = 8
+
+# how many times a slot is reread while a writer changes it, before it is treated as a miss
+SHARED_READ_RETRIES = 1000
+
+# prefix of the keys a network cache stores solutions under
+DEFAULT_NETWORK_PREFIX = 'rubik:solve:'
+
+# segment header, identifying the segment and recording its number of slots
+_MAGIC = b'RUBIKSC1'
+_HEADER = struct.Struct('<8sQ')
+
+# each slot is a sequence number, even when stable and 0 when empty, then a cube code and its rotation codes
+_SLOT = struct.Struct('<I%dsH%ds' % (CubeCode.CODE_LENGTH, SHARED_VALUE_WIDTH))
+_SEQUENCE = struct.Struct('<I')
+
+class CacheBackend(ABC):
+    """ the interface every solve cache backend provides """
+    
+    @abstractmethod
+    def get(self, cube: str) -> str | None:
+        """ returns the cached rotation codes that solve a cube code, or None if not cached """
+    
+    @abstractmethod
+    def put(self, cube: str, rotationCodes: str):
+        """ caches the rotation codes that solve a cube code """
+    
+    @abstractmethod
+    def clear(self):
+        """ removes all cached solutions and resets the counters """
+    
+    @abstractmethod
+    def getStats(self):
+        """ returns the hit, miss, and eviction counters along with the cache size """
+
+class SharedMemoryCache(CacheBackend):
+    """
+    a cache of fixed-size entries in a named shared memory segment, so every worker process
+    on a host sees each other's solutions as soon as they are cached
+    
+    writers are serialized by a lock file, while readers take no lock and instead retry
+    slots whose sequence number changed under them, giving up on slots left half written
+    by a writer that died
+    """
+    
+    def __init__(self, name: str = DEFAULT_SHARED_NAME, slots: int = DEFAULT_SHARED_SLOTS):
+        """ attaches to the named segment, creating it with the given number of slots if needed """
+        
+        # ensure params are valid
+        assert isinstance(name, str) and name
+        assert isinstance(slots, int) and slots > 0
+        
+        self.name = name
+        
+        self._lockFile = open(os.path.join(tempfile.gettempdir(), name + '.lock'), 'a+b')
+        self._lock = _FileLock(self._lockFile)
+        
+        # only the first process to attach creates and sizes the segment
+        with self._locked():
+            try:
+                self._memory = shared_memory.SharedMemory(name, create = True, size = _HEADER.size + slots * _SLOT.size)
+                _HEADER.pack_into(self._memory.buf, 0, _MAGIC, slots)
+            except FileExistsError:
+                self._memory = shared_memory.SharedMemory(name)
+        
+        # the segment outlives any one worker process, until unlinked
+        resource_tracker.unregister(_trackedName(self._memory), 'shared_memory')
+        
+        (magic, self.slots) = _HEADER.unpack_from(self._memory.buf, 0)
+        assert magic == _MAGIC
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, cube: str) -> str | None:
+        """ returns the cached rotation codes that solve a cube code, or None if not cached """
+        
+        key = cube.encode('ascii')
+        
+        for offset in self._probe(key):
+            entry = self._readSlot(offset)
+            
+            # a slot that never settles is skipped, as if it held another cube code
+            if entry is None:
+                continue
+            
+            (sequence, slotKey, length, value) = entry
+            
+            # an empty slot ends the probe sequence
+            if sequence == 0:
+                break
+            
+            if slotKey == key:
+                self.hits += 1
+                return value[:length].decode('ascii')
+        
+        self.misses += 1
+        return None
+    
+    def put(self, cube: str, rotationCodes: str):
+        """ caches the rotation codes that solve a cube code, unless they do not fit in a slot """
+        
+        key = cube.encode('ascii')
+        value = rotationCodes.encode('ascii')
+        
+        if len(value) > SHARED_VALUE_WIDTH:
+            return
+        
+        with self._locked():
+            buffer = self._memory.buf
+            offsets = list(self._probe(key))
+            
+            # reuse the slot already holding the cube code, else the first empty one,
+            # else evict the entry in the cube code's home slot
+            target = None
+            
+            for offset in offsets:
+                (sequence, slotKey) = struct.unpack_from('<I%ds' % CubeCode.CODE_LENGTH, buffer, offset)
+                
+                if sequence == 0 or slotKey == key:
+                    target = offset
+                    break
+            
+            if target is None:
+                target = offsets[0]
+                self.evictions += 1
+            
+            # a slot left odd by a writer that died is made even again by the next write to it
+            sequence = _SEQUENCE.unpack_from(buffer, target)[0]
+            sequence += sequence % 2
+            
+            # an odd sequence number tells readers the slot is being written
+            _SEQUENCE.pack_into(buffer, target, sequence + 1)
+            _SLOT.pack_into(buffer, target, sequence + 1, key, len(value), value)
+            _SEQUENCE.pack_into(buffer, target, sequence + 2)
+    
+    def clear(self):
+        """ removes all cached solutions and resets this process's counters """
+        
+        with self._locked():
+            buffer = self._memory.buf
+            buffer[_HEADER.size:] = bytes(len(buffer) - _HEADER.size)
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        """ how many solutions are cached """
+        
+        return sum(
+            1 for slot in range(self.slots)
+            if _SEQUENCE.unpack_from(self._memory.buf, _HEADER.size + slot * _SLOT.size)[0] != 0
+        )
+    
+    def getStats(self):
+        """ returns this process's hit, miss, and eviction counters along with the cache size """
+        
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self),
+            'maxSize': self.slots
+        }
+    
+    def close(self):
+        """ detaches this process from the segment """
+        
+        self._memory.close()
+        self._lockFile.close()
+    
+    def unlink(self):
+        """ destroys the segment and its lock file once every process has detached from them """
+        
+        # unlinking unregisters the segment from the resource tracker, so it must be registered again
+        resource_tracker.register(_trackedName(self._memory), 'shared_memory')
+        self._memory.unlink()
+        
+        try:
+            os.remove(self._lockFile.name)
+        except FileNotFoundError:
+            pass
+    
+    def _probe(self, key: bytes):
+        """ yields the byte offsets of the slots a key may occupy, in probe order """
+        
+        start = int.from_bytes(hashlib.blake2b(key, digest_size = 8).digest(), 'little') % self.slots
+        
+        for step in range(min(SHARED_MAX_PROBES, self.slots)):
+            yield _HEADER.size + ((start + step) % self.slots) * _SLOT.size
+    
+    def _readSlot(self, offset: int):
+        """ reads a slot consistently, retrying while a writer changes it, or None if it never settles """
+        
+        for _ in range(SHARED_READ_RETRIES):
+            entry = _SLOT.unpack_from(self._memory.buf, offset)
+            
+            if entry[0] % 2 == 0 and _SEQUENCE.unpack_from(self._memory.buf, offset)[0] == entry[0]:
+                return entry
+        
+        return None
+    
+    def _locked(self):
+        """ an exclusive lock across threads and processes, held while writing to the segment """
+        
+        return self._lock
+
+class NetworkCache(CacheBackend):
+    """
+    a cache kept by a cache server shared across hosts, through a client providing
+    get(key) returning bytes or None, set(key, value, expire), and flush_all(),
+    as memcached clients such as pymemcache do
+    """
+    
+    def __init__(self, client, prefix: str = DEFAULT_NETWORK_PREFIX, ttl: int = 0):
+        """ caches solutions through a client, each for at most ttl seconds, or indefinitely if 0 """
+        
+        # ensure params are valid
+        assert isinstance(prefix, str)
+        assert isinstance(ttl, int) and ttl >= 0
+        
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, cube: str) -> str | None:
+        """ returns the cached rotation codes that solve a cube code, or None if not cached """
+        
+        value = self.client.get(self.prefix + cube)
+        
+        if value is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return value.decode('ascii')
+    
+    def put(self, cube: str, rotationCodes: str):
+        """ caches the rotation codes that solve a cube code """
+        
+        self.client.set(self.prefix + cube, rotationCodes.encode('ascii'), self.ttl)
+    
+    def clear(self):
+        """ removes all cached solutions and resets this process's counters """
+        
+        self.client.flush_all()
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def getStats(self):
+        """ returns this process's hit and miss counters, the server tracks size and evictions """
+        
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': None,
+            'size': None,
+            'maxSize': None
+        }
+
+class LocalNetworkClient:
+    """ an in-process stand-in for a cache server client, for use by NetworkCache in tests """
+    
+    def __init__(self):
+        """ instantiates a client of an empty cache """
+        
+        self._lock = threading.Lock()
+        self._values = {}
+    
+    def get(self, key: str) -> bytes | None:
+        """ returns the value stored under a key, or None """
+        
+        with self._lock:
+            return self._values.get(key)
+    
+    def set(self, key: str, value: bytes, expire: int = 0):
+        """ stores a value under a key, expiry is not simulated """
+        
+        with self._lock:
+            self._values[key] = value
+    
+    def flush_all(self):
+        """ removes every stored value """
+        
+        with self._lock:
+            self._values.clear()
+
+class _FileLock:
+    """
+    context manager holding an exclusive lock on a file, along with a thread lock, as every
+    thread of a process shares the file's flock and would otherwise all hold it at once
+    """
+    
+    def __init__(self, file):
+        """ wraps the file to lock """
+        
+        self._file = file
+        self._threadLock = threading.Lock()
+    
+    def __enter__(self):
+        """ blocks until the lock is held """
+        
+        self._threadLock.acquire()
+        
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        except BaseException:
+            self._threadLock.release()
+            raise
+    
+    def __exit__(self, *exc):
+        """ releases the lock """
+        
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._threadLock.release()
+
+def _trackedName(memory: shared_memory.SharedMemory) -> str:
+    """ the name the resource tracker knows a segment by, which has a leading slash on POSIX """
+    
+    return '/' + memory.name if os.name == 'posix' else memory.name
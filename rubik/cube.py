@@ -1,6 +1,7 @@
 
 import itertools
 
+import rubik.runtimeChecks as runtimeChecks
 from rubik.cubeColor import CubeColor
 from rubik.cubelet import Cubelet
 from rubik.cubeCode import CubeCode
@@ -120,6 +121,22 @@ class Cube:
         }
     }
 
+    """ direction that each cubelet of a face is rotated when that face is rotated """
+    CUBELET_ROTATION_DIRECTIONS = {
+        (CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE): CubeRotationDirection.FLIP_RIGHTWARD,
+        (CubeFacePosition.BACK, FaceRotationDirection.COUNTERCLOCKWISE): CubeRotationDirection.FLIP_RIGHTWARD,
+        (CubeFacePosition.FRONT, FaceRotationDirection.COUNTERCLOCKWISE): CubeRotationDirection.FLIP_LEFTWARD,
+        (CubeFacePosition.BACK, FaceRotationDirection.CLOCKWISE): CubeRotationDirection.FLIP_LEFTWARD,
+        (CubeFacePosition.LEFT, FaceRotationDirection.CLOCKWISE): CubeRotationDirection.FLIP_FORWARD,
+        (CubeFacePosition.RIGHT, FaceRotationDirection.COUNTERCLOCKWISE): CubeRotationDirection.FLIP_FORWARD,
+        (CubeFacePosition.LEFT, FaceRotationDirection.COUNTERCLOCKWISE): CubeRotationDirection.FLIP_BACKWARD,
+        (CubeFacePosition.RIGHT, FaceRotationDirection.CLOCKWISE): CubeRotationDirection.FLIP_BACKWARD,
+        (CubeFacePosition.UP, FaceRotationDirection.CLOCKWISE): CubeRotationDirection.SPIN_LEFTWARD,
+        (CubeFacePosition.DOWN, FaceRotationDirection.COUNTERCLOCKWISE): CubeRotationDirection.SPIN_LEFTWARD,
+        (CubeFacePosition.UP, FaceRotationDirection.COUNTERCLOCKWISE): CubeRotationDirection.SPIN_RIGHTWARD,
+        (CubeFacePosition.DOWN, FaceRotationDirection.CLOCKWISE): CubeRotationDirection.SPIN_RIGHTWARD,
+    }
+    
     def __init__(self, cubeCode: str | CubeCode):
         """ initializes the cube from a cube code representing the initial state """
         
@@ -157,6 +174,11 @@ class Cube:
         # congrats, it's a valid index
         return self._cubelets[coord]
     
+    def _getitemUnchecked(self, coord: tuple[int]):
+        """ accessor for the cubelets that make up the cube, for coordinates known to be valid """
+        
+        return self._cubelets[coord]
+    
     def __setitem__(self, coord, value):
         """ mutator for the cubelets that make up the cube """
         
@@ -174,6 +196,11 @@ class Cube:
         # congrats, it's a valid assignment
         self._cubelets[coord] = value
     
+    def _setitemUnchecked(self, coord, value):
+        """ mutator for the cubelets that make up the cube, for coordinates and cubelets known to be valid """
+        
+        self._cubelets[coord] = value
+    
     def rotateFace(self, facePosition: CubeFacePosition, direction: FaceRotationDirection):
         """ rotates one of the cube's faces either clockwise or counterclockwise """
         
@@ -181,43 +208,13 @@ class Cube:
         assert (isinstance(facePosition, CubeFacePosition))
         assert (isinstance(direction, FaceRotationDirection))
         
-        # determine which direction to rotate each cubelet
-        
-        if (
-            facePosition is CubeFacePosition.FRONT and direction is FaceRotationDirection.CLOCKWISE
-            or facePosition is CubeFacePosition.BACK and direction is FaceRotationDirection.COUNTERCLOCKWISE
-        ):
-            cubeletRotationDirection = CubeRotationDirection.FLIP_RIGHTWARD
-        
-        elif (
-            facePosition is CubeFacePosition.FRONT and direction is FaceRotationDirection.COUNTERCLOCKWISE
-            or facePosition is CubeFacePosition.BACK and direction is FaceRotationDirection.CLOCKWISE
-        ):
-            cubeletRotationDirection = CubeRotationDirection.FLIP_LEFTWARD
-            
-        elif (
-            facePosition is CubeFacePosition.LEFT and direction is FaceRotationDirection.CLOCKWISE
-            or facePosition is CubeFacePosition.RIGHT and direction is FaceRotationDirection.COUNTERCLOCKWISE
-        ):
-            cubeletRotationDirection = CubeRotationDirection.FLIP_FORWARD
-        
-        elif (
-            facePosition is CubeFacePosition.LEFT and direction is FaceRotationDirection.COUNTERCLOCKWISE
-            or facePosition is CubeFacePosition.RIGHT and direction is FaceRotationDirection.CLOCKWISE
-        ):
-            cubeletRotationDirection = CubeRotationDirection.FLIP_BACKWARD
-            
-        elif (
-            facePosition is CubeFacePosition.UP and direction is FaceRotationDirection.CLOCKWISE
-            or facePosition is CubeFacePosition.DOWN and direction is FaceRotationDirection.COUNTERCLOCKWISE
-        ):
-            cubeletRotationDirection = CubeRotationDirection.SPIN_LEFTWARD
+        self._rotateFaceUnchecked(facePosition, direction)
+    
+    def _rotateFaceUnchecked(self, facePosition: CubeFacePosition, direction: FaceRotationDirection):
+        """ rotates one of the cube's faces, for params known to be valid """
         
-        elif (
-            facePosition is CubeFacePosition.UP and direction is FaceRotationDirection.COUNTERCLOCKWISE
-            or facePosition is CubeFacePosition.DOWN and direction is FaceRotationDirection.CLOCKWISE
-        ):
-            cubeletRotationDirection = CubeRotationDirection.SPIN_RIGHTWARD
+        # determine which direction to rotate each cubelet
+        cubeletRotationDirection = self.CUBELET_ROTATION_DIRECTIONS[facePosition, direction]
         
         # start tracking changes to the cube's cubelets
         alteredCubelets = {}
@@ -245,6 +242,11 @@ class Cube:
         assert (isinstance(facePosition, CubeFacePosition))
         assert (isinstance(direction, FaceRotationDirection))
         
+        return self._rotateCoordUnchecked(coord, facePosition, direction)
+    
+    def _rotateCoordUnchecked(self, coord, facePosition: CubeFacePosition, direction: FaceRotationDirection):
+        """ determines the new location of a cube coordinate after a face rotation, for params known to be valid """
+        
         # a coordinate not in the face being rotated is not affected
         if not coord in self.CUBELET_COORDS[facePosition]:
             return coord
@@ -312,9 +314,18 @@ class Cube:
                 color = self[coords][facePosition]
                 codeText += color.value
         
-        cubeCode = CubeCode(codeText)
+        # the cube only ever holds a valid arrangement of colors
+        cubeCode = CubeCode(codeText, validated = True)
         return cubeCode.text
     
+    def clone(self):
+        """ returns an independent copy of the cube, without parsing it back from a cube code """
+        
+        clone = Cube.__new__(Cube)
+        clone._cubelets = {coord: cubelet.clone() for (coord, cubelet) in self._cubelets.items()}
+        
+        return clone
+    
     '''
     methods for determining whether the cube satisfies certain conditions
     that are useful to check for in cube solver algorithms
@@ -569,4 +580,11 @@ class Cube:
             return False
         
         return True
-    
\ No newline at end of file
+
+# once inputs are validated at the boundary, cubelet access and rotation can skip their checks
+runtimeChecks.register(Cube, {
+    '__getitem__': Cube._getitemUnchecked,
+    '__setitem__': Cube._setitemUnchecked,
+    'rotateFace': Cube._rotateFaceUnchecked,
+    'rotateCoord': Cube._rotateCoordUnchecked,
+})
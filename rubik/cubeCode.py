@@ -1,6 +1,7 @@
 
 from rubik.cubeColor import CubeColor
 from rubik.cubeFacePosition import CubeFacePosition
+from rubik.cubeCodeValidity import CubeCodeValidity
 
 class CubeCode:
     """ represents a code supplied to create a 3x3x3 Cube instance """
@@ -21,11 +22,15 @@ class CubeCode:
     """ the center tile index in each cube face """
     FACE_CENTER_INDICES = [4, 13, 22, 31, 40, 49]
     
-    def __init__(self, codeText: str):
-        """ instantiates CubeCode from supplied code string """
+    """ color letters every cube code is made up of, and how many times each appears """
+    COLOR_LETTERS = ''.join(color.value for color in CubeColor)
+    COLOR_COUNT = CODE_LENGTH // len(CubeColor)
+    
+    def __init__(self, codeText: str, validated: bool = False):
+        """ instantiates CubeCode from supplied code string, skipping validation if already validated """
         
         # make sure supplied param is a valid cube code text
-        assert self.isValid(codeText)
+        assert validated or self.isValid(codeText)
         
         self.text = codeText
     
@@ -33,43 +38,41 @@ class CubeCode:
     def isValid(cls, codeText: str):
         """ determines whether a string is a valid cube code """
         
+        return cls.validate(codeText) is CubeCodeValidity.VALID
+    
+    @classmethod
+    def validate(cls, codeText: str) -> CubeCodeValidity:
+        """ determines whether a string is a valid cube code, and if not, why not """
+        
         # check if supplied code text is a string
         if not isinstance(codeText, str):
-            return False
+            return CubeCodeValidity.NOT_A_STRING
         
         # check if code text is 54 chars long
         if len(codeText) != cls.CODE_LENGTH:
-            return False
+            return CubeCodeValidity.WRONG_LENGTH
         
-        # check if it's made up of valid cube color codes
-        for letter in codeText:
-            if not CubeColor.hasValue(letter):
-                return False
+        # check if it's made up of valid cube color codes, i.e. nothing is left once they're deleted
+        if codeText.translate(_DELETE_COLOR_LETTERS):
+            return CubeCodeValidity.INVALID_COLOR
         
         # tally up color distributions
-        colorDistributions = {c: 0 for c in list(CubeColor)}
-        
-        for letter in codeText:
-            color = CubeColor(letter)
-            colorDistributions[color] += 1
+        colorCounts = [codeText.count(letter) for letter in cls.COLOR_LETTERS]
         
         # check whether any colors are missing
-        if any(count == 0 for count in colorDistributions.values()):
-            return False
+        if 0 in colorCounts:
+            return CubeCodeValidity.MISSING_COLOR
         
         # check if colors are unevenly distributed
-        if not len(set(colorDistributions.values())) == 1:
-            return False
+        if colorCounts.count(cls.COLOR_COUNT) != len(colorCounts):
+            return CubeCodeValidity.UNEVEN_COLORS
         
         # check if the center cubelet faces have unique colors
-        centerColors = set(map(
-            lambda index: CubeColor(codeText[index]),
-            cls.FACE_CENTER_INDICES
-        ))
-        
-        if not len(centerColors) == len(list(CubeColor)):
-            return False
+        if len({codeText[index] for index in cls.FACE_CENTER_INDICES}) != len(colorCounts):
+            return CubeCodeValidity.DUPLICATE_CENTER_COLORS
         
         # congrats, its a valid cube code
-        return True
-    
\ No newline at end of file
+        return CubeCodeValidity.VALID
+
+# translation table deleting every color letter
+_DELETE_COLOR_LETTERS = str.maketrans('', '', CubeCode.COLOR_LETTERS)
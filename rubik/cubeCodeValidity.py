@@ -0,0 +1,13 @@
+from enum import Enum, unique
+
+@unique
+class CubeCodeValidity(Enum):
+    """ represents the outcome of validating a cube code, i.e. why it is invalid if it is """
+    
+    VALID = 'valid'
+    NOT_A_STRING = 'not a string'
+    WRONG_LENGTH = 'wrong length'
+    INVALID_COLOR = 'invalid color'
+    MISSING_COLOR = 'missing color'
+    UNEVEN_COLORS = 'uneven colors'
+    DUPLICATE_CENTER_COLORS = 'duplicate center colors'
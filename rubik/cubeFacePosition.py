@@ -1,5 +1,6 @@
 
 from enum import Enum, unique
+from functools import cached_property
 
 from rubik.cubeRotationDirection import CubeRotationDirection
 
@@ -18,29 +19,40 @@ class CubeFacePosition(Enum):
     def hasValue(cls, value):
         return value in cls._value2member_map_
     
+    @cached_property
+    def ordinal(self) -> int:
+        """ the index of the face position in definition order, by which lookup tables are keyed """
+        
+        return list(CubeFacePosition).index(self)
+    
     @classmethod
     def rotate(cls, facePosition, direction: CubeRotationDirection):
         """ returns the new face position if the cube were rotated """
         
         assert (isinstance(direction, CubeRotationDirection))
         
-        if direction is CubeRotationDirection.FLIP_FORWARD:
-            return cls._flipForward(facePosition)
-        
-        elif direction is CubeRotationDirection.FLIP_BACKWARD:
-            return cls._flipBackward(facePosition)
+        return _ROTATIONS[direction.ordinal][facePosition.ordinal]
+    
+    @classmethod
+    def rotateMany(cls, facePositions, direction: CubeRotationDirection):
+        """ returns the new face position of each of some face positions if the cube were rotated, in order """
         
-        elif direction is CubeRotationDirection.FLIP_LEFTWARD:
-            return cls._flipLeftward(facePosition)
+        assert (isinstance(direction, CubeRotationDirection))
         
-        elif direction is CubeRotationDirection.FLIP_RIGHTWARD:
-            return cls._flipRightward(facePosition)
+        rotations = _ROTATIONS[direction.ordinal]
+        return tuple(rotations[facePosition.ordinal] for facePosition in facePositions)
+    
+    @classmethod
+    def rotateOrdinals(cls, ordinals: bytes, direction: CubeRotationDirection) -> bytes:
+        """ returns the new ordinal of each of some face position ordinals if the cube were rotated, in order """
         
-        elif direction is CubeRotationDirection.SPIN_LEFTWARD:
-            return cls._spinLeftward(facePosition)
+        assert (isinstance(direction, CubeRotationDirection))
+        assert (max(ordinals, default = 0) < len(cls))
         
-        elif direction is CubeRotationDirection.SPIN_RIGHTWARD:
-            return cls._spinRightward(facePosition)
+        return ordinals.translate(_ORDINAL_ROTATIONS[direction.ordinal])
+    
+    # transforms defining how each rotation moves the face positions,
+    # tabulated once on import for rotate and isAdjacent to look up
     
     @classmethod
     def _flipForward(cls, facePosition):
@@ -157,9 +169,44 @@ class CubeFacePosition(Enum):
         # in other words, one of these positions would result in the other if rotated in the
         # direction specified
         
-        isAdjacent = (
-            cls.rotate(facePositionA, direction) == facePositionB
-            or cls.rotate(facePositionB, direction) == facePositionA
-        )
+        assert (isinstance(direction, CubeRotationDirection))
         
-        return isAdjacent
+        return _ADJACENCIES[direction.ordinal][facePositionA.ordinal][facePositionB.ordinal]
+
+def _rotations(direction: CubeRotationDirection):
+    """ the new face position of each face position, by ordinal, if the cube were rotated """
+    
+    transforms = {
+        CubeRotationDirection.FLIP_FORWARD: CubeFacePosition._flipForward,
+        CubeRotationDirection.FLIP_BACKWARD: CubeFacePosition._flipBackward,
+        CubeRotationDirection.FLIP_LEFTWARD: CubeFacePosition._flipLeftward,
+        CubeRotationDirection.FLIP_RIGHTWARD: CubeFacePosition._flipRightward,
+        CubeRotationDirection.SPIN_LEFTWARD: CubeFacePosition._spinLeftward,
+        CubeRotationDirection.SPIN_RIGHTWARD: CubeFacePosition._spinRightward
+    }
+    
+    return tuple(transforms[direction](facePosition) for facePosition in CubeFacePosition)
+
+# the new face position of each face position if the cube were rotated, by direction ordinal then face position ordinal
+_ROTATIONS = tuple(_rotations(direction) for direction in CubeRotationDirection)
+
+# the ordinal that bytes which are not face position ordinals translate to, so they stay invalid
+_INVALID_ORDINAL = 0xFF
+
+# the same rotations as byte translation tables over face position ordinals
+_ORDINAL_ROTATIONS = tuple(
+    bytes(rotations[ordinal].ordinal if ordinal < len(rotations) else _INVALID_ORDINAL for ordinal in range(256))
+    for rotations in _ROTATIONS
+)
+
+# whether one face position rotates onto the other, by direction ordinal then the two face position ordinals
+_ADJACENCIES = tuple(
+    tuple(
+        tuple(
+            rotations[facePositionA.ordinal] is facePositionB or rotations[facePositionB.ordinal] is facePositionA
+            for facePositionB in CubeFacePosition
+        )
+        for facePositionA in CubeFacePosition
+    )
+    for rotations in _ROTATIONS
+)
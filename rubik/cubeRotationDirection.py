@@ -1,5 +1,6 @@
 
 from enum import Enum, unique
+from functools import cached_property
 
 @unique
 class CubeRotationDirection(Enum):
@@ -11,3 +12,9 @@ class CubeRotationDirection(Enum):
     FLIP_RIGHTWARD = 'FR'
     SPIN_LEFTWARD = 'SL'
     SPIN_RIGHTWARD = 'SR'
+    
+    @cached_property
+    def ordinal(self) -> int:
+        """ the index of the direction in definition order, by which lookup tables are keyed """
+        
+        return list(CubeRotationDirection).index(self)
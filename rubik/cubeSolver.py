@@ -1,37 +1,96 @@
 
-import copy
+import time
 
+import rubik.runtimeChecks as runtimeChecks
 from rubik.cube import Cube
+from rubik.faceletCube import FaceletCube
 from rubik.cubeCode import CubeCode
 from rubik.cubeFacePosition import CubeFacePosition
 from rubik.faceRotationDirection import FaceRotationDirection
 from rubik.solveStage import SolveStage
 from rubik.faceCubeletPosition import FaceCubeletPosition
 from rubik.cubeRotationDirection import CubeRotationDirection
+from rubik.solveBudgetExceeded import SolveBudgetExceeded
+from rubik.solveStats import SolveStats, CountingCube, instrumented
 
 class CubeSolver():
     """ An entity capable of determining a solution for solving a 3x3x3 Rubik's Cube """
     
-    def __init__(self, cube: str | CubeCode | Cube, state = SolveStage.ENTIRE_CUBE):
-        """ instantiates a CubeSolver, supplied only a Cube and SolveStage """
+    """ names of the stages whose loops are budgeted, reported when a budget runs out """
+    STAGE_UP_DAISY = 'up daisy'
+    STAGE_DOWN_CROSS = 'down cross'
+    STAGE_DOWN_LAYER = 'down layer'
+    STAGE_MIDDLE_LAYER = 'middle layer'
+    STAGE_UP_CROSS = 'up cross'
+    STAGE_UP_FACE = 'up face'
+    STAGE_UP_CORNERS = 'up corners'
+    STAGE_UP_EDGES = 'up edges'
+    
+    """ names of the budgets a solve can run out of """
+    BUDGET_MOVES = 'moves'
+    BUDGET_ITERATIONS = 'iterations'
+    BUDGET_TIME = 'time'
+    
+    """
+    default budgets, far above what any solvable cube needs: the most moves in a solution
+    before it is optimized, and the most iterations of any one stage's loop
+    """
+    DEFAULT_MAX_MOVES = 2000
+    DEFAULT_MAX_ITERATIONS = 100
+    
+    def __init__(
+        self,
+        cube: str | CubeCode | Cube | FaceletCube,
+        state = SolveStage.ENTIRE_CUBE,
+        maxMoves: int = DEFAULT_MAX_MOVES,
+        maxIterations: int = DEFAULT_MAX_ITERATIONS,
+        timeLimit: float = None,
+        instrument: bool = False,
+        ownsCube: bool = False
+    ):
+        """
+        instantiates a CubeSolver, supplied only a Cube and SolveStage,
+        raising SolveBudgetExceeded if solving takes more moves, stage iterations, or seconds than allowed,
+        and recording where the solve spent its time and moves in stats if instrumented
+        
+        a cube passed in is left as it is by solving a clone of it, unless the solver owns it,
+        i.e. the caller hands it over and will not use it again
+        """
         
         # if cube is a string, turn it into a CubeCode
         if isinstance(cube, str):
             cube = CubeCode(cube)
         
-        # if cube is a CubeCode, turn it into a Cube
+        # if cube is a CubeCode, turn it into a FaceletCube, which no one else has
         if isinstance(cube, CubeCode):
-            cube = Cube(cube)
+            cube = FaceletCube(cube)
+            ownsCube = True
         
         # ensure params are of valid types
-        assert isinstance(cube, Cube)
+        assert isinstance(cube, (Cube, FaceletCube))
         assert isinstance(state, SolveStage)
+        assert isinstance(maxMoves, int) and maxMoves > 0
+        assert isinstance(maxIterations, int) and maxIterations > 0
+        assert timeLimit is None or timeLimit > 0
+        assert isinstance(ownsCube, bool)
+        
+        self.maxMoves = maxMoves
+        self.maxIterations = maxIterations
+        self.timeLimit = timeLimit
         
         self._solution = []
-        self._cube = copy.deepcopy(cube)
+        self._cube = cube if ownsCube else cube.clone()
+        
+        # stats are only gathered when asked for, as counting predicates slows them down
+        self.stats = None
+        
+        if instrument:
+            self.stats = SolveStats()
+            self._cube = CountingCube(self._cube, self.stats)
         
         self._solve(state)
     
+    @instrumented
     def _solve(self, state: SolveStage = SolveStage.ENTIRE_CUBE):
         """ produces a list of rotation directions to reach a certain cube state """
         
@@ -40,6 +99,11 @@ class CubeSolver():
         # directions are not retained from previous solves
         self._clearSolution()
         
+        # budgets start over with each solve
+        self._stage = None
+        self._iterations = {}
+        self._deadline = None if self.timeLimit is None else time.monotonic() + self.timeLimit
+        
         # execute solve algorithm corresponding to the cube state provided
         solveFunctions = {
             SolveStage.DOWN_CROSS: self._solveDownCross,
@@ -61,6 +125,7 @@ class CubeSolver():
     _solveDownLayer will execute _solveDownCross first
     """
     
+    @instrumented
     def _solveUpDaisy(self):
         """ constructs an up daisy on the cube """
         
@@ -78,6 +143,8 @@ class CubeSolver():
         index = 0
         
         while not self._cube.hasUpDaisy():
+            self._tick(self.STAGE_UP_DAISY)
+            
             petalCoord = topEdgeCoords[index % 4]
             
             leftEdgeCoord = middleEdgeCoords[(index + 1) % 4]
@@ -140,6 +207,7 @@ class CubeSolver():
                     
             index += 1
     
+    @instrumented
     def _solveDownCross(self):
         """ constructs a down cross on the cube """
         
@@ -164,6 +232,7 @@ class CubeSolver():
         
         # we need to flip all four daisy petals
         while not self._cube.hasDownCross():
+            self._tick(self.STAGE_DOWN_CROSS)
             
             aboveColor = self._cube[(aboveX, aboveY, aboveZ)][facePosition]
             belowColor = self._cube[(belowX, belowY, belowZ)][facePosition]
@@ -189,6 +258,7 @@ class CubeSolver():
             i = (i + 1) % 4
             facePosition = facePositions[i]
     
+    @instrumented
     def _solveDownLayer(self):
         """ solves down layer of cube """
         
@@ -226,6 +296,7 @@ class CubeSolver():
         
         # keep executing this process until down layer solved
         while not self._cube.isDownLayerSolved():
+            self._tick(self.STAGE_DOWN_LAYER)
             
             # first look for the down color in the upper left tile of all the side faces
             
@@ -335,6 +406,7 @@ class CubeSolver():
             # to solve the down LAYER, we need to handle one of these misplaced corners
             self._fixMalformedDownCorner()
     
+    @instrumented
     def _solveDownAndMiddleLayers(self):
         """ solves the down and middle layers of the cube """
         
@@ -351,6 +423,7 @@ class CubeSolver():
         
         # execute algorithm until middle layer is solved
         while not self._cube.isMiddleLayerSolved():
+            self._tick(self.STAGE_MIDDLE_LAYER)
             
             # start with front face
             facePosition = CubeFacePosition.FRONT
@@ -416,6 +489,7 @@ class CubeSolver():
             # clean up down layer
             self._solveDownLayer()
             
+    @instrumented
     def _solveDownAndMiddleLayersAndUpCross(self):
         """ solves down layer, middle layer, and up cross on the cube """
         
@@ -431,6 +505,7 @@ class CubeSolver():
         
         # execute until up cross solved
         while not self._cube.hasUpCross():
+            self._tick(self.STAGE_UP_CROSS)
             
             # rotate until front petal color is up color
             for _ in range(4):
@@ -446,6 +521,7 @@ class CubeSolver():
             # now we're ready for a furf!
             self._executeFurf()
     
+    @instrumented
     def _solveDownAndMiddleLayersAndUpFace(self):
         """ solves down layer, middle layer, and up face on the cube """
         
@@ -468,6 +544,7 @@ class CubeSolver():
         
         # continue until up face is solved
         while not self._cube.isUpFaceSolved():
+            self._tick(self.STAGE_UP_FACE)
             
             # count how many corners match the up color
             cornerCount = sum(
@@ -494,6 +571,7 @@ class CubeSolver():
             assert self._cube.isDownLayerSolved()
             assert self._cube.isMiddleLayerSolved()
     
+    @instrumented
     def _solveEntireCube(self):
         """ solves entire cube """
         
@@ -516,6 +594,7 @@ class CubeSolver():
         }
         
         while not self._cube.isUpCornersSolved():
+            self._tick(self.STAGE_UP_CORNERS)
             
             # attempt to align all 4 corners (maybe the up face just has to be rotated N times)
             # also keep track of the aligned corner count (maximal)
@@ -592,6 +671,7 @@ class CubeSolver():
         # now need to solve the 4 up cubelet faces of each vertical face position
         
         while not self._cube.isUpEdgesSolved():
+            self._tick(self.STAGE_UP_EDGES)
             
             # if any of these 4 are already solved, the algorithm needs one of these
             # to serve as the relative back position for the rotation sequence
@@ -626,6 +706,15 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(facePosition, CubeFacePosition)
         
+        self._handleMatchedUpperLeftCandidateColorUnchecked(facePosition)
+    
+    @instrumented
+    def _handleMatchedUpperLeftCandidateColorUnchecked(self, facePosition: CubeFacePosition):
+        """
+        handles a color found on the upper left tile of vertical faces, 
+        as part of the process for solving the down face, for params known to be valid
+        """
+        
         downColor = self._cube.getFaceColor(CubeFacePosition.DOWN)
         
         # loop until the matched coord is in the proper place
@@ -662,6 +751,15 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(facePosition, CubeFacePosition)
         
+        self._handleMatchedUpperRightCandidateColorUnchecked(facePosition)
+    
+    @instrumented
+    def _handleMatchedUpperRightCandidateColorUnchecked(self, facePosition: CubeFacePosition):
+        """
+        handles a color found on the upper right tile of vertical faces, 
+        as part of the process for solving the down face, for params known to be valid
+        """
+        
         downColor = self._cube.getFaceColor(CubeFacePosition.DOWN)
         
         # loop until the matched coord is in the proper place
@@ -698,6 +796,15 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(facePosition, CubeFacePosition)
         
+        self._handleMatchedLowerLeftCandidateColorUnchecked(facePosition)
+    
+    @instrumented
+    def _handleMatchedLowerLeftCandidateColorUnchecked(self, facePosition: CubeFacePosition):
+        """
+        handles a color found on the lower left tile of vertical faces, 
+        as part of the process for solving the down face, for params known to be valid
+        """
+        
         downColor = self._cube.getFaceColor(CubeFacePosition.DOWN)
         
         # the coordinate where the down color was found
@@ -720,6 +827,15 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(facePosition, CubeFacePosition)
         
+        self._handleMatchedLowerRightCandidateColorUnchecked(facePosition)
+    
+    @instrumented
+    def _handleMatchedLowerRightCandidateColorUnchecked(self, facePosition: CubeFacePosition):
+        """
+        handles a color found on the lower right tile of vertical faces, 
+        as part of the process for solving the down face, for params known to be valid
+        """
+        
         downColor = self._cube.getFaceColor(CubeFacePosition.DOWN)
         
         # the coordinate where the down color was found
@@ -742,6 +858,15 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(facePosition, CubeFacePosition)
         
+        self._handleMatchedTopCornerCandidateColorUnchecked(facePosition)
+    
+    @instrumented
+    def _handleMatchedTopCornerCandidateColorUnchecked(self, facePosition: CubeFacePosition):
+        """
+        handles a color found on one the corners of the up face,
+        as part of the process for solving the down face, for params known to be valid
+        """
+        
         downColor = self._cube.getFaceColor(CubeFacePosition.DOWN)
         
         # loop until the matched coord is in the proper place
@@ -769,6 +894,7 @@ class CubeSolver():
         relLeftFacePosition = CubeFacePosition.rotate(facePosition, CubeRotationDirection.SPIN_LEFTWARD)
         self._trigger(relLeftFacePosition, FaceRotationDirection.COUNTERCLOCKWISE, 2)
     
+    @instrumented
     def _fixMalformedMiddleLayer(self):
         """ an auxiliary method for solveDownAndMiddleLayers that fixes the state of the middle layer """
         
@@ -795,6 +921,7 @@ class CubeSolver():
                 self._trigger(facePosition, FaceRotationDirection.CLOCKWISE)
                 return
     
+    @instrumented
     def _fixMalformedDownCorner(self):
         
         # these are all of the possible problem spots, each of the down corners
@@ -834,6 +961,12 @@ class CubeSolver():
         assert isinstance(degree, int)
         assert degree > 0
         
+        self._triggerUnchecked(facePosition, direction, degree)
+    
+    @instrumented
+    def _triggerUnchecked(self, facePosition: CubeFacePosition, direction: FaceRotationDirection, degree: int = 1):
+        """ adds a clockwise or counterclockwise trigger of some degree on a cube face to the solution, for params known to be valid """
+        
         self._addToSolution(facePosition, direction)
         
         for _ in range(degree):
@@ -847,6 +980,7 @@ class CubeSolver():
         
         self._addToSolution(facePosition, oppositeDirection)
     
+    @instrumented
     def _executeFurf(self):
         """ execute a Furf move, defined by the rotation sequence FURurf """
         
@@ -870,6 +1004,12 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(relLeftPosition, CubeFacePosition)
         
+        self._executeRurrUnchecked(relLeftPosition)
+    
+    @instrumented
+    def _executeRurrUnchecked(self, relLeftPosition: CubeFacePosition = CubeFacePosition.LEFT):
+        """ execute a Rurr move, defined by the rotation codes RUrURUUr, for params known to be valid """
+        
         # figure out relative right position from relative left position
         relRightPosition = CubeFacePosition.rotate(relLeftPosition, CubeRotationDirection.SPIN_LEFTWARD)
         relRightPosition = CubeFacePosition.rotate(relRightPosition, CubeRotationDirection.SPIN_LEFTWARD)
@@ -896,6 +1036,12 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(relLeftPosition, CubeFacePosition)
         
+        self._executeLurrUnchecked(relLeftPosition)
+    
+    @instrumented
+    def _executeLurrUnchecked(self, relLeftPosition: CubeFacePosition = CubeFacePosition.LEFT):
+        """ execute a Lurr move, defined by the rotation codes lURuLUr, for params known to be valid """
+        
         # figure out relative right position from relative left position
         relRightPosition = CubeFacePosition.rotate(relLeftPosition, CubeRotationDirection.SPIN_LEFTWARD)
         relRightPosition = CubeFacePosition.rotate(relRightPosition, CubeRotationDirection.SPIN_LEFTWARD)
@@ -921,6 +1067,12 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(relBackPosition, CubeFacePosition)
         
+        self._executeFfufUnchecked(relBackPosition)
+    
+    @instrumented
+    def _executeFfufUnchecked(self, relBackPosition: CubeFacePosition = CubeFacePosition.BACK):
+        """ execute a Ffuf move, defined by the rotation codes FFUrLFF, for params known to be valid """
+        
         relLeftPosition = CubeFacePosition.rotate(relBackPosition, CubeRotationDirection.SPIN_RIGHTWARD)
         relFrontPosition = CubeFacePosition.rotate(relLeftPosition, CubeRotationDirection.SPIN_RIGHTWARD)
         relRightPosition = CubeFacePosition.rotate(relFrontPosition, CubeRotationDirection.SPIN_RIGHTWARD)
@@ -946,6 +1098,12 @@ class CubeSolver():
         # ensure params are valid types
         assert isinstance(relBackPosition, CubeFacePosition)
         
+        self._executeLrufUnchecked(relBackPosition)
+    
+    @instrumented
+    def _executeLrufUnchecked(self, relBackPosition: CubeFacePosition = CubeFacePosition.BACK):
+        """ execute a Lruf move, defined by the rotation codes lRUFF, for params known to be valid """
+        
         relLeftPosition = CubeFacePosition.rotate(relBackPosition, CubeRotationDirection.SPIN_RIGHTWARD)
         relFrontPosition = CubeFacePosition.rotate(relLeftPosition, CubeRotationDirection.SPIN_RIGHTWARD)
         relRightPosition = CubeFacePosition.rotate(relFrontPosition, CubeRotationDirection.SPIN_RIGHTWARD)
@@ -979,8 +1137,32 @@ class CubeSolver():
         assert (isinstance(facePosition, CubeFacePosition))
         assert (isinstance(direction, FaceRotationDirection))
         
+        self._addToSolutionUnchecked(facePosition, direction)
+    
+    def _addToSolutionUnchecked(self, facePosition: CubeFacePosition, direction: FaceRotationDirection):
+        """ executes cube rotation and adds it to the solve directions, for params known to be valid """
+        
+        # a stage that keeps rotating without progress is out of moves
+        if len(self._solution) >= self.maxMoves:
+            raise SolveBudgetExceeded(self._stage, self.BUDGET_MOVES, self.maxMoves)
+        
         self._cube.rotateFace(facePosition, direction)
         self._solution.append((facePosition, direction))
+        
+        if self.stats is not None:
+            self.stats.moves += 1
+    
+    def _tick(self, stage: str):
+        """ counts an iteration of a stage's loop, raising SolveBudgetExceeded once the stage or solve is over budget """
+        
+        self._stage = stage
+        self._iterations[stage] = self._iterations.get(stage, 0) + 1
+        
+        if self._iterations[stage] > self.maxIterations:
+            raise SolveBudgetExceeded(stage, self.BUDGET_ITERATIONS, self.maxIterations)
+        
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise SolveBudgetExceeded(stage, self.BUDGET_TIME, self.timeLimit)
     
     def _optimizeSolution(self):
         """ optimizes solution, removing redundancy """
@@ -1030,3 +1212,18 @@ class CubeSolver():
         """ resets solution """
         
         self._solution.clear()
+
+# once inputs are validated at the boundary, each move and helper can skip its checks
+runtimeChecks.register(CubeSolver, {
+    '_addToSolution': CubeSolver._addToSolutionUnchecked,
+    '_trigger': CubeSolver._triggerUnchecked,
+    '_executeRurr': CubeSolver._executeRurrUnchecked,
+    '_executeLurr': CubeSolver._executeLurrUnchecked,
+    '_executeFfuf': CubeSolver._executeFfufUnchecked,
+    '_executeLruf': CubeSolver._executeLrufUnchecked,
+    '_handleMatchedUpperLeftCandidateColor': CubeSolver._handleMatchedUpperLeftCandidateColorUnchecked,
+    '_handleMatchedUpperRightCandidateColor': CubeSolver._handleMatchedUpperRightCandidateColorUnchecked,
+    '_handleMatchedLowerLeftCandidateColor': CubeSolver._handleMatchedLowerLeftCandidateColorUnchecked,
+    '_handleMatchedLowerRightCandidateColor': CubeSolver._handleMatchedLowerRightCandidateColorUnchecked,
+    '_handleMatchedTopCornerCandidateColor': CubeSolver._handleMatchedTopCornerCandidateColorUnchecked,
+})
@@ -0,0 +1,140 @@
+from operator import itemgetter
+
+from rubik.cube import Cube
+from rubik.cubeCode import CubeCode
+from rubik.cubeColor import CubeColor
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.cubeRotationDirection import CubeRotationDirection
+import rubik.moveTable as moveTable
+
+# maps cube codes onto canonical representatives of the cube states that CubeSolver
+# treats identically, so their solutions can be shared
+
+# color letters assigned to the face centers of a canonical cube code, in cube code order
+CANONICAL_CENTER_COLORS = ''.join(color.value for color in CubeColor)
+
+def canonicalizeColors(cubeCode: str) -> str:
+    """
+    relabels the colors of a valid cube code so its face centers have the canonical colors,
+    cube codes differing only by a relabeling of colors share a canonical cube code
+    """
+    
+    centerColors = ''.join(cubeCode[index] for index in CubeCode.FACE_CENTER_INDICES)
+    
+    return cubeCode.translate(str.maketrans(centerColors, CANONICAL_CENTER_COLORS))
+
+def canonicalize(cubeCode: str) -> tuple[str, int]:
+    """
+    maps a valid cube code to the representative of its state under all 24 whole-cube
+    orientations and color relabelings, along with the index of the orientation used
+    """
+    
+    return min(
+        (canonicalizeColors(''.join(gather(cubeCode))), orientation)
+        for (orientation, gather) in enumerate(_ORIENTATION_GATHERS)
+    )
+
+def toCanonicalRotations(rotationCodes: str, orientation: int) -> str:
+    """ translates rotation codes for a cube into the frame of its canonical representative """
+    
+    return rotationCodes.translate(_TO_CANONICAL_ROTATIONS[orientation])
+
+def fromCanonicalRotations(rotationCodes: str, orientation: int) -> str:
+    """ translates rotation codes for a canonical representative back into the frame of a cube """
+    
+    return rotationCodes.translate(_FROM_CANONICAL_ROTATIONS[orientation])
+
+def _deriveCoordTransform(direction: CubeRotationDirection):
+    """
+    derives how a whole-cube rotation moves every cubelet coordinate, by lifting each
+    coordinate onto a face that turns its cubelets the same way and replaying Cube.rotateCoord
+    """
+    
+    probe = Cube(''.join(color.value * Cube.FACE_AREA for color in CubeColor))
+    
+    (facePosition, faceDirection) = next(
+        move for (move, cubeletDirection) in Cube.CUBELET_ROTATION_DIRECTIONS.items()
+        if cubeletDirection is direction
+    )
+    
+    # the axis that the face's cubelet coordinates all share a value on
+    faceCoords = Cube.CUBELET_COORDS[facePosition]
+    axis = next(axis for axis in range(Cube.DIM) if len({coord[axis] for coord in faceCoords}) == 1)
+    
+    def transform(coord):
+        """ the new coordinate of a cubelet after the whole-cube rotation """
+        
+        lifted = list(coord)
+        lifted[axis] = faceCoords[0][axis]
+        
+        moved = list(probe.rotateCoord(tuple(lifted), facePosition, faceDirection))
+        moved[axis] = coord[axis]
+        
+        return tuple(moved)
+    
+    return transform
+
+def _deriveRotation(direction: CubeRotationDirection):
+    """ derives the facelet permutation and face mapping of a whole-cube rotation """
+    
+    coordTransform = _deriveCoordTransform(direction)
+    
+    permutation = list(range(CubeCode.CODE_LENGTH))
+    
+    for ((coord, facePosition), index) in moveTable.FACELET_INDICES.items():
+        newFacePosition = CubeFacePosition.rotate(facePosition, direction)
+        permutation[moveTable.FACELET_INDICES[coordTransform(coord), newFacePosition]] = index
+    
+    faceMap = {facePosition: CubeFacePosition.rotate(facePosition, direction) for facePosition in CubeFacePosition}
+    
+    return (tuple(permutation), faceMap)
+
+def _deriveOrientations():
+    """
+    derives all 24 whole-cube orientations by composing whole-cube rotations,
+    each as a facelet permutation and the face each face position ends up on
+    """
+    
+    rotations = [_deriveRotation(direction) for direction in CubeRotationDirection]
+    
+    identity = (tuple(range(CubeCode.CODE_LENGTH)), {facePosition: facePosition for facePosition in CubeFacePosition})
+    
+    orientations = [identity]
+    seen = {identity[0]}
+    
+    # breadth first search over compositions of rotations
+    for (permutation, faceMap) in orientations:
+        for (rotationPermutation, rotationFaceMap) in rotations:
+            composedPermutation = tuple(permutation[source] for source in rotationPermutation)
+            
+            if composedPermutation in seen:
+                continue
+            
+            composedFaceMap = {
+                facePosition: rotationFaceMap[newFacePosition]
+                for (facePosition, newFacePosition) in faceMap.items()
+            }
+            
+            seen.add(composedPermutation)
+            orientations.append((composedPermutation, composedFaceMap))
+    
+    return orientations
+
+def _rotationTranslation(faceMap):
+    """ translation table mapping each rotation code onto the face it moves to """
+    
+    fromCodes = ''.join(facePosition.value for facePosition in faceMap)
+    toCodes = ''.join(faceMap[facePosition].value for facePosition in faceMap)
+    
+    return str.maketrans(fromCodes + fromCodes.lower(), toCodes + toCodes.lower())
+
+_ORIENTATIONS = _deriveOrientations()
+
+_ORIENTATION_GATHERS = [itemgetter(*permutation) for (permutation, _) in _ORIENTATIONS]
+
+_TO_CANONICAL_ROTATIONS = [_rotationTranslation(faceMap) for (_, faceMap) in _ORIENTATIONS]
+
+_FROM_CANONICAL_ROTATIONS = [
+    _rotationTranslation({newFacePosition: facePosition for (facePosition, newFacePosition) in faceMap.items()})
+    for (_, faceMap) in _ORIENTATIONS
+]
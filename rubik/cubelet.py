@@ -1,10 +1,18 @@
+import operator
 
+import rubik.runtimeChecks as runtimeChecks
 from rubik.cubeFacePosition import CubeFacePosition
 from rubik.cubeColor import CubeColor
 from rubik.cubeRotationDirection import CubeRotationDirection
 
+# face positions in the order of their ordinals, by which a cubelet's faces are indexed
+FACE_POSITIONS = tuple(CubeFacePosition)
+
 class Cubelet:
     """ Represents one of the smaller cubes that make up a Rubik's Cube """
+    
+    # the color of each face, indexed by face ordinal, is the only state a cubelet holds
+    __slots__ = ('_faces',)
 
     def __init__(self, coloredFaces = {}):
         """ instantiate Cubelet from info about its face colors """
@@ -19,9 +27,10 @@ class Cubelet:
         assert (len(coloredFaces) <= 3)
         
         # initialize all cubeData to no color
-        self._faces = {cf: None for cf in CubeFacePosition}
+        self._faces = [None] * len(FACE_POSITIONS)
         
-        self._faces.update(coloredFaces)
+        for (facePosition, color) in coloredFaces.items():
+            self._faces[facePosition.ordinal] = color
     
     def __getitem__(self, facePosition: CubeFacePosition) -> CubeColor | None:
         """ accessor for the faces that make up cubelet """
@@ -29,7 +38,16 @@ class Cubelet:
         # ensure param is valid type
         assert isinstance(facePosition, CubeFacePosition)
         
-        return self._faces[facePosition]
+        return self._faces[facePosition.ordinal]
+    
+    def _getitemUnchecked(self, facePosition: CubeFacePosition) -> CubeColor | None:
+        """ accessor for the faces that make up cubelet, for face positions known to be valid """
+        
+        # anything else still fails as a missing key, as it did before faces were indexed by ordinal
+        try:
+            return self._faces[facePosition.ordinal]
+        except AttributeError:
+            raise KeyError(facePosition) from None
     
     def __setitem__(self, facePosition: CubeFacePosition, color: CubeColor):
         """ colors one of the cubelet's faces """
@@ -38,15 +56,25 @@ class Cubelet:
         assert (isinstance(facePosition, CubeFacePosition))
         assert (isinstance(color, CubeColor))
         
-        self._faces[facePosition] = color
+        self._faces[facePosition.ordinal] = color
+    
+    def _setitemUnchecked(self, facePosition: CubeFacePosition, color: CubeColor):
+        """ colors one of the cubelet's faces, for face positions and colors known to be valid """
+        
+        self._faces[facePosition.ordinal] = color
     
     def getFaceColors(self):
         """ returns the face colors of the cubelet """
         
-        return {
-            facePosition: self[facePosition]
-            for facePosition in CubeFacePosition
-        }
+        return dict(zip(FACE_POSITIONS, self._faces))
+    
+    def clone(self):
+        """ returns an independent copy of the cubelet """
+        
+        clone = Cubelet.__new__(Cubelet)
+        clone._faces = self._faces[:]
+        
+        return clone
     
     def rotate(self, direction: CubeRotationDirection):
         """ rotates the cubelet in some direction """
@@ -54,13 +82,31 @@ class Cubelet:
         # make sure direction is a CubeRotationDirection
         assert (isinstance(direction, CubeRotationDirection))
         
-        # go thru each face position, and calculate its new color based on the rotation
-        alteredFaces = {}
-        for facePosition in list(CubeFacePosition):
-            newFacePosition = CubeFacePosition.rotate(facePosition, direction)
-            
-            alteredFaces[newFacePosition] = self[facePosition]
+        self._rotateUnchecked(direction)
+    
+    def _rotateUnchecked(self, direction: CubeRotationDirection):
+        """ rotates the cubelet in some direction, known to be valid """
         
-        # apply the transform
-        self._faces.update(alteredFaces)
-    
\ No newline at end of file
+        # permute the colors in place, each face taking the color of the face that rotates onto it
+        self._faces[:] = _PERMUTATIONS[direction](self._faces)
+
+def _permutation(direction: CubeRotationDirection):
+    """ a function returning the face colors of a cubelet, by face ordinal, as they would be after a rotation """
+    
+    sources = [None] * len(FACE_POSITIONS)
+    
+    # each face's color moves to the face it rotates onto
+    for (ordinal, newOrdinal) in enumerate(CubeFacePosition.rotateOrdinals(bytes(range(len(FACE_POSITIONS))), direction)):
+        sources[newOrdinal] = ordinal
+    
+    return operator.itemgetter(*sources)
+
+# once inputs are validated at the boundary, face access and rotation can skip their checks
+runtimeChecks.register(Cubelet, {
+    '__getitem__': Cubelet._getitemUnchecked,
+    '__setitem__': Cubelet._setitemUnchecked,
+    'rotate': Cubelet._rotateUnchecked,
+})
+
+# the permutation of face colors made by each rotation
+_PERMUTATIONS = {direction: _permutation(direction) for direction in CubeRotationDirection}
@@ -1,8 +1,11 @@
 
+import time
+
 import rubik.create as create
 import rubik.rotate as rotate
 import rubik.solve as solve
 import rubik.verify as verify
+import rubik.metrics as metrics
 
 ERROR01 = 'error: no op is specified'
 ERROR02 = 'error: parameter is not a dictionary'
@@ -16,7 +19,39 @@ OPS = {
     'verify': verify._verify,
     }
 
+INVALID_OP = 'invalid'
+
+_OP_REQUESTS = metrics.counter('rubik_op_requests_total', 'ops dispatched, by op and status', ('op', 'status'))
+_OP_SECONDS = metrics.histogram('rubik_op_seconds', 'time taken to dispatch an op', labelNames = ('op',))
+_OPS_IN_FLIGHT = metrics.gauge('rubik_ops_in_flight', 'ops currently being dispatched', ('op',))
+
 def _dispatch(parms = None):
+    """Dispatch based on value of 'op' key, recording metrics for the op"""
+
+    op = _opLabel(parms)
+    status = 'error'
+    startTime = time.perf_counter()
+    _OPS_IN_FLIGHT.inc(labels = (op,))
+
+    try:
+        result = _dispatchOp(parms)
+        if result.get(STATUS) == 'ok':
+            status = 'ok'
+        return result
+    finally:
+        _OPS_IN_FLIGHT.dec(labels = (op,))
+        _OP_SECONDS.observe(time.perf_counter() - startTime, (op,))
+        _OP_REQUESTS.inc(labels = (op, status))
+
+def _opLabel(parms):
+    """Name the op for metrics, lumping every illegal op together"""
+
+    op = parms.get(OP) if isinstance(parms, dict) else None
+    if isinstance(op, str) and op in OPS:
+        return op
+    return INVALID_OP
+
+def _dispatchOp(parms = None):
     """Dispatch based on value of 'op' key"""
 
     result = {}
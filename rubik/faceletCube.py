@@ -0,0 +1,271 @@
+from rubik.cube import Cube
+from rubik.cubeColor import CubeColor
+from rubik.cubeCode import CubeCode
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.faceRotationDirection import FaceRotationDirection
+import rubik.moveTable as moveTable
+import rubik.runtimeChecks as runtimeChecks
+
+class FaceletCube:
+    """
+    Represents a 3x3x3 Rubik's cube as a flat buffer of its 54 facelet colors,
+    ordered by position in cube code
+    """
+    
+    """ cubelet coordinates and orientations are shared with the cubelet-based Cube """
+    CUBELET_COORDS = Cube.CUBELET_COORDS
+    FACE_CENTER_CUBELET_COORDS = Cube.FACE_CENTER_CUBELET_COORDS
+    FACE_ORIENTATION_COORDS = Cube.FACE_ORIENTATION_COORDS
+    
+    WIDTH = Cube.WIDTH
+    DIM = Cube.DIM
+    FACE_AREA = Cube.FACE_AREA
+    VOLUME = Cube.VOLUME
+    
+    """ facelet index of each (cubelet coordinate, face position) pair on the outside of the cube """
+    FACELET_INDICES = moveTable.FACELET_INDICES
+    
+    """ facelet index of the center tile in each cube face """
+    FACE_CENTER_INDICES = dict(zip(CubeCode.FACE_POSITION_ORDER, CubeCode.FACE_CENTER_INDICES))
+    
+    def __init__(self, cubeCode: str | CubeCode):
+        """ initializes the cube from a cube code representing the initial state """
+        
+        assert isinstance(cubeCode, (str, CubeCode))
+        
+        # if supplied a string, turn it into a CubeCode
+        if isinstance(cubeCode, str):
+            cubeCode = CubeCode(cubeCode)
+        
+        # one byte per facelet, holding the letter of its color
+        self._state = bytearray(cubeCode.text, 'ascii')
+        
+        # face rotations never move the centers, so what each facelet is compared
+        # against by the stage predicates is fixed for the life of the cube
+        centers = bytes(self._state[index] for index in _CENTER_OF)
+        self._centerReference = int.from_bytes(centers, 'big')
+        self._downReference = int.from_bytes(centers[_DOWN_CENTER:_DOWN_CENTER + 1] * CubeCode.CODE_LENGTH, 'big')
+        
+        # computed when a predicate first needs it after each rotation
+        self._mismatches = None
+    
+    def __getitem__(self, coord: tuple[int]):
+        """ accessor for a view of the cubelets that make up the cube """
+        
+        # ensure coord is integer tuple (x, y, z), where x, y, z ∈ [0, 2]
+        assert isinstance(coord, tuple)
+        assert len(coord) == 3
+        
+        for num in coord:
+            assert isinstance(num, int)
+            assert 0 <= num and num <= 2
+        
+        return FaceletCubelet(self, coord)
+    
+    def _getitemUnchecked(self, coord: tuple[int]):
+        """ accessor for a view of the cubelets that make up the cube, for coordinates known to be valid """
+        
+        return FaceletCubelet(self, coord)
+    
+    def rotateFace(self, facePosition: CubeFacePosition, direction: FaceRotationDirection):
+        """ rotates one of the cube's faces either clockwise or counterclockwise """
+        
+        # ensure params are the right types
+        assert (isinstance(facePosition, CubeFacePosition))
+        assert (isinstance(direction, FaceRotationDirection))
+        
+        self._rotateFaceUnchecked(facePosition, direction)
+    
+    def _rotateFaceUnchecked(self, facePosition: CubeFacePosition, direction: FaceRotationDirection):
+        """ rotates one of the cube's faces, for params known to be valid """
+        
+        # a quarter turn is a single gather over the facelet buffer
+        self._state = bytearray(moveTable.GATHERS[facePosition, direction](self._state))
+        self._mismatches = None
+    
+    """ coordinate transforms are identical to those of the cubelet-based Cube """
+    rotateCoord = Cube.rotateCoord
+    _rotateCoordUnchecked = Cube._rotateCoordUnchecked
+    
+    def getFaceColor(self, facePosition: CubeFacePosition) -> CubeColor:
+        """ get the color of a cube face, i.e. the color of the center tile on that face """
+        
+        # ensure params are right types
+        assert isinstance(facePosition, CubeFacePosition)
+        
+        return _COLORS[self._state[self.FACE_CENTER_INDICES[facePosition]]]
+    
+    def toCode(self):
+        """ serializes the cube into a cube code """
+        
+        return self._state.decode('ascii')
+    
+    def clone(self):
+        """ returns an independent copy of the cube, copying only its facelet buffer """
+        
+        clone = FaceletCube.__new__(FaceletCube)
+        clone._state = bytearray(self._state)
+        clone._centerReference = self._centerReference
+        clone._downReference = self._downReference
+        clone._mismatches = self._mismatches
+        
+        return clone
+    
+    '''
+    methods for determining whether the cube satisfies certain conditions
+    that are useful to check for in cube solver algorithms
+    '''
+    
+    def hasUpDaisy(self):
+        """ determines whether the cube has a daisy centered on the up face """
+        
+        downMismatches = int.from_bytes(self._state, 'big') ^ self._downReference
+        return not downMismatches & _UP_PETALS_MASK
+    
+    def hasDownCross(self):
+        """ determines whether the cube has a cross centered on the down face """
+        
+        return not self._getMismatches() & _DOWN_CROSS_MASK
+    
+    def isDownLayerSolved(self):
+        """ determines whether the cube's down layer is solved """
+        
+        return not self._getMismatches() & _DOWN_LAYER_MASK
+    
+    def isMiddleLayerSolved(self):
+        """ determines whether the cube's middle layer is solved """
+        
+        return not self._getMismatches() & _MIDDLE_LAYER_MASK
+    
+    def hasUpCross(self):
+        """ determines whether an up cross is present on the cube """
+        
+        return not self._getMismatches() & _UP_PETALS_MASK
+    
+    def isUpFaceSolved(self):
+        """ determines whether the cube's up face is solved """
+        
+        return not self._getMismatches() & _UP_FACE_MASK
+    
+    def isUpEdgesSolved(self):
+        """ determines whether the faces on the vertical edges of the up layer are solved """
+        
+        return not self._getMismatches() & _UP_EDGES_MASK
+    
+    def isUpCornersSolved(self):
+        """ determines whether the cube's up layer corners are solved """
+        
+        return not self._getMismatches() & _UP_CORNERS_MASK
+    
+    def isUpLayerSolved(self):
+        """ determines whether the cube's up layer is solved """
+        
+        return not self._getMismatches() & _UP_LAYER_MASK
+    
+    def _getMismatches(self) -> int:
+        """
+        the facelet buffer xor the color of the center of each facelet's face, as one integer
+        whose bytes are zero exactly where facelets match their faces, so a predicate is one mask
+        """
+        
+        mismatches = self._mismatches
+        
+        if mismatches is None:
+            mismatches = self._mismatches = int.from_bytes(self._state, 'big') ^ self._centerReference
+        
+        return mismatches
+
+class FaceletCubelet:
+    """ a lightweight view of one cubelet of a FaceletCube, indexed like a Cubelet """
+    
+    __slots__ = ('_cube', '_coord')
+    
+    def __init__(self, cube: FaceletCube, coord: tuple[int]):
+        """ instantiates a view of the cubelet at some coordinate of a cube """
+        
+        self._cube = cube
+        self._coord = coord
+    
+    def __getitem__(self, facePosition: CubeFacePosition) -> CubeColor | None:
+        """ accessor for the faces that make up cubelet """
+        
+        # ensure param is valid type
+        assert isinstance(facePosition, CubeFacePosition)
+        
+        return self._getitemUnchecked(facePosition)
+    
+    def _getitemUnchecked(self, facePosition: CubeFacePosition) -> CubeColor | None:
+        """ accessor for the faces that make up cubelet, for face positions known to be valid """
+        
+        index = FaceletCube.FACELET_INDICES.get((self._coord, facePosition))
+        
+        # faces on the inside of the cube are not colored
+        if index is None:
+            return None
+        
+        return _COLORS[self._cube._state[index]]
+    
+    def getFaceColors(self):
+        """ returns the face colors of the cubelet """
+        
+        return {
+            facePosition: self[facePosition]
+            for facePosition in CubeFacePosition
+        }
+
+def _byteMask(indices) -> int:
+    """ a mask of the bytes at some facelet indices of the facelet buffer read as a big-endian integer """
+    
+    return sum(0xFF << (8 * (CubeCode.CODE_LENGTH - 1 - index)) for index in indices)
+
+def _facelets(facePosition: CubeFacePosition, tileNumbers):
+    """ facelet indices of some tiles on a cube face, tiles numbered in cube code order """
+    
+    offset = CubeCode.FACE_POSITION_ORDER.index(facePosition) * Cube.FACE_AREA
+    return tuple(offset + tileNumber for tileNumber in tileNumbers)
+
+# color of each letter byte that may appear in the facelet buffer
+_COLORS = {ord(color.value): color for color in CubeColor}
+
+# facelet index of the center tile of the face each facelet is on
+_CENTER_OF = tuple(
+    (index // Cube.FACE_AREA) * Cube.FACE_AREA + (Cube.FACE_AREA // 2)
+    for index in range(CubeCode.CODE_LENGTH)
+)
+
+_VERTICAL_FACE_POSITIONS = [CubeFacePosition.FRONT, CubeFacePosition.LEFT, CubeFacePosition.BACK, CubeFacePosition.RIGHT]
+
+# facelet groups inspected by the stage predicates
+_UP_FACE = _facelets(CubeFacePosition.UP, range(Cube.FACE_AREA))
+_UP_PETALS = _facelets(CubeFacePosition.UP, (1, 3, 5, 7))
+_DOWN_FACE = _facelets(CubeFacePosition.DOWN, range(Cube.FACE_AREA))
+_DOWN_PETALS = _facelets(CubeFacePosition.DOWN, (1, 3, 5, 7))
+_VERTICAL_UP_ROWS = sum((_facelets(fp, (0, 1, 2)) for fp in _VERTICAL_FACE_POSITIONS), ())
+_VERTICAL_UP_CORNERS = sum((_facelets(fp, (0, 2)) for fp in _VERTICAL_FACE_POSITIONS), ())
+_VERTICAL_MIDDLE_EDGES = sum((_facelets(fp, (3, 5)) for fp in _VERTICAL_FACE_POSITIONS), ())
+_VERTICAL_DOWN_EDGES = sum((_facelets(fp, (7,)) for fp in _VERTICAL_FACE_POSITIONS), ())
+_VERTICAL_DOWN_ROWS = sum((_facelets(fp, (6, 7, 8)) for fp in _VERTICAL_FACE_POSITIONS), ())
+
+# facelet index of the center of the down face, whose color the up daisy is made of
+_DOWN_CENTER = FaceletCube.FACE_CENTER_INDICES[CubeFacePosition.DOWN]
+
+# masks of the facelets each stage predicate requires to match
+_UP_PETALS_MASK = _byteMask(_UP_PETALS)
+_UP_FACE_MASK = _byteMask(_UP_FACE)
+_UP_EDGES_MASK = _byteMask(_VERTICAL_UP_ROWS)
+_UP_CORNERS_MASK = _byteMask(_UP_FACE + _VERTICAL_UP_CORNERS)
+_UP_LAYER_MASK = _byteMask(_UP_FACE + _VERTICAL_UP_ROWS)
+_MIDDLE_LAYER_MASK = _byteMask(_VERTICAL_MIDDLE_EDGES)
+_DOWN_CROSS_MASK = _byteMask(_DOWN_PETALS + _VERTICAL_DOWN_EDGES)
+_DOWN_LAYER_MASK = _byteMask(_DOWN_FACE + _VERTICAL_DOWN_ROWS)
+
+# once inputs are validated at the boundary, cubelet access and rotation can skip their checks
+runtimeChecks.register(FaceletCube, {
+    '__getitem__': FaceletCube._getitemUnchecked,
+    'rotateFace': FaceletCube._rotateFaceUnchecked,
+    'rotateCoord': FaceletCube._rotateCoordUnchecked,
+})
+
+runtimeChecks.register(FaceletCubelet, {
+    '__getitem__': FaceletCubelet._getitemUnchecked,
+})
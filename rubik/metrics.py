@@ -0,0 +1,287 @@
+import bisect
+import threading
+
+# process-wide metrics, registered once by name, updated from anywhere in the service,
+# and rendered for Prometheus to scrape
+
+# upper bounds of the default histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float('inf'))
+
+# content type of the text exposition format rendered for Prometheus
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+class Counter:
+    """ a count that only goes up, for each combination of label values """
+    
+    """ metric type reported to Prometheus """
+    TYPE = 'counter'
+    
+    def __init__(self, name: str, description: str, labelNames = ()):
+        """ instantiates a counter at 0 """
+        
+        # ensure params are valid
+        assert isinstance(name, str) and name
+        
+        self.name = name
+        self.description = description
+        self.labelNames = tuple(labelNames)
+        
+        self._lock = threading.Lock()
+        
+        # label values -> value
+        self._values = {}
+    
+    def inc(self, amount: float = 1, labels = ()):
+        """ adds to the value under the given label values """
+        
+        # ensure params are valid
+        assert len(labels) == len(self.labelNames)
+        
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+    
+    def getSnapshot(self):
+        """ returns the value under each combination of label values """
+        
+        with self._lock:
+            return dict(self._values)
+    
+    def clear(self):
+        """ forgets every value """
+        
+        with self._lock:
+            self._values.clear()
+    
+    def _drain(self):
+        """ returns the value under each combination of label values, and forgets them """
+        
+        with self._lock:
+            (values, self._values) = (self._values, {})
+        
+        return values
+    
+    def _merge(self, values):
+        """ adds values drained from the same counter in another process """
+        
+        with self._lock:
+            for (labels, value) in values.items():
+                self._values[labels] = self._values.get(labels, 0) + value
+    
+    def _render(self):
+        """ the sample lines of the text exposition format """
+        
+        return [
+            '%s%s %s' % (self.name, _formatLabels(self.labelNames, labels), _formatValue(value))
+            for (labels, value) in sorted(self.getSnapshot().items())
+        ]
+
+class Gauge(Counter):
+    """ a value that goes up and down, for each combination of label values """
+    
+    """ metric type reported to Prometheus """
+    TYPE = 'gauge'
+    
+    def dec(self, amount: float = 1, labels = ()):
+        """ subtracts from the value under the given label values """
+        
+        self.inc(-amount, labels)
+    
+    def set(self, value: float, labels = ()):
+        """ replaces the value under the given label values """
+        
+        # ensure params are valid
+        assert len(labels) == len(self.labelNames)
+        
+        with self._lock:
+            self._values[labels] = value
+
+class Histogram:
+    """ a distribution of observed values, counted into buckets for each combination of label values """
+    
+    """ metric type reported to Prometheus """
+    TYPE = 'histogram'
+    
+    def __init__(self, name: str, description: str, buckets = DEFAULT_BUCKETS, labelNames = ()):
+        """ instantiates an empty histogram with the given bucket upper bounds """
+        
+        # ensure params are valid
+        assert isinstance(name, str) and name
+        assert list(buckets) == sorted(buckets) and buckets[-1] == float('inf')
+        
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.labelNames = tuple(labelNames)
+        
+        self._lock = threading.Lock()
+        
+        # label values -> [bucket counts..., sum, count]
+        self._series = {}
+    
+    def observe(self, value: float, labels = ()):
+        """ records a value under the given label values """
+        
+        # ensure params are valid
+        assert len(labels) == len(self.labelNames)
+        
+        bucket = bisect.bisect_left(self.buckets, value)
+        
+        with self._lock:
+            series = self._series.get(labels)
+            
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            
+            series[bucket] += 1
+            series[-2] += value
+            series[-1] += 1
+    
+    def getSnapshot(self):
+        """ returns the per-bucket (not cumulative) counts, sum, and count recorded under each combination of label values """
+        
+        with self._lock:
+            return {
+                labels: {
+                    'buckets': dict(zip(self.buckets, series[:-2])),
+                    'sum': series[-2],
+                    'count': series[-1]
+                }
+                for (labels, series) in self._series.items()
+            }
+    
+    def clear(self):
+        """ forgets every recorded value """
+        
+        with self._lock:
+            self._series.clear()
+    
+    def _drain(self):
+        """ returns the bucket counts, sum, and count under each combination of label values, and forgets them """
+        
+        with self._lock:
+            (series, self._series) = (self._series, {})
+        
+        return series
+    
+    def _merge(self, series):
+        """ adds series drained from the same histogram in another process """
+        
+        with self._lock:
+            for (labels, drained) in series.items():
+                merged = self._series.get(labels)
+                
+                if merged is None:
+                    merged = self._series[labels] = [0] * (len(self.buckets) + 2)
+                
+                for (index, value) in enumerate(drained):
+                    merged[index] += value
+    
+    def _render(self):
+        """ the sample lines of the text exposition format, with cumulative buckets """
+        
+        lines = []
+        
+        for (labels, series) in sorted(self.getSnapshot().items()):
+            cumulativeCount = 0
+            
+            for (bound, count) in series['buckets'].items():
+                cumulativeCount += count
+                
+                bucketLabels = _formatLabels(self.labelNames + ('le',), labels + (_formatValue(bound),))
+                lines.append('%s_bucket%s %d' % (self.name, bucketLabels, cumulativeCount))
+            
+            formattedLabels = _formatLabels(self.labelNames, labels)
+            
+            lines.append('%s_sum%s %s' % (self.name, formattedLabels, _formatValue(series['sum'])))
+            lines.append('%s_count%s %d' % (self.name, formattedLabels, series['count']))
+        
+        return lines
+
+def counter(name: str, description: str, labelNames = ()) -> Counter:
+    """ returns the process-wide counter registered under a name, registering it if needed """
+    
+    return _register(Counter, name, description, labelNames = labelNames)
+
+def gauge(name: str, description: str, labelNames = ()) -> Gauge:
+    """ returns the process-wide gauge registered under a name, registering it if needed """
+    
+    return _register(Gauge, name, description, labelNames = labelNames)
+
+def histogram(name: str, description: str, buckets = DEFAULT_BUCKETS, labelNames = ()) -> Histogram:
+    """ returns the process-wide histogram registered under a name, registering it if needed """
+    
+    return _register(Histogram, name, description, buckets, labelNames = labelNames)
+
+def render() -> str:
+    """ renders every process-wide metric in the Prometheus text exposition format """
+    
+    with _lock:
+        registered = sorted(REGISTRY.items())
+    
+    lines = []
+    
+    for (name, metric) in registered:
+        lines.append('# HELP %s %s' % (name, metric.description.replace('\\', '\\\\').replace('\n', '\\n')))
+        lines.append('# TYPE %s %s' % (name, metric.TYPE))
+        lines.extend(metric._render())
+    
+    return ''.join(line + '\n' for line in lines)
+
+def drain() -> dict:
+    """
+    returns what every process-wide counter and histogram recorded since last drained, and
+    forgets it, so a worker process can hand its metrics to the process that is scraped
+    """
+    
+    with _lock:
+        registered = list(REGISTRY.values())
+    
+    # gauges hold current values rather than accumulating, so cannot be handed over
+    drained = {metric.name: metric._drain() for metric in registered if not isinstance(metric, Gauge)}
+    
+    return {name: values for (name, values) in drained.items() if values}
+
+def merge(drained: dict):
+    """ adds metrics drained from another process into the process-wide metrics of the same names """
+    
+    with _lock:
+        registered = [(REGISTRY[name], values) for (name, values) in drained.items() if name in REGISTRY]
+    
+    for (metric, values) in registered:
+        metric._merge(values)
+
+def _register(metricClass, name: str, *args, **kwargs):
+    """ returns the metric registered under a name, registering a new one of a class if needed """
+    
+    with _lock:
+        if name not in REGISTRY:
+            REGISTRY[name] = metricClass(name, *args, **kwargs)
+        
+        # ensure the name is not already taken by another type of metric
+        assert type(REGISTRY[name]) is metricClass
+        
+        return REGISTRY[name]
+
+def _formatLabels(labelNames, labels) -> str:
+    """ formats label names and values as a Prometheus label set """
+    
+    if not labelNames:
+        return ''
+    
+    return '{%s}' % ','.join(
+        '%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for (name, value) in zip(labelNames, labels)
+    )
+
+def _formatValue(value) -> str:
+    """ formats a sample value, or bucket bound, as Prometheus expects """
+    
+    if value == float('inf'):
+        return '+Inf'
+    
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+# every process-wide metric, by name
+REGISTRY = {}
+
+_lock = threading.Lock()
@@ -0,0 +1,72 @@
+from functools import lru_cache
+from operator import itemgetter
+
+from rubik.cubeCode import CubeCode
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.faceRotationDirection import FaceRotationDirection
+import rubik.moveTable as moveTable
+
+# compiles strings of rotation codes, e.g. 'FRurD', into a single composed facelet
+# permutation, so a whole move sequence is applied to a cube code in one gather
+
+# how many compiled move sequences are retained
+CACHE_SIZE = 4096
+
+# face rotation denoted by each rotation code, lowercase codes are counterclockwise
+MOVES = {}
+
+for facePosition in CubeFacePosition:
+    MOVES[facePosition.value] = (facePosition, FaceRotationDirection.CLOCKWISE)
+    MOVES[facePosition.value.lower()] = (facePosition, FaceRotationDirection.COUNTERCLOCKWISE)
+
+def normalize(rotationCodes: str) -> str:
+    """ removes rotations that cancel out, i.e. a rotation followed by its inverse or 4 identical rotations """
+    
+    normalized = []
+    
+    for rotationCode in rotationCodes:
+        
+        # a rotation immediately undone accomplishes nothing
+        if normalized and normalized[-1] == rotationCode.swapcase():
+            normalized.pop()
+            continue
+        
+        normalized.append(rotationCode)
+        
+        # 4 identical rotations accomplish nothing
+        if len(normalized) >= 4 and normalized[-4:].count(rotationCode) == 4:
+            del normalized[-4:]
+    
+    return ''.join(normalized)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compileNormalized(rotationCodes: str):
+    """ composes the permutations of a normalized move sequence into a single gather """
+    
+    permutation = tuple(range(CubeCode.CODE_LENGTH))
+    
+    for rotationCode in rotationCodes:
+        movePermutation = moveTable.PERMUTATIONS[MOVES[rotationCode]]
+        
+        # applying the move after the sequence so far gathers through both
+        permutation = tuple(permutation[source] for source in movePermutation)
+    
+    return itemgetter(*permutation)
+
+def compileMoves(rotationCodes: str):
+    """ returns a gather that applies a whole move sequence to a cube code """
+    
+    # ensure every rotation code is valid
+    assert all(rotationCode in MOVES for rotationCode in rotationCodes)
+    
+    return _compileNormalized(normalize(rotationCodes))
+
+def applyMoves(cubeCode: str, rotationCodes: str) -> str:
+    """ returns the cube code resulting from applying a move sequence to a cube code """
+    
+    return ''.join(compileMoves(rotationCodes)(cubeCode))
+
+def cacheInfo():
+    """ hit/miss statistics of the compiled move sequence cache """
+    
+    return _compileNormalized.cache_info()
@@ -0,0 +1,72 @@
+from operator import itemgetter
+
+from rubik.cube import Cube
+from rubik.cubelet import Cubelet
+from rubik.cubeCode import CubeCode
+from rubik.cubeColor import CubeColor
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.faceRotationDirection import FaceRotationDirection
+
+# facelet permutations for every quarter turn of the cube, derived once at import
+# by replaying the geometry of Cube.rotateCoord and Cubelet.rotate
+#
+# a permutation p is applied as a gather, i.e. facelet i of the rotated cube
+# receives the color of facelet p[i] of the original cube
+
+# facelet index of each (cubelet coordinate, face position) pair on the outside of the cube
+FACELET_INDICES = {
+    (coord, facePosition): (faceNumber * Cube.FACE_AREA) + tileNumber
+    for (faceNumber, facePosition) in enumerate(CubeCode.FACE_POSITION_ORDER)
+    for (tileNumber, coord) in enumerate(Cube.CUBELET_COORDS[facePosition])
+}
+
+def _derivePermutation(probe: Cube, facePosition: CubeFacePosition, direction: FaceRotationDirection):
+    """ determines where each facelet goes when a face of the probe cube is rotated """
+    
+    permutation = list(range(CubeCode.CODE_LENGTH))
+    cubeletRotationDirection = Cube.CUBELET_ROTATION_DIRECTIONS[facePosition, direction]
+    
+    for ((coord, cubeletFacePosition), index) in FACELET_INDICES.items():
+        
+        # facelets off the rotated face stay where they are
+        if coord not in Cube.CUBELET_COORDS[facePosition]:
+            continue
+        
+        # follow the cubelet to its new coordinate
+        newCoord = probe.rotateCoord(coord, facePosition, direction)
+        
+        # follow the colored face of the cubelet to its new face position
+        cubelet = Cubelet({cubeletFacePosition: CubeColor.BLUE})
+        cubelet.rotate(cubeletRotationDirection)
+        
+        newFacePosition = next(
+            newFacePosition for (newFacePosition, color)
+            in cubelet.getFaceColors().items()
+            if color is not None
+        )
+        
+        permutation[FACELET_INDICES[newCoord, newFacePosition]] = index
+    
+    return tuple(permutation)
+
+def _derivePermutations():
+    """ derives the facelet permutation of all 12 quarter turns """
+    
+    probe = Cube(''.join(color.value * Cube.FACE_AREA for color in CubeColor))
+    
+    return {
+        (facePosition, direction): _derivePermutation(probe, facePosition, direction)
+        for facePosition in CubeFacePosition
+        for direction in FaceRotationDirection
+    }
+
+# facelet permutation of each (face position, rotation direction) pair
+PERMUTATIONS = _derivePermutations()
+
+# the permutations as gathers, which return a tuple of the permuted facelets
+GATHERS = {move: itemgetter(*permutation) for (move, permutation) in PERMUTATIONS.items()}
+
+def applyMove(cubeCode: str, facePosition: CubeFacePosition, direction: FaceRotationDirection) -> str:
+    """ returns the cube code resulting from a face rotation, as a single index gather """
+    
+    return ''.join(GATHERS[facePosition, direction](cubeCode))
@@ -0,0 +1,131 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+
+# logs served requests as JSON lines, formatted and written by a background thread
+# so request handlers only pay for putting a record on a queue
+
+# environment variables configuring the request log
+LOG_LEVEL_VARIABLE = 'RUBIK_REQUEST_LOG_LEVEL'
+SAMPLE_RATE_VARIABLE = 'RUBIK_REQUEST_LOG_SAMPLE_RATE'
+
+# name of the logger requests are logged to
+LOGGER_NAME = 'rubik.requests'
+
+# requests are logged at INFO, and at WARNING if they result in an error, unless the level is raised
+DEFAULT_LOG_LEVEL = 'INFO'
+
+# the fraction of successful requests that are logged, failed requests are always logged
+DEFAULT_SAMPLE_RATE = 1.0
+
+class JsonLinesFormatter(logging.Formatter):
+    """ formats a log record as one line of JSON, including the fields passed along with it """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """ returns the record as a JSON object on a single line """
+        
+        entry = {
+            'time': record.created,
+            'level': record.levelname,
+            'message': record.getMessage()
+        }
+        
+        entry.update(getattr(record, 'fields', {}))
+        
+        return json.dumps(entry, separators = (',', ':'), default = str)
+
+class _DrainingStreamHandler(logging.StreamHandler):
+    """ writes records to a stream, only flushing it once the queue the records come from is drained """
+    
+    def __init__(self, stream, records: queue.SimpleQueue):
+        """ writes to a stream, fed from a queue of records """
+        
+        super().__init__(stream)
+        
+        self._records = records
+    
+    def flush(self):
+        """ flushes the stream unless more records are waiting to be written """
+        
+        if self._records.empty():
+            super().flush()
+
+def logRequest(op, seconds: float, status: str, resultSize: int, route: str = None, statusCode: int = None, error: Exception = None):
+    """ logs a served request, subject to the configured level and sampling, with its route, HTTP status code, and exception if known """
+    
+    logger = getLogger()
+    
+    level = logging.INFO if status == 'ok' and error is None else logging.WARNING
+    
+    if not logger.isEnabledFor(level):
+        return
+    
+    # only successful requests are sampled, so every failure is seen
+    if level == logging.INFO and _sampleRate < 1.0 and random.random() >= _sampleRate:
+        return
+    
+    fields = {
+        'op': op,
+        'latency': round(seconds, 6),
+        'status': status,
+        'resultSize': resultSize
+    }
+    
+    if route is not None:
+        fields['route'] = route
+    
+    if statusCode is not None:
+        fields['statusCode'] = statusCode
+    
+    if error is not None:
+        fields['error'] = '%s: %s' % (type(error).__name__, error)
+    
+    logger.log(level, 'request', extra = {'fields': fields})
+
+def getLogger() -> logging.Logger:
+    """ returns the request logger, setting up its queue and background writer the first time """
+    
+    global _listener, _sampleRate
+    
+    logger = logging.getLogger(LOGGER_NAME)
+    
+    if _listener is not None:
+        return logger
+    
+    with _lock:
+        if _listener is None:
+            records = queue.SimpleQueue()
+            
+            writer = _DrainingStreamHandler(sys.stdout, records)
+            writer.setFormatter(JsonLinesFormatter())
+            
+            listener = logging.handlers.QueueListener(records, writer)
+            listener.start()
+            
+            # write out whatever is still queued when the process exits
+            atexit.register(_stop, listener, writer)
+            
+            logger.addHandler(logging.handlers.QueueHandler(records))
+            logger.setLevel(os.environ.get(LOG_LEVEL_VARIABLE, DEFAULT_LOG_LEVEL).upper())
+            logger.propagate = False
+            
+            _sampleRate = float(os.environ.get(SAMPLE_RATE_VARIABLE, DEFAULT_SAMPLE_RATE))
+            _listener = listener
+    
+    return logger
+
+def _stop(listener: logging.handlers.QueueListener, writer: logging.StreamHandler):
+    """ stops the background writer once it has written every queued record """
+    
+    listener.stop()
+    logging.StreamHandler.flush(writer)
+
+_listener = None
+_sampleRate = DEFAULT_SAMPLE_RATE
+_lock = threading.Lock()
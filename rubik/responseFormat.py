@@ -0,0 +1,90 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# serializes results into response bodies, as JSON by default or as the str(dict) repr
+# that older clients parse, negotiated by a 'format' query param or the Accept header
+
+JSON_CONTENT_TYPE = 'application/json'
+LEGACY_CONTENT_TYPE = 'text/plain'
+
+# query param choosing a format explicitly, taking precedence over the Accept header
+FORMAT_PARAM = 'format'
+
+# formats a response can be serialized in
+COMPACT_FORMAT = 'json'
+PRETTY_FORMAT = 'pretty'
+LEGACY_FORMAT = 'legacy'
+FORMATS = (COMPACT_FORMAT, PRETTY_FORMAT, LEGACY_FORMAT)
+
+def _negotiate(formatParam: str = None, accept: str = None) -> str:
+    """
+    chooses the format of a response: the format param if it names one, otherwise legacy
+    only if the Accept header prefers text/plain over JSON, otherwise compact JSON
+    """
+    
+    if formatParam in FORMATS:
+        return formatParam
+    
+    if accept and _quality(accept, LEGACY_CONTENT_TYPE) > _quality(accept, JSON_CONTENT_TYPE):
+        return LEGACY_FORMAT
+    
+    return COMPACT_FORMAT
+
+def _formatResponse(result, format: str = COMPACT_FORMAT) -> tuple[str, str]:
+    """ serializes a result in a format, returning the body along with its content type """
+    
+    if format == LEGACY_FORMAT:
+        return (str(result), LEGACY_CONTENT_TYPE)
+    
+    return (_dumps(result, pretty = (format == PRETTY_FORMAT)), JSON_CONTENT_TYPE)
+
+def _dumps(value, pretty: bool = False) -> str:
+    """ serializes a value as JSON, with orjson if it is installed """
+    
+    if orjson is not None:
+        return orjson.dumps(value, option = orjson.OPT_INDENT_2 if pretty else 0).decode()
+    
+    if pretty:
+        return json.dumps(value, indent = 2)
+    
+    return json.dumps(value, separators = (',', ':'))
+
+def _quality(accept: str, mimetype: str) -> float:
+    """ the quality an Accept header gives a mimetype, through its most specific matching media range """
+    
+    (topLevelType, _) = mimetype.split('/')
+    
+    bestSpecificity = -1
+    bestQuality = 0.0
+    
+    for mediaRange in accept.split(','):
+        (rangeType, *params) = [part.strip() for part in mediaRange.split(';')]
+        
+        if rangeType == mimetype:
+            specificity = 2
+        elif rangeType == topLevelType + '/*':
+            specificity = 1
+        elif rangeType == '*/*':
+            specificity = 0
+        else:
+            continue
+        
+        quality = 1.0
+        
+        for param in params:
+            (name, _, value) = param.partition('=')
+            
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        
+        if specificity > bestSpecificity:
+            (bestSpecificity, bestQuality) = (specificity, quality)
+    
+    return bestQuality
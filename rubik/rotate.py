@@ -1,8 +1,7 @@
 
 from rubik.cubeFacePosition import CubeFacePosition
 from rubik.cubeCode import CubeCode
-from rubik.faceRotationDirection import FaceRotationDirection
-from rubik.cube import Cube
+import rubik.moveCompiler as moveCompiler
 
 ERROR_MISSING_CUBE = 'error: missing cube'
 ERROR_INVALID_CUBE = 'error: invalid cube'
@@ -40,27 +39,12 @@ def _rotate(params):
         if len(dirValue) > 0:
             rotationCodes = dirValue
             
-    # build initial cube
-    cube = Cube(cubeCode)
-    
-    # loop thru each rotation code
-    for rotationCode in rotationCodes:
-        
-        # determine which way to rotate the cube face
-        direction = (
-            FaceRotationDirection.CLOCKWISE 
-            if rotationCode.isupper()
-            else FaceRotationDirection.COUNTERCLOCKWISE
-        )
-        
-        # determine which cube face to rotate
-        facePosition = CubeFacePosition(rotationCode.upper())
-        
-        cube.rotateFace(facePosition, direction)
+    # apply the whole move sequence as a single composed permutation
+    rotatedCubeCode = moveCompiler.applyMoves(cubeCode, rotationCodes)
     
     # return final cube code
     result = {
-        'cube': cube.toCode(),
+        'cube': rotatedCubeCode,
         'status': 'ok'
     }
     
@@ -0,0 +1,66 @@
+import os
+
+# switches the hot accessors and rotations of the cube model between checked variants, which assert
+# on the types and ranges of their params, and unchecked ones for inputs already validated at the
+# boundary (dispatch and CubeCode), independently of python's -O flag
+#
+# checks are enabled on import, so tests and interactive use keep them, and servers disable them
+
+# environment variable turning checks on (1) or off (0), overriding the default a server configures
+CHECKS_VARIABLE = 'RUBIK_RUNTIME_CHECKS'
+
+# values of the environment variable that turn checks off, any other turning them on
+_DISABLING_VALUES = ('0', 'false', 'no', 'off')
+
+def register(cls, uncheckedMethods: dict):
+    """ registers unchecked variants of methods of a class, by method name, to be swapped in while checks are disabled """
+    
+    for (name, unchecked) in uncheckedMethods.items():
+        checked = cls.__dict__[name]
+        _methods.append((cls, name, checked, unchecked))
+        
+        # classes imported after checks were disabled start out unchecked too
+        if not _enabled:
+            setattr(cls, name, unchecked)
+
+def enable():
+    """ swaps the checked variant of every registered method in """
+    
+    _swap(True)
+
+def disable():
+    """ swaps the unchecked variant of every registered method in """
+    
+    _swap(False)
+
+def isEnabled() -> bool:
+    """ whether the checked variants are in use """
+    
+    return _enabled
+
+def configure(default: bool = True) -> bool:
+    """ enables or disables checks as the environment says, or by default if it does not, returning whether they are enabled """
+    
+    value = os.environ.get(CHECKS_VARIABLE, '').strip().lower()
+    
+    if value:
+        default = value not in _DISABLING_VALUES
+    
+    _swap(default)
+    
+    return _enabled
+
+def _swap(enabled: bool):
+    """ installs the checked or unchecked variant of every registered method """
+    
+    global _enabled
+    
+    for (cls, name, checked, unchecked) in _methods:
+        setattr(cls, name, checked if enabled else unchecked)
+    
+    _enabled = enabled
+
+# (class, method name, checked variant, unchecked variant) of every registered method
+_methods = []
+
+_enabled = True
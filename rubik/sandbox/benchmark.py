@@ -0,0 +1,363 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import rubik.dispatch as dispatch
+import rubik.runtimeChecks as runtimeChecks
+import rubik.solveCache as solveCache
+from rubik.cube import Cube
+from rubik.cubeCode import CubeCode
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.cubeSolver import CubeSolver
+from rubik.faceletCube import FaceletCube
+from rubik.faceRotationDirection import FaceRotationDirection
+from rubik.solveCache import SolveCache
+
+# measures the hot paths of cube construction, rotation, validation, solving, and dispatch
+# over seeded random scrambles, writing JSON that can be diffed between commits
+# and gating on regressions against a baseline:
+#
+#     python -m rubik.sandbox.benchmark -o baseline.json
+#     python -m rubik.sandbox.benchmark --compare baseline.json
+#
+# runtime checks are disabled as they are in production, unless --runtime-checks is given
+
+# version of the JSON written, bumped whenever its layout changes
+FORMAT_VERSION = 3
+
+# defaults for how many scrambles are measured, and how they are made
+DEFAULT_SEED = 20231
+DEFAULT_SCRAMBLES = 500
+SCRAMBLE_LENGTH = 25
+
+# how many times each op is timed on each scramble by default, keeping the fastest,
+# so a scheduler hiccup during one run does not land in the percentiles
+DEFAULT_REPEATS = 5
+
+# how much slower than its baseline a benchmark's median may get before it counts as a regression,
+# wide enough that a shared CI runner's noise does not trip it
+DEFAULT_THRESHOLD = 0.15
+
+# percentiles reported for the time of a single op
+PERCENTILES = (50, 90, 99)
+
+SOLVED_CODE = 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'
+
+# prefix of the names of the benchmarks of each solver stage
+STAGES_PREFIX = 'cubeSolver.stages.'
+
+# the face rotations a scramble is made of
+MOVES = [
+    (facePosition, direction)
+    for facePosition in CubeFacePosition
+    for direction in FaceRotationDirection
+]
+
+def main(argv = None) -> int:
+    """ runs the benchmarks, returning 1 if any regressed against the baseline compared with """
+    
+    args = _parseArgs(argv)
+    
+    # measure what servers run, which disable checks unless the environment enables them
+    runtimeChecks.configure(default = args.runtimeChecks)
+    
+    report = _runBenchmarks(args.seed, args.scrambles, args.only, args.repeats)
+    
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent = 2, sort_keys = True)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent = 2, sort_keys = True)
+    
+    if args.compare is None:
+        return 0
+    
+    with open(args.compare) as file:
+        baseline = json.load(file)
+    
+    (lines, regressions) = _compare(baseline, report, args.threshold)
+    
+    sys.stderr.write(''.join(line + '\n' for line in lines))
+    
+    return 1 if regressions else 0
+
+def _parseArgs(argv):
+    """ parses the command line arguments """
+    
+    parser = argparse.ArgumentParser(prog = 'python -m rubik.sandbox.benchmark', description = 'benchmark the cube, solver, and dispatch hot paths over seeded scrambles')
+    
+    parser.add_argument('-o', '--output', default = '-', help = 'file to write the JSON results to, or - for stdout (default)')
+    parser.add_argument('--seed', type = int, default = DEFAULT_SEED, help = 'seed the scrambles are made from')
+    parser.add_argument('--scrambles', type = int, default = DEFAULT_SCRAMBLES, help = 'number of scrambles measured')
+    parser.add_argument('--repeats', type = int, default = DEFAULT_REPEATS, help = 'times each op is timed on each scramble, keeping the fastest')
+    parser.add_argument('--only', action = 'append', help = 'only run benchmarks whose names start with this prefix')
+    parser.add_argument('--runtime-checks', dest = 'runtimeChecks', action = 'store_true', help = 'measure with runtime checks enabled, as tests run, rather than disabled as servers run')
+    parser.add_argument('--compare', help = 'baseline JSON to compare against, exiting 1 on regressions')
+    parser.add_argument('--threshold', type = float, default = DEFAULT_THRESHOLD, help = 'relative slowdown of a median counted as a regression')
+    
+    args = parser.parse_args(argv)
+    
+    if args.scrambles < 1 or args.repeats < 1 or args.threshold < 0:
+        parser.error('--scrambles and --repeats must be positive, and --threshold must not be negative')
+    
+    return args
+
+def _scrambles(seed: int, count: int) -> list[str]:
+    """ the cube codes of count scrambles, made by random face rotations from the solved cube """
+    
+    rng = random.Random(seed)
+    codes = []
+    
+    for _ in range(count):
+        cube = FaceletCube(SOLVED_CODE)
+        
+        for (facePosition, direction) in rng.choices(MOVES, k = SCRAMBLE_LENGTH):
+            cube.rotateFace(facePosition, direction)
+        
+        codes.append(cube.toCode())
+    
+    return codes
+
+def _benchmarks(codes: list[str], seed: int):
+    """
+    each benchmark by name, as a pair of functions: one preparing an argument for each op
+    from each scramble outside of the timing, and one performing the op on it
+    """
+    
+    # each scramble is rotated by its own random move
+    rng = random.Random(seed)
+    moves = dict(zip(codes, rng.choices(MOVES, k = len(codes))))
+    
+    def rotateFace(args):
+        (cube, facePosition, direction) = args
+        cube.rotateFace(facePosition, direction)
+    
+    return {
+        'cube.init': (lambda code: code, Cube),
+        'cube.rotateFace': (lambda code: (Cube(code),) + moves[code], rotateFace),
+        'cube.toCode': (Cube, Cube.toCode),
+        'faceletCube.rotateFace': (lambda code: (FaceletCube(code),) + moves[code], rotateFace),
+        'cubeCode.isValid': (lambda code: code, CubeCode.isValid),
+        'cubeSolver.solve': (lambda code: CubeCode(code, validated = True), CubeSolver),
+        'dispatch.rotate': (lambda code: {'op': 'rotate', 'cube': code, 'dir': 'FRbLuD'}, dispatch._dispatch),
+        'dispatch.solve': (lambda code: {'op': 'solve', 'cube': code}, dispatch._dispatch),
+    }
+
+def _runBenchmarks(seed: int, count: int, only = None, repeats: int = DEFAULT_REPEATS) -> dict:
+    """ runs each benchmark over the scrambles, returning the report written as JSON """
+    
+    codes = _scrambles(seed, count)
+    
+    results = {}
+    
+    # solves dispatched are measured uncached, as every scramble would be a miss in production too
+    previousCache = solveCache.getCache()
+    solveCache.setCache(SolveCache(0))
+    
+    try:
+        benchmarks = {name: benchmark for (name, benchmark) in _benchmarks(codes, seed).items() if _isSelected(name, only)}
+        
+        # stages all come from the same instrumented solves, so are measured together
+        measuresStages = not only or any(prefix.startswith(STAGES_PREFIX) or STAGES_PREFIX.startswith(prefix) for prefix in only)
+        
+        args = {}
+        timings = {}
+        
+        for (name, (prepare, op)) in benchmarks.items():
+            args[name] = [prepare(code) for code in codes]
+            timings[name] = [float('inf')] * count
+            
+            # warm up caches and lazily built tables, so the first op is not an outlier
+            op(prepare(codes[0]))
+        
+        stageTimings = {}
+        
+        # each round times every benchmark in turn, so a slow spell of the host is spread
+        # over all of them rather than landing on whichever one happened to be running
+        for _ in range(repeats):
+            for (name, (_, op)) in benchmarks.items():
+                _time(op, args[name], timings[name])
+            
+            if measuresStages:
+                _timeStages(codes, stageTimings)
+        
+        for (name, (prepare, op)) in benchmarks.items():
+            results[name] = _summarize(timings[name]) | _allocations(prepare, op, codes)
+        
+        for (name, fastest) in stageTimings.items():
+            if _isSelected(name, only):
+                results[name] = _summarize(fastest)
+    finally:
+        solveCache.setCache(previousCache)
+    
+    return {
+        'version': FORMAT_VERSION,
+        'seed': seed,
+        'scrambles': count,
+        'repeats': repeats,
+        'runtimeChecks': runtimeChecks.isEnabled(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'benchmarks': results
+    }
+
+def _isSelected(name: str, only = None) -> bool:
+    """ whether a benchmark is selected by any of the prefixes, all being selected without any """
+    
+    return not only or any(name.startswith(prefix) for prefix in only)
+
+def _time(op, args: list, timings: list[float]):
+    """ times op on each argument, lowering each timing to the time taken if faster """
+    
+    clock = time.perf_counter
+    
+    # collection pauses would land on whichever op happened to trigger them
+    gcWasEnabled = gc.isenabled()
+    gc.disable()
+    
+    try:
+        for (index, arg) in enumerate(args):
+            startTime = clock()
+            op(arg)
+            timings[index] = min(timings[index], clock() - startTime)
+    finally:
+        if gcWasEnabled:
+            gc.enable()
+
+def _timeStages(codes: list[str], timings: dict):
+    """ times each stage of the solver on each scramble, each including the stages it builds on, lowering each timing if faster """
+    
+    for (index, code) in enumerate(codes):
+        solver = CubeSolver(CubeCode(code, validated = True), instrument = True)
+        
+        for (section, totals) in solver.stats.getSections().items():
+            if section.startswith('solve') and section != 'solve':
+                stageTimings = timings.setdefault(STAGES_PREFIX + section, [float('inf')] * len(codes))
+                stageTimings[index] = min(stageTimings[index], totals['seconds'])
+
+def _summarize(timings: list[float]) -> dict:
+    """ the throughput and distribution of the times of single ops """
+    
+    ordered = sorted(timings)
+    total = sum(ordered)
+    
+    summary = {
+        'ops': len(ordered),
+        'opsPerSecond': len(ordered) / total if total > 0 else None,
+        'mean': total / len(ordered),
+        'max': ordered[-1]
+    }
+    
+    for percentile in PERCENTILES:
+        summary['p%d' % percentile] = _percentile(ordered, percentile)
+    
+    return summary
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    """ the percentile of sorted values, interpolating between the nearest two """
+    
+    position = (len(ordered) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def _allocations(prepare, op, codes: list[str], samples: int = 20) -> dict:
+    """ the mean bytes and blocks an op allocates and keeps, and the mean peak of what it allocates while running """
+    
+    args = [prepare(code) for code in codes[:samples]]
+    
+    keptBytes = keptBlocks = peakBytes = 0
+    
+    tracemalloc.start()
+    
+    try:
+        for arg in args:
+            before = tracemalloc.take_snapshot()
+            (startBytes, _) = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            
+            result = op(arg)
+            
+            (endBytes, peak) = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            
+            # the snapshots themselves are not counted, being taken outside of the op
+            differences = after.compare_to(before, 'filename')
+            
+            keptBlocks += sum(difference.count_diff for difference in differences)
+            keptBytes += endBytes - startBytes
+            peakBytes += peak - startBytes
+            
+            del result
+    finally:
+        tracemalloc.stop()
+    
+    return {
+        'keptBytes': keptBytes / len(args),
+        'keptBlocks': keptBlocks / len(args),
+        'peakBytes': peakBytes / len(args)
+    }
+
+def _compare(baseline: dict, report: dict, threshold: float = DEFAULT_THRESHOLD):
+    """
+    compares the median time of each benchmark in both reports,
+    returning lines describing the changes along with the names of those that regressed
+    """
+    
+    lines = []
+    regressions = []
+    
+    if baseline.get('version') != report.get('version'):
+        lines.append('baseline is version %s, not %s' % (baseline.get('version'), report.get('version')))
+    
+    if (baseline.get('seed'), baseline.get('scrambles'), baseline.get('repeats')) != (report.get('seed'), report.get('scrambles'), report.get('repeats')):
+        lines.append('baseline measured different scrambles, so medians may not be comparable')
+    
+    if baseline.get('runtimeChecks') != report.get('runtimeChecks'):
+        lines.append('baseline was measured with runtime checks %s, so medians may not be comparable' % ('enabled' if baseline.get('runtimeChecks') else 'disabled'))
+    
+    for (name, result) in sorted(report['benchmarks'].items()):
+        baselineResult = baseline.get('benchmarks', {}).get(name)
+        
+        if baselineResult is None:
+            lines.append('%-48s %12s  new' % (name, _formatSeconds(result['p50'])))
+            continue
+        
+        change = result['p50'] / baselineResult['p50'] - 1 if baselineResult['p50'] > 0 else 0.0
+        regressed = change > threshold
+        
+        if regressed:
+            regressions.append(name)
+        
+        lines.append('%-48s %12s -> %12s  %+7.1f%%%s' % (
+            name,
+            _formatSeconds(baselineResult['p50']),
+            _formatSeconds(result['p50']),
+            change * 100,
+            '  REGRESSED' if regressed else ''
+        ))
+    
+    lines.append('%d of %d benchmarks regressed by more than %.0f%%' % (len(regressions), len(report['benchmarks']), threshold * 100))
+    
+    return (lines, regressions)
+
+def _formatSeconds(seconds: float) -> str:
+    """ formats a time in the most readable unit """
+    
+    if seconds >= 1:
+        return '%.3fs' % seconds
+    
+    if seconds >= 1e-3:
+        return '%.3fms' % (seconds * 1e3)
+    
+    return '%.3fus' % (seconds * 1e6)
+
+if __name__ == '__main__':
+    sys.exit(main())
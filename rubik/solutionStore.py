@@ -0,0 +1,179 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+
+from rubik.cubeCode import CubeCode
+import rubik.cacheBackend as cacheBackend
+
+# environment variable holding the path of the process-wide store, unset disables it
+STORE_PATH_VARIABLE = 'RUBIK_SOLUTION_STORE'
+
+# how many solutions a store indexes by default, its index does not grow past this
+DEFAULT_CAPACITY = 1 << 20
+
+# file header, identifying the file and recording the number of index slots
+_MAGIC = b'RUBIKSS1'
+_HEADER = struct.Struct('<8sQ')
+
+# each index slot holds the offset of a record in the data file plus one, 0 when empty
+_SLOT = struct.Struct('<Q')
+
+# each record in the data file is a fixed-width cube code, the length of its rotation codes, then the codes
+_RECORD_HEADER = struct.Struct('<%dsH' % CubeCode.CODE_LENGTH)
+
+class SolutionStore:
+    """
+    a persistent store of the rotation codes that solve cube codes, shared by every process
+    that opens it
+    
+    solutions are appended to a data file, and located through a hashed index file of
+    fixed-size slots, both of which are memory-mapped so lookups do not copy them into the heap
+    
+    writers are serialized across threads and processes by a lock on the index file, while
+    readers only take a thread lock guarding the data file's mapping as it is replaced
+    """
+    
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY):
+        """ opens the store at a path, creating its data and index files if needed """
+        
+        # ensure params are valid
+        assert isinstance(path, str)
+        assert isinstance(capacity, int) and capacity > 0
+        
+        self.path = path
+        
+        self._dataFile = open(path + '.dat', 'a+b')
+        
+        # slots are written in place, which an append mode file would not allow
+        self._indexFile = os.fdopen(os.open(path + '.idx', os.O_RDWR | os.O_CREAT), 'r+b')
+        self._lock = cacheBackend._FileLock(self._indexFile)
+        
+        # only the first process to open the store sizes its index
+        with self._locked():
+            if os.fstat(self._indexFile.fileno()).st_size == 0:
+                self._indexFile.write(_HEADER.pack(_MAGIC, capacity))
+                self._indexFile.truncate(_HEADER.size + capacity * _SLOT.size)
+                self._indexFile.flush()
+        
+        self._index = mmap.mmap(self._indexFile.fileno(), 0, access = mmap.ACCESS_READ)
+        
+        (magic, self.capacity) = _HEADER.unpack_from(self._index, 0)
+        assert magic == _MAGIC
+        
+        self._data = None
+        self._dataSize = 0
+        self._dataLock = threading.Lock()
+    
+    def get(self, cube: str) -> str | None:
+        """ returns the stored rotation codes that solve a cube code, or None if not stored """
+        
+        key = cube.encode('ascii')
+        
+        for slot in self._probe(key):
+            offset = _SLOT.unpack_from(self._index, slot)[0]
+            
+            # an empty slot ends the probe sequence
+            if offset == 0:
+                return None
+            
+            (recordKey, rotationCodes) = self._readRecord(offset - 1)
+            
+            if recordKey == key:
+                return rotationCodes
+        
+        return None
+    
+    def put(self, cube: str, rotationCodes: str):
+        """ stores the rotation codes that solve a cube code, unless already stored """
+        
+        key = cube.encode('ascii')
+        value = rotationCodes.encode('ascii')
+        
+        with self._locked():
+            for slot in self._probe(key):
+                offset = _SLOT.unpack_from(self._index, slot)[0]
+                
+                if offset == 0:
+                    break
+                
+                # another process may have stored it first
+                if self._readRecord(offset - 1)[0] == key:
+                    return
+            else:
+                # a full index stores nothing more
+                return
+            
+            # append the record, then publish it in the index
+            self._dataFile.seek(0, os.SEEK_END)
+            recordOffset = self._dataFile.tell()
+            
+            self._dataFile.write(_RECORD_HEADER.pack(key, len(value)) + value)
+            self._dataFile.flush()
+            
+            os.pwrite(self._indexFile.fileno(), _SLOT.pack(recordOffset + 1), slot)
+    
+    def close(self):
+        """ unmaps and closes the store's files """
+        
+        if self._data is not None:
+            self._data.close()
+        
+        self._index.close()
+        self._dataFile.close()
+        self._indexFile.close()
+    
+    def _probe(self, key: bytes):
+        """ yields the byte offsets of the index slots a key may occupy, in probe order """
+        
+        start = int.from_bytes(hashlib.blake2b(key, digest_size = 8).digest(), 'little') % self.capacity
+        
+        for step in range(self.capacity):
+            yield _HEADER.size + ((start + step) % self.capacity) * _SLOT.size
+    
+    def _readRecord(self, offset: int):
+        """ reads the key and rotation codes of the record at an offset of the data file """
+        
+        # the mapping may only be replaced while no other thread is reading it
+        with self._dataLock:
+            # records appended by other processes since the data file was mapped need a fresh mapping
+            if offset + _RECORD_HEADER.size > self._dataSize:
+                self._remapData()
+            
+            (key, length) = _RECORD_HEADER.unpack_from(self._data, offset)
+            
+            start = offset + _RECORD_HEADER.size
+            
+            if start + length > self._dataSize:
+                self._remapData()
+            
+            return (key, self._data[start : start + length].decode('ascii'))
+    
+    def _remapData(self):
+        """ maps the whole data file as it currently is, while holding the data lock """
+        
+        if self._data is not None:
+            self._data.close()
+        
+        self._dataSize = os.fstat(self._dataFile.fileno()).st_size
+        self._data = mmap.mmap(self._dataFile.fileno(), 0, access = mmap.ACCESS_READ)
+    
+    def _locked(self):
+        """ an exclusive lock across threads and processes, held while writing to the store """
+        
+        return self._lock
+
+def getStore():
+    """ returns the process-wide store at the path configured by the environment, or None if disabled """
+    
+    global _store
+    
+    path = os.environ.get(STORE_PATH_VARIABLE)
+    
+    if _store is None and path:
+        _store = SolutionStore(path)
+    
+    return _store
+
+_store = None
@@ -1,13 +1,38 @@
 
 import hashlib
+import os
+import random
 import secrets
 
 from rubik.cubeSolver import CubeSolver
 from rubik.cubeCode import CubeCode
 from rubik.faceRotationDirection import FaceRotationDirection
+from rubik.solveBudgetExceeded import SolveBudgetExceeded
+import rubik.solveCache as solveCache
+import rubik.solutionStore as solutionStore
+import rubik.cubeSymmetry as cubeSymmetry
+import rubik.verify as verify
+import rubik.metrics as metrics
 
 ERROR_MISSING_CUBE = 'error: missing cube'
 ERROR_INVALID_CUBE = 'error: invalid cube'
+ERROR_BUDGET_EXCEEDED = 'error: solve budget exceeded'
+
+# environment variable holding the most seconds a solve may take
+TIME_LIMIT_VARIABLE = 'RUBIK_SOLVE_TIME_LIMIT'
+
+# how many seconds a solve may take by default, so one stuck request cannot pin a worker
+DEFAULT_TIME_LIMIT = 5.0
+
+# environment variable holding the fraction of solves whose stages are instrumented
+STATS_SAMPLE_RATE_VARIABLE = 'RUBIK_SOLVE_STATS_SAMPLE_RATE'
+
+# a small share of solves are instrumented by default, enough for /metrics to show where solves
+# spend their time without every solve paying for counting its moves and predicates
+DEFAULT_STATS_SAMPLE_RATE = 0.01
+
+_CACHE_LOOKUPS = metrics.counter('rubik_solve_cache_lookups_total', 'solve cache lookups, by result', ('result',))
+_STORE_LOOKUPS = metrics.counter('rubik_solution_store_lookups_total', 'solution store lookups, by result', ('result',))
 
 def _solve(params):
     """Return rotates needed to solve input cube"""
@@ -22,20 +47,18 @@ def _solve(params):
     if not CubeCode.isValid(cube):
         return __invalidCubeError__()
     
-    # solve the cube, i.e. obtain rotations to solve it
-    solver = CubeSolver(cube)
-    rotations = solver.getSolution()
+    # reject cubes that cannot be solved before spending any time trying to
+    solvability = verify._checkSolvable(cube)
+    
+    if solvability != verify.STATUS_OK:
+        return {'status': solvability}
+    
+    # solve the cube, i.e. obtain rotation codes to solve it
+    try:
+        rotationCodes = _cachedSolveCube(cube)
+    except SolveBudgetExceeded:
+        return __budgetExceededError__()
     
-    # loop thru rotations and convert them to rotation codes
-    rotationCodes = ''
-    for (facePosition, direction) in rotations:
-        rotationCode = facePosition.value
-        
-        if direction is FaceRotationDirection.COUNTERCLOCKWISE:
-            rotationCode = rotationCode.lower()
-        
-        rotationCodes += rotationCode
-        
     # make hash token
     initVector = cube + rotationCodes
     tokenLength = 8
@@ -55,6 +78,68 @@ def _solve(params):
     
     return result
 
+def _cachedSolveCube(cube: str) -> str:
+    """ returns the rotation codes that solve a valid cube code, reusing cached solutions """
+    
+    cache = solveCache.getCache()
+    store = solutionStore.getStore()
+    
+    # cubes differing only by their orientation or color scheme share a solution,
+    # cached in the frame of their canonical representative
+    (cacheKey, orientation) = cubeSymmetry.canonicalize(cube)
+    
+    canonicalRotationCodes = cache.get(cacheKey)
+    _CACHE_LOOKUPS.inc(labels = ('miss' if canonicalRotationCodes is None else 'hit',))
+    
+    # solutions missing from the in-process cache may have been persisted before a restart
+    if canonicalRotationCodes is None and store is not None:
+        canonicalRotationCodes = store.get(cacheKey)
+        _STORE_LOOKUPS.inc(labels = ('miss' if canonicalRotationCodes is None else 'hit',))
+        
+        if canonicalRotationCodes is not None:
+            cache.put(cacheKey, canonicalRotationCodes)
+    
+    # only solve cubes that have not been solved before, solving their canonical representative
+    # so every orientation of a cube gets the same solution whatever the cache already holds
+    if canonicalRotationCodes is None:
+        canonicalRotationCodes = _solveCube(cacheKey)
+        
+        cache.put(cacheKey, canonicalRotationCodes)
+        
+        if store is not None:
+            store.put(cacheKey, canonicalRotationCodes)
+    
+    return cubeSymmetry.fromCanonicalRotations(canonicalRotationCodes, orientation)
+
+def _solveCube(cube: str) -> str:
+    """ returns the rotation codes that solve a valid cube code """
+    
+    timeLimit = float(os.environ.get(TIME_LIMIT_VARIABLE, DEFAULT_TIME_LIMIT))
+    sampleRate = float(os.environ.get(STATS_SAMPLE_RATE_VARIABLE, DEFAULT_STATS_SAMPLE_RATE))
+    
+    # only a sample of solves pay for instrumentation, enough to see where solves spend their time
+    instrument = sampleRate > 0.0 and random.random() < sampleRate
+    
+    # the cube code was validated before being solved
+    solver = CubeSolver(CubeCode(cube, validated = True), timeLimit = timeLimit, instrument = instrument)
+    rotations = solver.getSolution()
+    
+    # aggregate where the sampled solves spent their time and moves across the process
+    if instrument:
+        solver.stats.observe()
+    
+    # loop thru rotations and convert them to rotation codes
+    rotationCodes = ''
+    for (facePosition, direction) in rotations:
+        rotationCode = facePosition.value
+        
+        if direction is FaceRotationDirection.COUNTERCLOCKWISE:
+            rotationCode = rotationCode.lower()
+        
+        rotationCodes += rotationCode
+    
+    return rotationCodes
+
 def __missingCubeError__():
     """ returns error for missing cube param """
     
@@ -63,4 +148,9 @@ def __missingCubeError__():
 def __invalidCubeError__():
     """ returns error for invalid cube param """
     
-    return {'status': ERROR_INVALID_CUBE}
\ No newline at end of file
+    return {'status': ERROR_INVALID_CUBE}
+
+def __budgetExceededError__():
+    """ returns error for a cube that could not be solved within budget """
+    
+    return {'status': ERROR_BUDGET_EXCEEDED}
\ No newline at end of file
@@ -0,0 +1,16 @@
+class SolveBudgetExceeded(Exception):
+    """ raised when a CubeSolver runs out of its budget of moves, iterations, or time before solving a cube """
+    
+    def __init__(self, stage: str, budget: str, limit):
+        """ records the stage being solved, which budget ran out, and what its limit was """
+        
+        super().__init__(stage, budget, limit)
+        
+        self.stage = stage
+        self.budget = budget
+        self.limit = limit
+    
+    def __str__(self):
+        """ describes which budget ran out, and where """
+        
+        return '%s budget of %s exceeded while solving %s' % (self.budget, self.limit, self.stage)
@@ -0,0 +1,151 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from rubik.cacheBackend import CacheBackend, SharedMemoryCache
+
+# environment variables configuring the process-wide solve cache
+CACHE_SIZE_VARIABLE = 'RUBIK_SOLVE_CACHE_SIZE'
+CACHE_TTL_VARIABLE = 'RUBIK_SOLVE_CACHE_TTL'
+CACHE_BACKEND_VARIABLE = 'RUBIK_SOLVE_CACHE_BACKEND'
+
+# backends the process-wide cache can be configured to use, local to this process by default
+LOCAL_BACKEND = 'local'
+SHARED_BACKEND = 'shared'
+
+# how many solutions the process-wide cache retains by default
+DEFAULT_CACHE_SIZE = 10000
+
+class SolveCache(CacheBackend):
+    """ a bounded, least recently used cache of the rotation codes that solve cube codes """
+    
+    def __init__(self, maxSize: int = DEFAULT_CACHE_SIZE, ttl: float = None, clock = time.monotonic):
+        """ instantiates an empty cache holding at most maxSize solutions, each for at most ttl seconds """
+        
+        # ensure params are valid
+        assert isinstance(maxSize, int) and maxSize >= 0
+        assert ttl is None or ttl > 0
+        
+        self.maxSize = maxSize
+        self.ttl = ttl
+        
+        self._clock = clock
+        self._lock = threading.Lock()
+        
+        # cube code -> (rotation codes, expiry time), least recently used first
+        self._entries = OrderedDict()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, cube: str) -> str | None:
+        """ returns the cached rotation codes that solve a cube code, or None if not cached """
+        
+        with self._lock:
+            entry = self._entries.get(cube)
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            (rotationCodes, expiry) = entry
+            
+            # expired entries are dropped on access
+            if expiry is not None and expiry <= self._clock():
+                del self._entries[cube]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(cube)
+            self.hits += 1
+            
+            return rotationCodes
+    
+    def put(self, cube: str, rotationCodes: str):
+        """ caches the rotation codes that solve a cube code """
+        
+        # a cache of size 0 is disabled
+        if self.maxSize == 0:
+            return
+        
+        expiry = None if self.ttl is None else self._clock() + self.ttl
+        
+        with self._lock:
+            self._entries[cube] = (rotationCodes, expiry)
+            self._entries.move_to_end(cube)
+            
+            # evict least recently used entries beyond the size limit
+            while len(self._entries) > self.maxSize:
+                self._entries.popitem(last = False)
+                self.evictions += 1
+    
+    def clear(self):
+        """ removes all cached solutions and resets the counters """
+        
+        with self._lock:
+            self._entries.clear()
+            
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def __len__(self):
+        """ how many solutions are cached """
+        
+        with self._lock:
+            return len(self._entries)
+    
+    def getStats(self):
+        """ returns the hit, miss, and eviction counters along with the cache size """
+        
+        # read everything under the lock, so the counters and size are from the same moment
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxSize': self.maxSize
+            }
+
+def getCache():
+    """ returns the process-wide solve cache, configured by the environment unless set explicitly """
+    
+    global _cache
+    
+    if _cache is None:
+        backend = os.environ.get(CACHE_BACKEND_VARIABLE, LOCAL_BACKEND)
+        maxSize = int(os.environ.get(CACHE_SIZE_VARIABLE, DEFAULT_CACHE_SIZE))
+        ttl = os.environ.get(CACHE_TTL_VARIABLE)
+        ttl = float(ttl) if ttl else None
+        
+        # a misconfigured cache is reported as such, rather than as a failed check
+        if backend not in (LOCAL_BACKEND, SHARED_BACKEND):
+            raise ValueError('%s must be %r or %r, not %r' % (CACHE_BACKEND_VARIABLE, LOCAL_BACKEND, SHARED_BACKEND, backend))
+        
+        # shared memory entries have no room for an expiry time
+        if backend == SHARED_BACKEND and ttl is not None:
+            raise ValueError('%s is not supported by the %r backend, whose solutions never expire' % (CACHE_TTL_VARIABLE, SHARED_BACKEND))
+        
+        # a cache of size 0 is disabled, whatever its backend
+        if backend == SHARED_BACKEND and maxSize > 0:
+            _cache = SharedMemoryCache(slots = maxSize)
+        else:
+            _cache = SolveCache(maxSize, ttl)
+    
+    return _cache
+
+def setCache(cache: CacheBackend):
+    """ replaces the process-wide solve cache, e.g. with a NetworkCache around a cache server client """
+    
+    global _cache
+    
+    # ensure params are valid
+    assert isinstance(cache, CacheBackend)
+    
+    _cache = cache
+
+_cache = None
@@ -0,0 +1,153 @@
+import functools
+import time
+
+import rubik.metrics as metrics
+
+# upper bounds of the buckets that section move and predicate counts are observed into
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, float('inf'))
+
+# names of the cube's predicates, whose evaluations are counted
+PREDICATE_NAMES = (
+    'hasUpDaisy',
+    'hasDownCross',
+    'isDownLayerSolved',
+    'isMiddleLayerSolved',
+    'hasUpCross',
+    'isUpFaceSolved',
+    'isUpEdgesSolved',
+    'isUpCornersSolved',
+    'isUpLayerSolved',
+)
+
+class SolveStats:
+    """
+    where the time, moves, and predicate evaluations of a CubeSolver's solve went,
+    totalled for each of its stages and helpers, each including the sections it calls
+    """
+    
+    def __init__(self, clock = time.perf_counter):
+        """ instantiates empty stats """
+        
+        self._clock = clock
+        
+        self.moves = 0
+        self.predicates = 0
+        
+        # section name -> [calls, seconds, moves, predicates]
+        self._sections = {}
+    
+    def enter(self):
+        """ starts timing a call of a section, returning what exit needs to total it """
+        
+        return (self._clock(), self.moves, self.predicates)
+    
+    def exit(self, section: str, entered):
+        """ totals a call of a section, given what enter returned """
+        
+        (startTime, startMoves, startPredicates) = entered
+        
+        totals = self._sections.get(section)
+        
+        if totals is None:
+            totals = self._sections[section] = [0, 0.0, 0, 0]
+        
+        totals[0] += 1
+        totals[1] += self._clock() - startTime
+        totals[2] += self.moves - startMoves
+        totals[3] += self.predicates - startPredicates
+    
+    def getSections(self):
+        """ returns the calls, seconds, moves, and predicate evaluations of each section """
+        
+        return {
+            section: {
+                'calls': calls,
+                'seconds': seconds,
+                'moves': moves,
+                'predicates': predicates
+            }
+            for (section, (calls, seconds, moves, predicates)) in self._sections.items()
+        }
+    
+    def observe(self):
+        """ adds each section's totals to the process-wide histograms """
+        
+        for (section, (_, seconds, moves, predicates)) in self._sections.items():
+            _SECTION_SECONDS.observe(seconds, (section,))
+            _SECTION_MOVES.observe(moves, (section,))
+            _SECTION_PREDICATES.observe(predicates, (section,))
+
+def instrumented(method):
+    """ decorates a CubeSolver method so its calls are totalled as a section, when the solver has stats """
+    
+    # unchecked variants total into the same section as the methods they stand in for
+    section = method.__name__.lstrip('_').removesuffix('Unchecked')
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stats = self.stats
+        
+        if stats is None:
+            return method(self, *args, **kwargs)
+        
+        entered = stats.enter()
+        
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            stats.exit(section, entered)
+    
+    return wrapper
+
+class CountingCube:
+    """ wraps a cube so that evaluations of its predicates are counted in stats """
+    
+    def __init__(self, cube, stats: SolveStats):
+        """ wraps a cube, counting into stats """
+        
+        self._cube = cube
+        self._stats = stats
+        
+        for name in PREDICATE_NAMES:
+            setattr(self, name, self._counted(getattr(cube, name)))
+    
+    def _counted(self, predicate):
+        """ wraps a predicate of the cube so its evaluations are counted """
+        
+        stats = self._stats
+        
+        def counted():
+            stats.predicates += 1
+            return predicate()
+        
+        return counted
+    
+    def __getitem__(self, coord):
+        """ forwards indexing to the cube """
+        
+        return self._cube[coord]
+    
+    def __getattr__(self, name):
+        """ forwards everything else to the cube """
+        
+        return getattr(self._cube, name)
+
+_SECTION_SECONDS = metrics.histogram(
+    'rubik_solve_section_seconds',
+    'wall time spent in each stage and helper of a solve, for the sampled solves set by RUBIK_SOLVE_STATS_SAMPLE_RATE',
+    labelNames = ('section',)
+)
+
+_SECTION_MOVES = metrics.histogram(
+    'rubik_solve_section_moves',
+    'moves made in each stage and helper of a solve, for the sampled solves set by RUBIK_SOLVE_STATS_SAMPLE_RATE',
+    COUNT_BUCKETS,
+    labelNames = ('section',)
+)
+
+_SECTION_PREDICATES = metrics.histogram(
+    'rubik_solve_section_predicates',
+    'cube predicates evaluated in each stage and helper of a solve, for the sampled solves set by RUBIK_SOLVE_STATS_SAMPLE_RATE',
+    COUNT_BUCKETS,
+    labelNames = ('section',)
+)
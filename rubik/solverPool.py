@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import rubik.batch as batch
+import rubik.metrics as metrics
+import rubik.runtimeChecks as runtimeChecks
+import rubik.solve as solve
+
+# environment variable holding the size of the shared pool, unset or 0 disables it
+POOL_SIZE_VARIABLE = 'RUBIK_SOLVER_POOL_SIZE'
+
+# how many items are sent to a worker process at a time
+DEFAULT_CHUNK_SIZE = 16
+
+# cube solved by each worker process as it starts, to warm up imports and caches
+WARM_UP_CUBE = 'boyybbowrrywrrowrgbgyygwwbgbgogoryggrooyybybgwobrwwowr'
+
+class SolverPool:
+    """ fans cube solves out across a pool of worker processes """
+    
+    def __init__(self, size: int = None, chunkSize: int = DEFAULT_CHUNK_SIZE):
+        """ starts a pool of worker processes, one per core by default """
+        
+        # ensure params are valid
+        assert size is None or (isinstance(size, int) and size > 0)
+        assert isinstance(chunkSize, int) and chunkSize > 0
+        
+        self.size = size or os.cpu_count() or 1
+        self.chunkSize = chunkSize
+        
+        # workers are started by a fork server rather than forked from this process, whose other
+        # threads may hold locks that a forked worker would inherit held, and check at runtime
+        # only if this process does
+        self._executor = ProcessPoolExecutor(
+            max_workers = self.size,
+            mp_context = multiprocessing.get_context('forkserver'),
+            initializer = _warmUp,
+            initargs = (runtimeChecks.isEnabled(),)
+        )
+        self._preWarm()
+    
+    def _preWarm(self):
+        """ starts every worker process up front, so the first batch does not pay for it """
+        
+        futures = [self._executor.submit(os.getpid) for _ in range(self.size)]
+        
+        for future in futures:
+            future.result()
+    
+    def dispatch(self, items):
+        """ returns the dispatched result of each batch item, in order """
+        
+        results = []
+        
+        # metrics recorded by the workers are counted here, where they are scraped
+        for (result, drained) in self._executor.map(_dispatchItem, items, chunksize = self.chunkSize):
+            metrics.merge(drained)
+            results.append(result)
+        
+        return results
+    
+    def close(self):
+        """ shuts down the worker processes """
+        
+        self._executor.shutdown()
+    
+    def __enter__(self):
+        """ lets the pool be used as a context manager """
+        
+        return self
+    
+    def __exit__(self, *exc):
+        """ shuts down the worker processes when leaving the context """
+        
+        self.close()
+
+def getPool():
+    """ returns the process-wide pool configured by the environment, or None if disabled """
+    
+    global _pool
+    
+    if _pool is None:
+        size = int(os.environ.get(POOL_SIZE_VARIABLE, '0') or '0')
+        
+        if size > 0:
+            _pool = SolverPool(size)
+    
+    return _pool
+
+def _warmUp(checksEnabled: bool = True):
+    """ runs once in each worker process as it starts """
+    
+    if checksEnabled:
+        runtimeChecks.enable()
+    else:
+        runtimeChecks.disable()
+    
+    solve._solveCube(WARM_UP_CUBE)
+    
+    # warming up is not a request, so its metrics are not handed to the parent process
+    metrics.drain()
+
+def _dispatchItem(item):
+    """ dispatches a batch item in a worker process, returning its result and the metrics it recorded """
+    
+    result = batch._dispatchItem(item)
+    
+    return (result, metrics.drain())
+
+_pool = None
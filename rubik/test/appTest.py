@@ -0,0 +1,132 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+import app
+import rubik.batch as batch
+import rubik.metrics as metrics
+import rubik.runtimeChecks as runtimeChecks
+
+# importing the app disables runtime checks as servers do, which the other tests rely on
+runtimeChecks.enable()
+
+SCRAMBLED_CUBE = 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'
+
+class AppTest(TestCase):
+    
+    def setUp(self):
+        self.client = app.app.test_client()
+    
+    ''' /rubik -- POSITIVE TESTS '''
+    
+    def test_app_rubik_20010_ShouldRespondWithCompactJsonByDefault(self):
+        """ a request without a format param or Accept header should get compact JSON """
+        
+        response = self.client.get('/rubik', query_string = {'op': 'solve', 'cube': SCRAMBLED_CUBE})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(json.loads(response.get_data(as_text = True))['status'], 'ok')
+        self.assertNotIn('\n', response.get_data(as_text = True))
+    
+    def test_app_rubik_20020_ShouldRespondWithLegacyReprWhenAskedFor(self):
+        """ the format param, or an Accept header preferring text/plain, should get the legacy str(dict) repr """
+        
+        byParam = self.client.get('/rubik', query_string = {'op': 'solve', 'format': 'legacy'})
+        byAccept = self.client.get('/rubik', query_string = {'op': 'solve'}, headers = {'Accept': 'text/plain'})
+        
+        for response in (byParam, byAccept):
+            self.assertEqual(response.mimetype, 'text/plain')
+            self.assertEqual(response.get_data(as_text = True), "{'status': 'error: missing cube'}")
+    
+    def test_app_rubik_20030_ShouldRespondWithPrettyJsonWhenAskedFor(self):
+        """ the pretty format should get indented JSON, and take precedence over the Accept header """
+        
+        response = self.client.get('/rubik', query_string = {'op': 'solve', 'format': 'pretty'}, headers = {'Accept': 'text/plain'})
+        
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_data(as_text = True), '{\n  "status": "error: missing cube"\n}')
+    
+    ''' /rubik/batch -- NEGATIVE TESTS '''
+    
+    def test_app_batch_10010_ShouldRejectBodyThatIsNotList(self):
+        """ a batch that is not a list of items should get a client error with a JSON status """
+        
+        for body in ('{"op": "solve"}', '[{"op": '):
+            response = self.client.post('/rubik/batch', data = body, content_type = 'application/json')
+            
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.mimetype, 'application/json')
+            self.assertEqual(response.get_json(), {'status': batch.ERROR_INVALID_BATCH})
+    
+    def test_app_batch_10020_ShouldRejectBatchThatFailsWithJsonError(self):
+        """ a batch that raises while being dispatched should get a client error with a JSON status """
+        
+        with patch.object(batch, '_batch', side_effect = ValueError('bad batch')):
+            response = self.client.post('/rubik/batch', data = '[]', content_type = 'application/json')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {'status': 'error: bad batch'})
+    
+    ''' /rubik/batch -- POSITIVE TESTS '''
+    
+    def test_app_batch_20010_ShouldReturnResultOfEachJsonItemInOrder(self):
+        """ a JSON array of items should get a JSON array of their results, in order """
+        
+        items = [{'op': 'solve', 'cube': SCRAMBLED_CUBE}, {'op': 'solve'}, {'op': 'bogus'}]
+        
+        response = self.client.post('/rubik/batch', json = items)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(
+            [result['status'] for result in response.get_json()],
+            ['ok', 'error: missing cube', 'error: op is not legal']
+        )
+    
+    def test_app_batch_20020_ShouldReturnResultOfEachNdjsonItemAsNdjson(self):
+        """ NDJSON items should get NDJSON results, with unparsable lines reported in place """
+        
+        body = '{"op": "solve"}\n{"op": \n\n{"op": "bogus"}\n'
+        
+        response = self.client.post('/rubik/batch', data = body, content_type = batch.NDJSON_CONTENT_TYPE)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, batch.NDJSON_CONTENT_TYPE)
+        self.assertEqual(
+            [json.loads(line)['status'] for line in response.get_data(as_text = True).splitlines()],
+            ['error: missing cube', batch.ERROR_INVALID_ITEM, 'error: op is not legal']
+        )
+    
+    ''' /rubik/stream -- POSITIVE TESTS '''
+    
+    def test_app_stream_20010_ShouldStreamResultOfEachLineInOrder(self):
+        """ NDJSON lines should be streamed back as NDJSON results, in order """
+        
+        body = '{"op": "solve", "cube": "%s"}\nnot json\n{"op": "solve"}\n' % SCRAMBLED_CUBE
+        
+        response = self.client.post('/rubik/stream', data = body, content_type = batch.NDJSON_CONTENT_TYPE)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, batch.NDJSON_CONTENT_TYPE)
+        self.assertEqual(
+            [json.loads(line)['status'] for line in response.get_data(as_text = True).splitlines()],
+            ['ok', batch.ERROR_INVALID_ITEM, 'error: missing cube']
+        )
+    
+    ''' /metrics -- POSITIVE TESTS '''
+    
+    def test_app_metrics_20010_ShouldRenderMetricsOfRequestsServed(self):
+        """ metrics should be served in the Prometheus text format, counting the ops dispatched """
+        
+        counter = metrics.REGISTRY['rubik_op_requests_total']
+        before = counter.getSnapshot().get(('create', 'ok'), 0)
+        
+        self.client.get('/rubik', query_string = {'op': 'create'})
+        response = self.client.get('/metrics')
+        text = response.get_data(as_text = True)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, metrics.CONTENT_TYPE)
+        self.assertIn('# TYPE rubik_op_requests_total counter\n', text)
+        self.assertIn('rubik_op_requests_total{op="create",status="ok"} %d\n' % (before + 1), text)
@@ -0,0 +1,114 @@
+import json
+from unittest import TestCase
+
+import rubik.batch as batch
+import rubik.dispatch as dispatch
+import rubik.rotate as rotate
+import rubik.solve as solve
+
+class BatchTest(TestCase):
+    
+    ''' batch -- NEGATIVE TESTS '''
+    
+    def test_batch_10010_ShouldErrorOnBatchThatIsNotAList(self):
+        """ supplying a batch that is not a list should result in error status """
+        
+        result = batch._batch({'op': 'solve'})
+        
+        self.assertIn('status', result)
+        self.assertEqual(result['status'], batch.ERROR_INVALID_BATCH)
+    
+    def test_batch_10020_ShouldErrorOnBodyThatIsNotJson(self):
+        """ supplying a body that is not JSON should result in error status """
+        
+        result = batch._batch(batch._parseItems('[{"op": "solve"'))
+        
+        self.assertEqual(result['status'], batch.ERROR_INVALID_BATCH)
+    
+    def test_batch_10030_ShouldReportItemErrorsWithoutFailingBatch(self):
+        """ invalid items should get the same error status as single requests, in order """
+        
+        results = batch._batch([
+            {'op': 'solve'},
+            {'op': 'rotate', 'cube': 'bryogw'},
+            'not a dictionary',
+            {'op': 'solve', 'cube': 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'},
+        ])
+        
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0]['status'], solve.ERROR_MISSING_CUBE)
+        self.assertEqual(results[1]['status'], rotate.ERROR_INVALID_CUBE)
+        self.assertEqual(results[2]['status'], dispatch.ERROR02)
+        self.assertEqual(results[3]['status'], 'ok')
+    
+    def test_batch_10040_ShouldErrorOnNdjsonLineThatIsNotJson(self):
+        """ an NDJSON line that is not JSON should only fail its own item """
+        
+        body = '{"op": "create"}\n{"op": \n{"op": "nop"}\n'
+        results = batch._batch(batch._parseItems(body, isNdjson = True))
+        
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['status'], 'ok')
+        self.assertEqual(results[1]['status'], batch.ERROR_INVALID_ITEM)
+        self.assertEqual(results[2]['status'], dispatch.ERROR03)
+    
+    ''' batch -- POSITIVE TESTS '''
+    
+    def test_batch_20010_ShouldMatchSingleDispatchForEachItem(self):
+        """ each batch result should match dispatching the item on its own """
+        
+        items = [
+            {'op': 'rotate', 'cube': 'rybybrygyoyrbrwrrygggogybggwbwrobwogorywyobgwowbbwwroo', 'dir': 'FRu'},
+            {'op': 'rotate', 'cube': 'wrbbbwyyrywbbrgwywobrwggggggorooryrbyowwyrgyorbbgwooyo', 'dir': 'd'},
+        ]
+        
+        results = batch._batch(batch._parseItems(json.dumps(items)))
+        
+        self.assertEqual(results, [dispatch._dispatch(item) for item in items])
+    
+    def test_batch_20020_ShouldFormatNdjsonResultsOnePerLine(self):
+        """ NDJSON results should be serialized one JSON result per line """
+        
+        results = [{'status': 'ok'}, {'status': batch.ERROR_INVALID_ITEM}]
+        lines = batch._formatResults(results, isNdjson = True).splitlines()
+        
+        self.assertEqual([json.loads(line) for line in lines], results)
+    
+    ''' batch._streamResults -- POSITIVE TESTS '''
+    
+    def test_batch_streamResults_20010_ShouldYieldEachResultBeforeReadingNextLine(self):
+        """ without a pool, each line's result should be yielded before the next line is read """
+        
+        item = {'op': 'rotate', 'cube': 'rybybrygyoyrbrwrrygggogybggwbwrobwogorywyobgwowbbwwroo', 'dir': 'F'}
+        linesRead = []
+        
+        def lines():
+            for number in range(3):
+                linesRead.append(number)
+                yield (json.dumps(item) + '\n').encode()
+        
+        results = batch._streamResults(lines())
+        
+        self.assertEqual(json.loads(next(results)), dispatch._dispatch(item))
+        self.assertEqual(linesRead, [0])
+        self.assertEqual(len(list(results)), 2)
+    
+    def test_batch_streamResults_20020_ShouldDispatchWindowsThroughPool(self):
+        """ with a pool, lines should be dispatched in windows, keeping results in order and skipping blank lines """
+        
+        class RecordingPool:
+            def __init__(self):
+                self.windows = []
+            
+            def dispatch(self, items):
+                self.windows.append(len(items))
+                return [batch._dispatchItem(item) for item in items]
+        
+        pool = RecordingPool()
+        lines = [b'{"op": "create"}\n', b'\n', b'not json\n'] * 10
+        
+        output = ''.join(batch._streamResults(lines, pool, windowSize = 8))
+        statuses = [json.loads(line)['status'] for line in output.splitlines()]
+        
+        self.assertEqual(statuses, ['ok', batch.ERROR_INVALID_ITEM] * 10)
+        self.assertEqual(pool.windows, [8, 8])
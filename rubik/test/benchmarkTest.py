@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.runtimeChecks as runtimeChecks
+import rubik.sandbox.benchmark as benchmark
+
+def _report(medians: dict, runtimeChecksEnabled: bool = False) -> dict:
+    """ a report of benchmarks with the given median times """
+    
+    return {
+        'version': benchmark.FORMAT_VERSION,
+        'seed': benchmark.DEFAULT_SEED,
+        'scrambles': benchmark.DEFAULT_SCRAMBLES,
+        'repeats': benchmark.DEFAULT_REPEATS,
+        'runtimeChecks': runtimeChecksEnabled,
+        'benchmarks': {name: {'p50': median} for (name, median) in medians.items()}
+    }
+
+class BenchmarkTest(TestCase):
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+        runtimeChecks.enable()
+    
+    ''' benchmark._compare -- NEGATIVE TESTS '''
+    
+    def test_benchmark_compare_10010_ShouldFlagMediansSlowerThanThreshold(self):
+        """ a median slower than its baseline by more than the threshold should be a regression """
+        
+        baseline = _report({'cube.init': 1.0, 'cube.toCode': 1.0})
+        report = _report({'cube.init': 1.2, 'cube.toCode': 1.1})
+        
+        (lines, regressions) = benchmark._compare(baseline, report, 0.15)
+        
+        self.assertEqual(regressions, ['cube.init'])
+        self.assertIn('REGRESSED', lines[0])
+        self.assertEqual(lines[-1], '1 of 2 benchmarks regressed by more than 15%')
+    
+    def test_benchmark_compare_10020_ShouldWarnOfBaselineMeasuredWithOtherRuntimeChecks(self):
+        """ a baseline measured with runtime checks set differently should be called out as not comparable """
+        
+        baseline = _report({'cube.init': 1.0}, runtimeChecksEnabled = True)
+        report = _report({'cube.init': 1.0})
+        
+        (lines, regressions) = benchmark._compare(baseline, report)
+        
+        self.assertEqual(regressions, [])
+        self.assertIn('runtime checks enabled', lines[0])
+    
+    ''' benchmark._compare -- POSITIVE TESTS '''
+    
+    def test_benchmark_compare_20010_ShouldNotFlagMediansWithinThreshold(self):
+        """ medians faster, or slower by no more than the threshold, and new benchmarks should not be regressions """
+        
+        baseline = _report({'cube.init': 1.0, 'cube.toCode': 1.0})
+        report = _report({'cube.init': 0.5, 'cube.toCode': 1.15, 'cubeCode.isValid': 1.0})
+        
+        (lines, regressions) = benchmark._compare(baseline, report, 0.15)
+        
+        self.assertEqual(regressions, [])
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[2].endswith('new'))
+    
+    ''' benchmark.main -- POSITIVE TESTS '''
+    
+    def test_benchmark_main_20010_ShouldGateOnRegressionsWithoutRuntimeChecks(self):
+        """ running against a baseline should exit 1 only if it regressed, measuring with runtime checks disabled """
+        
+        output = os.path.join(self.directory.name, 'report.json')
+        slower = os.path.join(self.directory.name, 'slower.json')
+        faster = os.path.join(self.directory.name, 'faster.json')
+        
+        argv = ['--only', 'cube.init', '--scrambles', '2', '--repeats', '1', '-o', output]
+        
+        with patch.dict(os.environ), patch('sys.stderr'):
+            os.environ.pop(runtimeChecks.CHECKS_VARIABLE, None)
+            
+            self.assertEqual(benchmark.main(argv), 0)
+            
+            with open(output) as file:
+                report = json.load(file)
+            
+            self.assertFalse(report['runtimeChecks'])
+            
+            with open(slower, 'w') as file:
+                json.dump(report | {'benchmarks': {'cube.init': {'p50': 1e3}}}, file)
+            
+            with open(faster, 'w') as file:
+                json.dump(report | {'benchmarks': {'cube.init': {'p50': 1e-12}}}, file)
+            
+            self.assertEqual(benchmark.main(argv + ['--compare', slower]), 0)
+            self.assertEqual(benchmark.main(argv + ['--compare', faster]), 1)
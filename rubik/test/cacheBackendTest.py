@@ -0,0 +1,231 @@
+import multiprocessing
+import os
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.solve as solve
+import rubik.solveCache as solveCache
+from rubik.cacheBackend import CacheBackend, SharedMemoryCache, NetworkCache, LocalNetworkClient, SHARED_VALUE_WIDTH, _SEQUENCE
+
+SOLVED_CUBE = 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'
+SCRAMBLED_CUBE = 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'
+
+def _putFromWorker(name, cube, rotationCodes):
+    """ caches a solution from another process """
+    
+    cache = SharedMemoryCache(name)
+    cache.put(cube, rotationCodes)
+    cache.close()
+
+class CacheBackendTest(TestCase):
+    
+    def setUp(self):
+        self.name = 'rubik_test_%d_%d' % (os.getpid(), id(self))
+        self.cache = SharedMemoryCache(self.name, 16)
+    
+    def tearDown(self):
+        self.cache.close()
+        self.cache.unlink()
+    
+    ''' CacheBackend -- NEGATIVE TESTS '''
+    
+    def test_cacheBackend_abstract_10010_ShouldNotInstantiateIncompleteBackend(self):
+        """ a backend missing any method of the interface should fail when instantiated, not when first used """
+        
+        class IncompleteCache(CacheBackend):
+            def get(self, cube: str) -> str | None:
+                return None
+        
+        with self.assertRaises(TypeError):
+            IncompleteCache()
+    
+    ''' SharedMemoryCache.__init__ -- NEGATIVE TESTS '''
+    
+    def test_cacheBackend_init_10010_ShouldThrowExceptionForNonPositiveSlots(self):
+        """ supplying 0 slots should throw exception """
+        
+        with self.assertRaises(Exception):
+            SharedMemoryCache(self.name + '_empty', 0)
+    
+    ''' SharedMemoryCache.get -- POSITIVE TESTS '''
+    
+    def test_cacheBackend_get_20010_ShouldCountHitsAndMisses(self):
+        """ looking up cached and uncached cubes should count hits and misses """
+        
+        self.cache.put(SOLVED_CUBE, '')
+        
+        self.assertEqual(self.cache.get(SOLVED_CUBE), '')
+        self.assertIsNone(self.cache.get(SCRAMBLED_CUBE))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+    
+    def test_cacheBackend_get_20020_ShouldSeeSolutionsCachedByAnotherProcess(self):
+        """ a solution cached by another process should be returned immediately """
+        
+        worker = multiprocessing.get_context('spawn').Process(
+            target = _putFromWorker, args = (self.name, SCRAMBLED_CUBE, 'FRUbl'))
+        worker.start()
+        worker.join()
+        
+        self.assertEqual(self.cache.get(SCRAMBLED_CUBE), 'FRUbl')
+    
+    def test_cacheBackend_get_20030_ShouldAttachToExistingSegmentSize(self):
+        """ attaching to an existing segment should keep its number of slots """
+        
+        other = SharedMemoryCache(self.name, 1024)
+        
+        self.assertEqual(other.slots, 16)
+        
+        other.close()
+    
+    ''' SharedMemoryCache.put -- POSITIVE TESTS '''
+    
+    def test_cacheBackend_put_20010_ShouldReplaceSolutionOfSameCube(self):
+        """ caching a cube again should replace its solution in place """
+        
+        self.cache.put(SCRAMBLED_CUBE, 'FRUbl')
+        self.cache.put(SCRAMBLED_CUBE, 'LLL')
+        
+        self.assertEqual(self.cache.get(SCRAMBLED_CUBE), 'LLL')
+        self.assertEqual(len(self.cache), 1)
+    
+    def test_cacheBackend_put_20020_ShouldEvictWhenProbedSlotsAreFull(self):
+        """ a cube whose slots are all taken should evict the entry in its home slot """
+        
+        cache = SharedMemoryCache(self.name + '_one', 1)
+        cache.put(SOLVED_CUBE, '')
+        cache.put(SCRAMBLED_CUBE, 'FRUbl')
+        
+        self.assertIsNone(cache.get(SOLVED_CUBE))
+        self.assertEqual(cache.get(SCRAMBLED_CUBE), 'FRUbl')
+        self.assertEqual(cache.evictions, 1)
+        
+        cache.close()
+        cache.unlink()
+    
+    def test_cacheBackend_put_20030_ShouldNotCacheSolutionsWiderThanSlot(self):
+        """ a solution longer than a slot holds should not be cached """
+        
+        self.cache.put(SCRAMBLED_CUBE, 'F' * (SHARED_VALUE_WIDTH + 1))
+        
+        self.assertIsNone(self.cache.get(SCRAMBLED_CUBE))
+    
+    def test_cacheBackend_put_20040_ShouldRecoverSlotLeftHalfWritten(self):
+        """ a slot left odd by a writer that died should read as a miss, and be repaired by the next write """
+        
+        self.cache.put(SCRAMBLED_CUBE, 'FRUbl')
+        
+        home = next(self.cache._probe(SCRAMBLED_CUBE.encode('ascii')))
+        _SEQUENCE.pack_into(self.cache._memory.buf, home, _SEQUENCE.unpack_from(self.cache._memory.buf, home)[0] + 1)
+        
+        self.assertIsNone(self.cache.get(SCRAMBLED_CUBE))
+        
+        self.cache.put(SCRAMBLED_CUBE, 'LLL')
+        
+        self.assertEqual(self.cache.get(SCRAMBLED_CUBE), 'LLL')
+        self.assertEqual(_SEQUENCE.unpack_from(self.cache._memory.buf, home)[0] % 2, 0)
+    
+    def test_cacheBackend_put_20050_ShouldSerializeWritersAcrossThreads(self):
+        """ threads of one process should hold the write lock one at a time """
+        
+        holders = []
+        overlaps = []
+        
+        def write():
+            with self.cache._locked():
+                holders.append(threading.get_ident())
+                overlaps.append(len(holders))
+                time.sleep(0.001)
+                holders.remove(threading.get_ident())
+        
+        threads = [threading.Thread(target = write) for _ in range(8)]
+        
+        for thread in threads:
+            thread.start()
+        
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(max(overlaps), 1)
+    
+    ''' SharedMemoryCache.unlink -- POSITIVE TESTS '''
+    
+    def test_cacheBackend_unlink_20010_ShouldRemoveLockFile(self):
+        """ destroying a segment should also remove the lock file its writers share """
+        
+        cache = SharedMemoryCache(self.name + '_unlinked', 1)
+        path = cache._lockFile.name
+        
+        cache.close()
+        cache.unlink()
+        
+        self.assertFalse(os.path.exists(path))
+    
+    ''' NetworkCache.get -- POSITIVE TESTS '''
+    
+    def test_cacheBackend_networkGet_20010_ShouldShareSolutionsThroughClient(self):
+        """ a solution cached through one network cache should be returned by another on the same server """
+        
+        client = LocalNetworkClient()
+        NetworkCache(client).put(SCRAMBLED_CUBE, 'FRUbl')
+        cache = NetworkCache(client)
+        
+        self.assertEqual(cache.get(SCRAMBLED_CUBE), 'FRUbl')
+        self.assertIsNone(cache.get(SOLVED_CUBE))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+    
+    ''' solveCache.setCache -- POSITIVE TESTS '''
+    
+    def test_cacheBackend_setCache_20010_SolveShouldUseInstalledBackend(self):
+        """ solving should cache solutions in the installed backend """
+        
+        previous = solveCache.getCache()
+        solveCache.setCache(self.cache)
+        
+        try:
+            first = solve._solve({'op': 'solve', 'cube': SCRAMBLED_CUBE})
+            second = solve._solve({'op': 'solve', 'cube': SCRAMBLED_CUBE})
+        finally:
+            solveCache.setCache(previous)
+        
+        self.assertEqual(second['rotations'], first['rotations'])
+        self.assertEqual((self.cache.hits, len(self.cache)), (1, 1))
+    
+    ''' solveCache.getCache -- NEGATIVE TESTS '''
+    
+    def test_cacheBackend_getCache_10010_ShouldRejectUnknownBackend(self):
+        """ configuring a backend that does not exist should raise a ValueError naming the variable """
+        
+        with patch.object(solveCache, '_cache', None), patch.dict(os.environ, {solveCache.CACHE_BACKEND_VARIABLE: 'memcached'}):
+            with self.assertRaisesRegex(ValueError, solveCache.CACHE_BACKEND_VARIABLE):
+                solveCache.getCache()
+    
+    def test_cacheBackend_getCache_10020_ShouldRejectTtlOfSharedBackend(self):
+        """ configuring a ttl for the shared backend, which cannot expire solutions, should raise a ValueError """
+        
+        environ = {
+            solveCache.CACHE_BACKEND_VARIABLE: solveCache.SHARED_BACKEND,
+            solveCache.CACHE_TTL_VARIABLE: '60',
+        }
+        
+        with patch.object(solveCache, '_cache', None), patch.dict(os.environ, environ):
+            with self.assertRaisesRegex(ValueError, solveCache.CACHE_TTL_VARIABLE):
+                solveCache.getCache()
+    
+    ''' solveCache.getCache -- POSITIVE TESTS '''
+    
+    def test_cacheBackend_getCache_20010_ShouldDisableSharedBackendOfSizeZero(self):
+        """ a shared cache of size 0 should be disabled, as a local one is, rather than fail """
+        
+        environ = {
+            solveCache.CACHE_BACKEND_VARIABLE: solveCache.SHARED_BACKEND,
+            solveCache.CACHE_SIZE_VARIABLE: '0',
+        }
+        
+        with patch.object(solveCache, '_cache', None), patch.dict(os.environ, environ):
+            cache = solveCache.getCache()
+            
+            cache.put(SCRAMBLED_CUBE, 'FRUbl')
+            
+            self.assertIsNone(cache.get(SCRAMBLED_CUBE))
@@ -2,6 +2,7 @@
 from unittest import TestCase
 
 from rubik.cubeCode import CubeCode
+from rubik.cubeCodeValidity import CubeCodeValidity
 
 class CubeCodeTest(TestCase):
     
@@ -81,6 +82,13 @@ class CubeCodeTest(TestCase):
         code = CubeCode('oboybbrrggrborywwroogggbygrooyyorbobygwwygbrwwwrywbywg')
         self.assertIsInstance(code, CubeCode)
     
+    def test_cubeCode_init_20020_ShouldSkipValidationForValidatedCodeText(self):
+        """ code text flagged as already validated should not be validated again """
+        
+        cubeCode = CubeCode('not validated again', validated = True)
+        
+        self.assertEqual(cubeCode.text, 'not validated again')
+    
     ''' CubeCode.isValid -- POSITIVE TESTS '''
         
     def test_cubeCode_isValid_20010_ShouldReturnFalseForNonStringCodeText(self):
@@ -136,4 +144,27 @@ class CubeCodeTest(TestCase):
         
         result = CubeCode.isValid('bywrborrbbrrgroygogogwgygworwogoywybwbybygybowbrowwgry')
         self.assertTrue(result)
-    
\ No newline at end of file
+    
+    ''' CubeCode.validate -- POSITIVE TESTS '''
+    
+    def test_cubeCode_validate_20010_ShouldReportEachReasonForInvalidCodeText(self):
+        """ each way a code text can be invalid should be reported as its own reason """
+        
+        cases = {
+            2.3: CubeCodeValidity.NOT_A_STRING,
+            '': CubeCodeValidity.WRONG_LENGTH,
+            'gorbbgobbwgowrrwrbgwwygyyggr!rgowyybbrwwyrybgyyoowboor': CubeCodeValidity.INVALID_COLOR,
+            'gorbbgobbwgowrrwrbgwwygyyggrBrgowyybbrwwyrybgyyoowboor': CubeCodeValidity.INVALID_COLOR,
+            'ggwobgrrbrwgorrwggwwoggbrgggbrwobbrwggorgobobggowwbogg': CubeCodeValidity.MISSING_COLOR,
+            'wobrbrrryyoowrwrggggyggwrrwgyroobobborwbyyggowwbowybyb': CubeCodeValidity.UNEVEN_COLORS,
+            'gyyogroywgrygrorbwryyggbbwwbwowoboybrbgoywwooyggrwrbbr': CubeCodeValidity.DUPLICATE_CENTER_COLORS,
+        }
+        
+        for (codeText, expected) in cases.items():
+            self.assertIs(CubeCode.validate(codeText), expected)
+    
+    def test_cubeCode_validate_20020_ShouldReportValidCodeText(self):
+        """ a valid code text should be reported as valid """
+        
+        result = CubeCode.validate('bywrborrbbrrgroygogogwgygworwogoywybwbybygybowbrowwgry')
+        self.assertIs(result, CubeCodeValidity.VALID)
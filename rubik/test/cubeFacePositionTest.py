@@ -1,7 +1,9 @@
 
 from unittest import TestCase
 
+import rubik.cubeFacePosition as cubeFacePosition
 from rubik.cubeFacePosition import CubeFacePosition
+from rubik.cubeRotationDirection import CubeRotationDirection
 
 class CubeFaceTest(TestCase):
     
@@ -90,4 +92,108 @@ class CubeFaceTest(TestCase):
         actual = CubeFacePosition(faceCode)
         
         self.assertEqual(expected, actual)
-    
\ No newline at end of file
+    
+    ''' CubeFacePosition.ordinal -- POSITIVE TESTS '''
+    
+    def test_cubeFacePosition_ordinal_20010_ShouldNumberFacePositionsInDefinitionOrder(self):
+        """ face positions should be numbered 0 thru 5 in the order they are defined """
+        
+        self.assertEqual([facePosition.ordinal for facePosition in CubeFacePosition], list(range(6)))
+        self.assertEqual([direction.ordinal for direction in CubeRotationDirection], list(range(6)))
+    
+    ''' CubeFacePosition.rotate -- POSITIVE TESTS '''
+    
+    def test_cubeFacePosition_rotate_20010_ShouldFlipForwardCorrectly(self):
+        """ flipping forward should move up to front, front to down, down to back, and back to up """
+        
+        direction = CubeRotationDirection.FLIP_FORWARD
+        
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.UP, direction), CubeFacePosition.FRONT)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.FRONT, direction), CubeFacePosition.DOWN)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.DOWN, direction), CubeFacePosition.BACK)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.BACK, direction), CubeFacePosition.UP)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.LEFT, direction), CubeFacePosition.LEFT)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.RIGHT, direction), CubeFacePosition.RIGHT)
+    
+    def test_cubeFacePosition_rotate_20020_ShouldSpinLeftwardCorrectly(self):
+        """ spinning leftward should move front to left, left to back, back to right, and right to front """
+        
+        direction = CubeRotationDirection.SPIN_LEFTWARD
+        
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.FRONT, direction), CubeFacePosition.LEFT)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.LEFT, direction), CubeFacePosition.BACK)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.BACK, direction), CubeFacePosition.RIGHT)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.RIGHT, direction), CubeFacePosition.FRONT)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.UP, direction), CubeFacePosition.UP)
+        self.assertEqual(CubeFacePosition.rotate(CubeFacePosition.DOWN, direction), CubeFacePosition.DOWN)
+    
+    def test_cubeFacePosition_rotate_20030_ShouldUndoRotationWithOppositeRotation(self):
+        """ rotating in a direction then its opposite should leave every face position where it was """
+        
+        opposites = [
+            (CubeRotationDirection.FLIP_FORWARD, CubeRotationDirection.FLIP_BACKWARD),
+            (CubeRotationDirection.FLIP_LEFTWARD, CubeRotationDirection.FLIP_RIGHTWARD),
+            (CubeRotationDirection.SPIN_LEFTWARD, CubeRotationDirection.SPIN_RIGHTWARD),
+        ]
+        
+        for (direction, oppositeDirection) in opposites:
+            for facePosition in CubeFacePosition:
+                rotated = CubeFacePosition.rotate(facePosition, direction)
+                
+                self.assertEqual(CubeFacePosition.rotate(rotated, oppositeDirection), facePosition)
+    
+    ''' CubeFacePosition.rotateMany -- POSITIVE TESTS '''
+    
+    def test_cubeFacePosition_rotateMany_20010_ShouldMatchRotatingEachFacePosition(self):
+        """ rotating many face positions at once should match rotating each of them, in order """
+        
+        facePositions = [CubeFacePosition.DOWN, CubeFacePosition.FRONT, CubeFacePosition.DOWN, CubeFacePosition.LEFT]
+        
+        for direction in CubeRotationDirection:
+            self.assertEqual(
+                CubeFacePosition.rotateMany(facePositions, direction),
+                tuple(CubeFacePosition.rotate(facePosition, direction) for facePosition in facePositions)
+            )
+    
+    ''' CubeFacePosition.rotateOrdinals -- NEGATIVE TESTS '''
+    
+    def test_cubeFacePosition_rotateOrdinals_10010_ShouldRejectBytesThatAreNotOrdinals(self):
+        """ bytes that do not number a face position should not be passed thru as if they did """
+        
+        with self.assertRaises(AssertionError):
+            CubeFacePosition.rotateOrdinals(bytes([0, 6]), CubeRotationDirection.FLIP_FORWARD)
+        
+        # and even unchecked, they should not come out looking like face position ordinals
+        translated = bytes([6, 255]).translate(cubeFacePosition._ORDINAL_ROTATIONS[0])
+        
+        self.assertTrue(all(ordinal >= len(CubeFacePosition) for ordinal in translated))
+    
+    ''' CubeFacePosition.rotateOrdinals -- POSITIVE TESTS '''
+    
+    def test_cubeFacePosition_rotateOrdinals_20010_ShouldMatchRotatingEachFacePosition(self):
+        """ rotating ordinals should match rotating the face positions they number, in order """
+        
+        facePositions = list(CubeFacePosition) + [CubeFacePosition.UP]
+        ordinals = bytes(facePosition.ordinal for facePosition in facePositions)
+        
+        for direction in CubeRotationDirection:
+            self.assertEqual(
+                CubeFacePosition.rotateOrdinals(ordinals, direction),
+                bytes(CubeFacePosition.rotate(facePosition, direction).ordinal for facePosition in facePositions)
+            )
+    
+    ''' CubeFacePosition.isAdjacent -- POSITIVE TESTS '''
+    
+    def test_cubeFacePosition_isAdjacent_20010_ShouldFindFacePositionsThatRotateOntoEachOther(self):
+        """ face positions should be adjacent exactly when one rotates onto the other """
+        
+        direction = CubeRotationDirection.SPIN_LEFTWARD
+        
+        self.assertTrue(CubeFacePosition.isAdjacent(CubeFacePosition.FRONT, CubeFacePosition.LEFT, direction))
+        self.assertTrue(CubeFacePosition.isAdjacent(CubeFacePosition.LEFT, CubeFacePosition.FRONT, direction))
+        self.assertFalse(CubeFacePosition.isAdjacent(CubeFacePosition.FRONT, CubeFacePosition.BACK, direction))
+        self.assertFalse(CubeFacePosition.isAdjacent(CubeFacePosition.FRONT, CubeFacePosition.UP, direction))
+        
+        # face positions a rotation leaves in place rotate onto themselves
+        self.assertTrue(CubeFacePosition.isAdjacent(CubeFacePosition.UP, CubeFacePosition.UP, direction))
+        self.assertFalse(CubeFacePosition.isAdjacent(CubeFacePosition.FRONT, CubeFacePosition.FRONT, direction))
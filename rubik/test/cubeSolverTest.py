@@ -1,11 +1,13 @@
 
 from unittest import TestCase
+from unittest.mock import patch
 
 from rubik.cubeSolver import CubeSolver
 from rubik.cubeFacePosition import CubeFacePosition
 from rubik.faceRotationDirection import FaceRotationDirection
 from rubik.solveStage import SolveStage
 from rubik.cube import Cube
+from rubik.solveBudgetExceeded import SolveBudgetExceeded
 
 class CubeSolverTest(TestCase):
     
@@ -38,6 +40,28 @@ class CubeSolverTest(TestCase):
                 (2, 3, 1)
             )
     
+    def test_cubeSolver_init_10040_ShouldRunOutOfBudgetForUnsolvableCube(self):
+        """ a cube with a single flipped edge can never be solved, so its solve should run out of budget """
+        
+        with self.assertRaises(SolveBudgetExceeded):
+            CubeSolver('bbbobbbbbrrrrrrrrrgggggggggoooooboooyyyyyyyyywwwwwwwww')
+    
+    def test_cubeSolver_init_10050_ShouldRunOutOfMovesBudget(self):
+        """ a solve needing more moves than its budget allows should report the moves budget """
+        
+        with self.assertRaises(SolveBudgetExceeded) as context:
+            CubeSolver('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb', maxMoves = 5)
+        
+        self.assertEqual(context.exception.budget, CubeSolver.BUDGET_MOVES)
+    
+    def test_cubeSolver_init_10060_ShouldRunOutOfTimeBudget(self):
+        """ a solve taking longer than its time limit should report the time budget """
+        
+        with self.assertRaises(SolveBudgetExceeded) as context:
+            CubeSolver('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb', timeLimit = 1e-9)
+        
+        self.assertEqual(context.exception.budget, CubeSolver.BUDGET_TIME)
+    
     ''' CubeSolver.__init__ -- POSITIVE TESTS '''
     
     def test_cubeSolver_init_20010_ShouldInstantiateCubeSolverForValidCubeCode(self):
@@ -56,6 +80,19 @@ class CubeSolverTest(TestCase):
         CubeSolver(cube)
         self.assertEqual(cube.toCode(), code)
     
+    def test_cubeSolver_init_20021_ShouldSolveOwnedCubeInPlace(self):
+        """ a cube handed over to the cube solver should be solved without being copied """
+        
+        cube = Cube('rbgobbogbwyboroywwyggwgrbbyroywogogwwyoyyrgyobrrwwbgrr')
+        
+        with patch.object(Cube, 'clone') as clone:
+            CubeSolver(cube, ownsCube = True)
+        
+        clone.assert_not_called()
+        self.assertTrue(cube.isUpLayerSolved())
+        self.assertTrue(cube.isMiddleLayerSolved())
+        self.assertTrue(cube.isDownLayerSolved())
+    
     def test_cubeSolver_init_20030_ShouldSolveEntireCubeByDefault(self):
         """ supplying no cube stage should solve entire cube by default """
         
@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+import rubik.cubeSymmetry as cubeSymmetry
+import rubik.rotate as rotate
+import rubik.solve as solve
+from rubik.cube import Cube
+
+class CubeSymmetryTest(TestCase):
+    
+    ''' cubeSymmetry.canonicalizeColors -- POSITIVE TESTS '''
+    
+    def test_cubeSymmetry_canonicalizeColors_20010_SolvedCubeShouldBeCanonical(self):
+        """ the solved cube with canonical center colors should be its own canonical cube code """
+        
+        code = 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'
+        
+        self.assertEqual(cubeSymmetry.canonicalizeColors(code), code)
+    
+    def test_cubeSymmetry_canonicalizeColors_20020_RelabeledCubesShouldShareCanonicalCode(self):
+        """ cube codes differing only by a relabeling of colors should have the same canonical code """
+        
+        code = 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'
+        relabeled = code.translate(str.maketrans('bgrowy', 'gbwyor'))
+        
+        self.assertEqual(cubeSymmetry.canonicalizeColors(relabeled), cubeSymmetry.canonicalizeColors(code))
+    
+    def test_cubeSymmetry_canonicalizeColors_20030_RelabeledCubesShouldHaveSameSolution(self):
+        """ solving a relabeled cube should yield the same rotations as the original cube """
+        
+        code = 'boyybbowrrywrrowrgbgyygwwbgbgogoryggrooyybybgwobrwwowr'
+        relabeled = code.translate(str.maketrans('bgrowy', 'ywgbor'))
+        
+        self.assertEqual(solve._solveCube(relabeled), solve._solveCube(code))
+    
+    ''' cubeSymmetry.canonicalize -- POSITIVE TESTS '''
+    
+    def test_cubeSymmetry_canonicalize_20010_ShouldHave24Orientations(self):
+        """ there should be a distinct canonicalization frame for each of the 24 whole-cube orientations """
+        
+        self.assertEqual(len(cubeSymmetry._ORIENTATIONS), 24)
+    
+    def test_cubeSymmetry_canonicalize_20020_ReorientedCubesShouldShareCanonicalCode(self):
+        """ a cube viewed from every orientation should map to the same canonical cube code """
+        
+        code = 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'
+        (canonicalCode, _) = cubeSymmetry.canonicalize(code)
+        
+        for gather in cubeSymmetry._ORIENTATION_GATHERS:
+            reoriented = ''.join(gather(code))
+            self.assertEqual(cubeSymmetry.canonicalize(reoriented)[0], canonicalCode)
+    
+    def test_cubeSymmetry_fromCanonicalRotations_20010_TranslatedSolutionShouldSolveReorientedCube(self):
+        """ a solution cached for one orientation of a cube should solve every other orientation """
+        
+        code = 'boyybbowrrywrrowrgbgyygwwbgbgogoryggrooyybybgwobrwwowr'
+        
+        for gather in cubeSymmetry._ORIENTATION_GATHERS:
+            reoriented = ''.join(gather(code))
+            
+            rotations = solve._solve({'op': 'solve', 'cube': reoriented})['rotations']
+            result = rotate._rotate({'op': 'rotate', 'cube': reoriented, 'dir': rotations})
+            
+            self.assertTrue(Cube(result['cube']).isUpLayerSolved())
+            self.assertTrue(Cube(result['cube']).isDownLayerSolved())
+            self.assertTrue(Cube(result['cube']).isMiddleLayerSolved())
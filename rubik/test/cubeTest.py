@@ -916,4 +916,28 @@ class CubeTest(TestCase):
         cube = Cube('bbbwbbgrorrrorwwobgggggrwwrooogobwwryyyyyyyyywbgrwgboo')
         self.assertTrue(cube.isUpEdgesSolved())
     
-    
\ No newline at end of file
+    
+    ''' Cube.clone -- POSITIVE TESTS '''
+    
+    def test_cube_clone_20010_ShouldCloneIntoEqualCube(self):
+        """ a clone of a cube should have the same cube code """
+        
+        cube = Cube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        
+        self.assertEqual(cube.clone().toCode(), cube.toCode())
+    
+    def test_cube_clone_20020_ShouldNotShareStateWithClone(self):
+        """ rotating a clone should not rotate the cube it was cloned from, nor the other way around """
+        
+        cube = Cube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        clone = cube.clone()
+        
+        clone.rotateFace(CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE)
+        self.assertEqual(cube.toCode(), 'gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        
+        cube.rotateFace(CubeFacePosition.UP, FaceRotationDirection.COUNTERCLOCKWISE)
+        self.assertNotEqual(clone.toCode(), cube.toCode())
+        
+        expected = Cube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        expected.rotateFace(CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE)
+        self.assertEqual(clone.toCode(), expected.toCode())
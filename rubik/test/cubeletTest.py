@@ -554,6 +554,56 @@ class CubeletTest(TestCase):
             
             self.assertEqual(actualColor, expectedColor)
     
+    def test_cubelet_rotate_20170_ShouldReturnToStartAfterFourRotationsInAnyDirection(self):
+        """ a cubelet should end up unchanged by four rotations in the same direction, each changing it """
+        
+        cubelet = Cubelet({
+            CubeFacePosition.UP: CubeColor.BLUE,
+            CubeFacePosition.FRONT: CubeColor.RED,
+            CubeFacePosition.LEFT: CubeColor.YELLOW
+        })
+        oldFaces = cubelet.getFaceColors()
+        
+        for direction in CubeRotationDirection:
+            for _ in range(3):
+                cubelet.rotate(direction)
+                self.assertNotEqual(cubelet.getFaceColors(), oldFaces)
+            
+            cubelet.rotate(direction)
+            self.assertEqual(cubelet.getFaceColors(), oldFaces)
+    
+    ''' Cubelet.getFaceColors -- POSITIVE TESTS '''
+    
+    def test_cubelet_getFaceColors_20010_ShouldReturnColorOfEveryFacePosition(self):
+        """ the face colors should map every face position to its color, or None if uncolored """
+        
+        cubelet = Cubelet({
+            CubeFacePosition.DOWN: CubeColor.WHITE,
+            CubeFacePosition.BACK: CubeColor.GREEN
+        })
+        
+        self.assertEqual(cubelet.getFaceColors(), {
+            CubeFacePosition.FRONT: None,
+            CubeFacePosition.BACK: CubeColor.GREEN,
+            CubeFacePosition.LEFT: None,
+            CubeFacePosition.RIGHT: None,
+            CubeFacePosition.UP: None,
+            CubeFacePosition.DOWN: CubeColor.WHITE
+        })
+    
+    ''' Cubelet.clone -- POSITIVE TESTS '''
+    
+    def test_cubelet_clone_20010_ShouldNotShareFacesWithClone(self):
+        """ rotating a clone should not rotate the cubelet it was cloned from """
+        
+        cubelet = Cubelet({CubeFacePosition.UP: CubeColor.BLUE})
+        clone = cubelet.clone()
+        
+        clone.rotate(CubeRotationDirection.FLIP_FORWARD)
+        
+        self.assertEqual(cubelet[CubeFacePosition.UP], CubeColor.BLUE)
+        self.assertEqual(clone[CubeFacePosition.FRONT], CubeColor.BLUE)
+    
     ''' Cubelet.__getitem__ -- NEGATIVE TESTS '''
     
     def test_cubelet_getitem_10010_ShouldThrowExceptionForNonFacePosition(self):
@@ -30,6 +30,15 @@ class DispatchTest(TestCase):
         parms['op'] = 'verify'
         result = dispatch._dispatch(parms)
         self.assertIn('status', result)
+        
+    def test100_050ShouldCountDispatchedOps(self):
+        counter = dispatch._OP_REQUESTS
+        before = counter.getSnapshot().get(('create', 'ok'), 0)
+        parms = {}
+        parms['op'] = 'create'
+        dispatch._dispatch(parms)
+        self.assertEqual(counter.getSnapshot()[('create', 'ok')], before + 1)
+        self.assertEqual(dispatch._OPS_IN_FLIGHT.getSnapshot()[('create',)], 0)
                
 # Sad path
 #    Verify status of 
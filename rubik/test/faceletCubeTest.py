@@ -0,0 +1,192 @@
+from unittest import TestCase
+
+from rubik.cube import Cube
+from rubik.faceletCube import FaceletCube
+from rubik.cubeColor import CubeColor
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.faceRotationDirection import FaceRotationDirection
+
+class FaceletCubeTest(TestCase):
+    
+    ''' FaceletCube.__init__ -- NEGATIVE TESTS '''
+    
+    def test_faceletCube_init_10010_ShouldThrowExceptionForInvalidCubeCode(self):
+        """ supplying invalid cube code should throw exception """
+        
+        with self.assertRaises(Exception):
+            FaceletCube(2.3)
+    
+    def test_faceletCube_init_10020_ShouldThrowExceptionForMalformedCubeCodeString(self):
+        """ supplying a string that is not a valid cube code should throw exception """
+        
+        with self.assertRaises(Exception):
+            FaceletCube('bryogw')
+    
+    ''' FaceletCube.__init__ -- POSITIVE TESTS '''
+    
+    def test_faceletCube_init_20010_ShouldSetupUnsolvedCubeCorrectly(self):
+        """ unsolved cube should serialize back to its cube code """
+        
+        code = 'bwgbbgrgoybwrrbgybbygwggyoowyryooywwoooryrwrrgoygwbbwr'
+        cube = FaceletCube(code)
+        
+        self.assertEqual(cube.toCode(), code)
+    
+    ''' FaceletCube.__getitem__ -- NEGATIVE TESTS '''
+    
+    def test_faceletCube_getitem_10010_ShouldThrowExceptionFor3DCoordinateOutOfRange(self):
+        """ indexing cube with coordinate outside of range [0, 2] should throw exception """
+        
+        cube = FaceletCube('bgyobrgoworgwrbgogrrrygbygbygrwobwoybbwryywybrwogwyowo')
+        
+        with self.assertRaises(Exception):
+            cube[3, 1, -2]
+    
+    ''' FaceletCube.__getitem__ -- POSITIVE TESTS '''
+    
+    def test_faceletCube_getitem_20010_ShouldMatchCubeletFaceColors(self):
+        """ every cubelet view should have the same face colors as the cubelet-based cube """
+        
+        code = 'yrrybgwgogygorrwoyrwwwgrbwybgoyoorwrogwyybgbybrgowbbbo'
+        cube = Cube(code)
+        faceletCube = FaceletCube(code)
+        
+        for x in range(3):
+            for y in range(3):
+                for z in range(3):
+                    self.assertEqual(faceletCube[x, y, z].getFaceColors(), cube[x, y, z].getFaceColors())
+    
+    ''' FaceletCube.rotateFace -- NEGATIVE TESTS '''
+    
+    def test_faceletCube_rotateFace_10010_ShouldThrowExceptionForInvalidCubeFacePosition(self):
+        """ supplying invalid cube face position should throw exception """
+        
+        cube = FaceletCube('gwwwboryrgrygrrybrobwygybybogyooowgbgwbryborrwbgwwoogy')
+        
+        with self.assertRaises(Exception):
+            cube.rotateFace("DOWN", FaceRotationDirection.COUNTERCLOCKWISE)
+    
+    ''' FaceletCube.rotateFace -- POSITIVE TESTS '''
+    
+    def test_faceletCube_rotateFace_20010_ShouldMatchCubeForEveryQuarterTurn(self):
+        """ each of the 12 quarter turns should produce the same cube code as the cubelet-based cube """
+        
+        code = 'rybybrygyoyrbrwrrygggogybggwbwrobwogorywyobgwowbbwwroo'
+        
+        for facePosition in CubeFacePosition:
+            for direction in FaceRotationDirection:
+                cube = Cube(code)
+                faceletCube = FaceletCube(code)
+                
+                cube.rotateFace(facePosition, direction)
+                faceletCube.rotateFace(facePosition, direction)
+                
+                self.assertEqual(faceletCube.toCode(), cube.toCode())
+    
+    def test_faceletCube_rotateFace_20020_ShouldBeUnchangedAfterFourIdenticalRotations(self):
+        """ rotating same face in same direction 4 times should result in unchanged cube """
+        
+        code = 'wrbbbwyyrywbbrgwywobrwggggggorooryrbyowwyrgyorbbgwooyo'
+        cube = FaceletCube(code)
+        
+        for _ in range(4):
+            cube.rotateFace(CubeFacePosition.BACK, FaceRotationDirection.COUNTERCLOCKWISE)
+        
+        self.assertEqual(cube.toCode(), code)
+    
+    ''' FaceletCube.getFaceColor -- POSITIVE TESTS '''
+    
+    def test_faceletCube_getFaceColor_20010_ShouldReturnCenterTileColor(self):
+        """ face color should be the color of the center tile on that face """
+        
+        cube = FaceletCube('bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww')
+        
+        self.assertEqual(cube.getFaceColor(CubeFacePosition.LEFT), CubeColor.ORANGE)
+        self.assertEqual(cube.getFaceColor(CubeFacePosition.DOWN), CubeColor.WHITE)
+    
+    ''' FaceletCube stage predicates -- POSITIVE TESTS '''
+    
+    def test_faceletCube_predicates_20010_ShouldMatchCubeForCubesAtEachMilestone(self):
+        """ stage predicates should agree with the cubelet-based cube """
+        
+        codes = [
+            'bywobwrrbgboorgwboybwyggybwooywoybgggwggyyrrryworworrb',
+            'gogobooybrbyyrgyggogwogboygrrrrobygwbwbwywywwbrrrwyobw',
+            'wywobbrbgrggrrbyrgrgyogoogboyoyogyogbrwryybbbywowwwrww',
+            'gyogbobbbybrgrgrrryybrgrgggyyrboyooooobbyoyrgwwwwwwwww',
+            'ygrbbbbbbgyyrrrrrrbyoggggggbroooooooybryyogyywwwwwwwww',
+            'wyybbbbbbobowwwwwwbowyyyyyyywboooooorrrrrrrrrggggggggg',
+            'bbbbbbwwgrrrwrworogggoggbowooororbbgyyyyyyyyyrgwowwrgw',
+            'rrrbbbbbbgogrrrrrroboggggggbgbooooooyyyyyyyyywwwwwwwww',
+            'bgbbbbbbbrrrrrrrrrgogggggggoboooooooyyyyyyyyywwwwwwwww',
+            'bbbwbbgrorrrorwwobgggggrwwrooogobwwryyyyyyyyywbgrwgboo',
+        ]
+        predicates = [
+            'hasUpDaisy', 'hasDownCross', 'isDownLayerSolved', 'isMiddleLayerSolved', 'hasUpCross',
+            'isUpFaceSolved', 'isUpEdgesSolved', 'isUpCornersSolved', 'isUpLayerSolved'
+        ]
+        
+        for code in codes:
+            cube = Cube(code)
+            faceletCube = FaceletCube(code)
+            
+            for predicate in predicates:
+                self.assertEqual(getattr(faceletCube, predicate)(), getattr(cube, predicate)())
+    
+    def test_faceletCube_predicates_20020_ShouldTrackCubeThroughRotations(self):
+        """ stage predicates should agree with the cubelet-based cube after every rotation, including on clones """
+        
+        code = 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'
+        predicates = [
+            'hasUpDaisy', 'hasDownCross', 'isDownLayerSolved', 'isMiddleLayerSolved', 'hasUpCross',
+            'isUpFaceSolved', 'isUpEdgesSolved', 'isUpCornersSolved', 'isUpLayerSolved'
+        ]
+        moves = [
+            (CubeFacePosition.UP, FaceRotationDirection.CLOCKWISE),
+            (CubeFacePosition.FRONT, FaceRotationDirection.COUNTERCLOCKWISE),
+            (CubeFacePosition.RIGHT, FaceRotationDirection.CLOCKWISE),
+            (CubeFacePosition.RIGHT, FaceRotationDirection.COUNTERCLOCKWISE),
+            (CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE),
+            (CubeFacePosition.DOWN, FaceRotationDirection.CLOCKWISE),
+            (CubeFacePosition.LEFT, FaceRotationDirection.CLOCKWISE),
+        ]
+        
+        cube = Cube(code)
+        faceletCube = FaceletCube(code)
+        
+        for (facePosition, direction) in moves:
+            # a clone taken between predicate checks should not see later rotations
+            clone = faceletCube.clone()
+            
+            cube.rotateFace(facePosition, direction)
+            faceletCube.rotateFace(facePosition, direction)
+            
+            for predicate in predicates:
+                self.assertEqual(getattr(faceletCube, predicate)(), getattr(cube, predicate)())
+            
+            self.assertNotEqual(clone.toCode(), faceletCube.toCode())
+    
+    ''' FaceletCube.clone -- POSITIVE TESTS '''
+    
+    def test_faceletCube_clone_20010_ShouldCloneIntoEqualCube(self):
+        """ a clone of a cube should have the same cube code """
+        
+        cube = FaceletCube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        
+        self.assertEqual(cube.clone().toCode(), cube.toCode())
+    
+    def test_faceletCube_clone_20020_ShouldNotShareStateWithClone(self):
+        """ rotating a clone should not rotate the cube it was cloned from, nor the other way around """
+        
+        cube = FaceletCube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        clone = cube.clone()
+        
+        clone.rotateFace(CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE)
+        self.assertEqual(cube.toCode(), 'gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        
+        cube.rotateFace(CubeFacePosition.UP, FaceRotationDirection.COUNTERCLOCKWISE)
+        self.assertNotEqual(clone.toCode(), cube.toCode())
+        
+        expected = FaceletCube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        expected.rotateFace(CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE)
+        self.assertEqual(clone.toCode(), expected.toCode())
@@ -0,0 +1,171 @@
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.__main__ as cli
+import rubik.cubeSymmetry as cubeSymmetry
+import rubik.dispatch as dispatch
+import rubik.runtimeChecks as runtimeChecks
+import rubik.solveCache as solveCache
+import rubik.solutionStore as solutionStore
+
+class MainTest(TestCase):
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.inputPath = os.path.join(self.directory.name, 'params.jsonl')
+        self.outputPath = os.path.join(self.directory.name, 'results.jsonl')
+        
+        self.items = [
+            {'op': 'solve', 'cube': 'gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb'},
+            {'op': 'rotate', 'cube': 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww', 'dir': 'Fr'},
+            {'op': 'solve'},
+            {'op': 'nop'},
+        ]
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def writeInput(self, text: str):
+        with open(self.inputPath, 'w') as file:
+            file.write(text)
+    
+    def readOutput(self):
+        with open(self.outputPath) as file:
+            return [json.loads(line) for line in file]
+    
+    def withoutTokens(self, results):
+        return [{key: value for (key, value) in result.items() if key != 'token'} for result in results]
+    
+    def run_main(self, *args):
+        stderr = io.StringIO()
+        
+        # checks are kept on for the tests that run after these
+        with patch.dict(os.environ, {runtimeChecks.CHECKS_VARIABLE: '1'}), patch('sys.stderr', stderr):
+            status = cli.main(list(args))
+        
+        return (status, stderr.getvalue())
+    
+    ''' main -- NEGATIVE TESTS '''
+    
+    def test_main_10010_ShouldReportInvalidLinesWithoutStopping(self):
+        """ a line that is not JSON should only fail its own result """
+        
+        self.writeInput('{"op": "create"}\n{"op": \n{"op": "nop"}\n')
+        
+        (status, _) = self.run_main(self.inputPath, '-o', self.outputPath, '-q')
+        
+        results = self.readOutput()
+        
+        self.assertEqual(status, 0)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['status'], 'ok')
+        self.assertNotEqual(results[1]['status'], 'ok')
+        self.assertEqual(results[2]['status'], dispatch.ERROR03)
+    
+    def test_main_10020_ShouldRejectMmapOfStdin(self):
+        """ stdin cannot be memory-mapped """
+        
+        with patch('sys.stderr', io.StringIO()), self.assertRaises(SystemExit):
+            cli.main(['--mmap'])
+    
+    def test_main_10030_ShouldRejectNegativeWorkers(self):
+        """ a negative number of workers is an error """
+        
+        with patch('sys.stderr', io.StringIO()), self.assertRaises(SystemExit):
+            cli.main([self.inputPath, '--workers', '-1'])
+    
+    ''' main -- POSITIVE TESTS '''
+    
+    def test_main_20010_ShouldMatchSingleDispatchForEachLine(self):
+        """ each result line should match dispatching its params on their own, in order """
+        
+        self.writeInput(''.join(json.dumps(item) + '\n' for item in self.items))
+        
+        (status, stderr) = self.run_main(self.inputPath, '-o', self.outputPath)
+        
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            self.withoutTokens(self.readOutput()),
+            self.withoutTokens([dispatch._dispatch(dict(item)) for item in self.items])
+        )
+        self.assertIn('done: 4 lines', stderr)
+    
+    def test_main_20020_ShouldReadMemoryMappedInput(self):
+        """ a memory-mapped input should give the same results as reading it """
+        
+        self.writeInput(''.join(json.dumps(item) + '\n' for item in self.items))
+        
+        self.run_main(self.inputPath, '-o', self.outputPath, '-q', '--mmap')
+        
+        self.assertEqual(
+            self.withoutTokens(self.readOutput()),
+            self.withoutTokens([dispatch._dispatch(dict(item)) for item in self.items])
+        )
+    
+    def test_main_20030_ShouldReadStdinAndWriteStdout(self):
+        """ without paths, params should be read from stdin and results written to stdout """
+        
+        stdin = io.TextIOWrapper(io.BytesIO(b'{"op": "create"}\n\n{"op": "nop"}\n'))
+        stdout = io.StringIO()
+        
+        with patch('sys.stdin', stdin), patch('sys.stdout', stdout):
+            (_, stderr) = self.run_main('-q')
+        
+        results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        
+        self.assertEqual([result['status'] for result in results], ['ok', dispatch.ERROR03])
+        self.assertEqual(stderr, '')
+    
+    def test_main_20040_ShouldHandleEmptyMemoryMappedInput(self):
+        """ an empty input should produce an empty output, even memory-mapped """
+        
+        self.writeInput('')
+        
+        (status, stderr) = self.run_main(self.inputPath, '-o', self.outputPath, '--mmap')
+        
+        self.assertEqual(status, 0)
+        self.assertEqual(self.readOutput(), [])
+        self.assertIn('done: 0 lines', stderr)
+    
+    def test_main_20050_ShouldPopulateSolutionStore(self):
+        """ solutions should be persisted to the store given """
+        
+        storePath = os.path.join(self.directory.name, 'solutions')
+        cube = self.items[0]['cube']
+        
+        self.writeInput(json.dumps(self.items[0]) + '\n')
+        
+        with patch.object(solveCache, '_cache', None), patch.object(solutionStore, '_store', None):
+            self.run_main(self.inputPath, '-o', self.outputPath, '-q', '--store', storePath)
+            
+            solutionStore.getStore().close()
+        
+        store = solutionStore.SolutionStore(storePath)
+        
+        try:
+            self.assertIsNotNone(store.get(cubeSymmetry.canonicalize(cube)[0]))
+        finally:
+            store.close()
+    
+    ''' _Progress -- POSITIVE TESTS '''
+    
+    def test_main_Progress_20010_ShouldReportOncePerInterval(self):
+        """ progress should be reported at most once per interval, with throughput """
+        
+        times = iter([0.0, 1.0, 2.5, 3.0, 4.0])
+        stream = io.StringIO()
+        
+        progress = cli._Progress(stream, 2.0, clock = lambda: next(times))
+        progress.advance(10)
+        progress.advance(10)
+        progress.advance(20)
+        progress.finish()
+        
+        self.assertEqual(stream.getvalue().splitlines(), [
+            'dispatched 20 lines in 2.5s, 8.0 lines/s',
+            'done: 40 lines in 4.0s, 10.0 lines/s',
+        ])
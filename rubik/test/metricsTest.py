@@ -0,0 +1,125 @@
+from unittest import TestCase
+
+import rubik.metrics as metrics
+from rubik.metrics import Counter, Gauge, Histogram
+
+class MetricsTest(TestCase):
+    
+    ''' Histogram.__init__ -- NEGATIVE TESTS '''
+    
+    def test_metrics_init_10010_ShouldThrowExceptionForBucketsWithoutInfinity(self):
+        """ buckets not ending with infinity should throw exception """
+        
+        with self.assertRaises(Exception):
+            Histogram('test_histogram', 'test', (1, 2, 3))
+    
+    ''' Histogram.observe -- POSITIVE TESTS '''
+    
+    def test_metrics_observe_20010_ShouldCountValuesIntoBuckets(self):
+        """ each value should be counted in the first bucket whose upper bound it does not exceed """
+        
+        histogram = Histogram('test_histogram', 'test', (1, 10, float('inf')), ('kind',))
+        
+        for value in [0.5, 1, 5, 50]:
+            histogram.observe(value, ('a',))
+        
+        histogram.observe(2, ('b',))
+        
+        snapshot = histogram.getSnapshot()
+        
+        self.assertEqual(snapshot[('a',)]['buckets'], {1: 2, 10: 1, float('inf'): 1})
+        self.assertEqual((snapshot[('a',)]['sum'], snapshot[('a',)]['count']), (56.5, 4))
+        self.assertEqual(snapshot[('b',)]['count'], 1)
+    
+    ''' metrics.histogram -- POSITIVE TESTS '''
+    
+    def test_metrics_histogram_20010_ShouldRegisterOneHistogramPerName(self):
+        """ asking for a histogram by the same name should return the same histogram """
+        
+        first = metrics.histogram('test_registered_histogram', 'test')
+        
+        self.assertIs(metrics.histogram('test_registered_histogram', 'test'), first)
+        self.assertIs(metrics.REGISTRY['test_registered_histogram'], first)
+    
+    ''' Gauge -- POSITIVE TESTS '''
+    
+    def test_metrics_gauge_20010_ShouldGoUpAndDown(self):
+        """ a gauge should track increments, decrements, and replacements of its value """
+        
+        gauge = Gauge('test_gauge', 'test')
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        
+        self.assertEqual(gauge.getSnapshot(), {(): 1})
+        
+        gauge.set(7)
+        
+        self.assertEqual(gauge.getSnapshot(), {(): 7})
+    
+    ''' metrics.render -- POSITIVE TESTS '''
+    
+    def test_metrics_render_20010_ShouldRenderTextExpositionFormat(self):
+        """ registered metrics should render with help, type, escaped labels, and cumulative buckets """
+        
+        counter = Counter('test_render_total', 'test counter', ('op',))
+        counter.inc(labels = ('say "hi"',))
+        
+        histogram = Histogram('test_render_seconds', 'test histogram', (1, float('inf')))
+        histogram.observe(0.5)
+        histogram.observe(2)
+        
+        registry = dict(metrics.REGISTRY)
+        metrics.REGISTRY.clear()
+        metrics.REGISTRY.update({counter.name: counter, histogram.name: histogram})
+        
+        try:
+            text = metrics.render()
+        finally:
+            metrics.REGISTRY.clear()
+            metrics.REGISTRY.update(registry)
+        
+        self.assertEqual(text, (
+            '# HELP test_render_seconds test histogram\n'
+            '# TYPE test_render_seconds histogram\n'
+            'test_render_seconds_bucket{le="1"} 1\n'
+            'test_render_seconds_bucket{le="+Inf"} 2\n'
+            'test_render_seconds_sum 2.5\n'
+            'test_render_seconds_count 2\n'
+            '# HELP test_render_total test counter\n'
+            '# TYPE test_render_total counter\n'
+            'test_render_total{op="say \\"hi\\""} 1\n'
+        ))
+    
+    ''' metrics.drain -- POSITIVE TESTS '''
+    
+    def test_metrics_drain_20010_MergedMetricsShouldAddToThoseOfAnotherProcess(self):
+        """ counters and histograms drained in one process should add to the same metrics where they are merged """
+        
+        counter = Counter('test_drained_total', 'test', ('op',))
+        histogram = Histogram('test_drained_seconds', 'test', (1, float('inf')))
+        gauge = Gauge('test_drained_in_flight', 'test')
+        
+        registry = dict(metrics.REGISTRY)
+        metrics.REGISTRY.clear()
+        metrics.REGISTRY.update({counter.name: counter, histogram.name: histogram, gauge.name: gauge})
+        
+        try:
+            counter.inc(labels = ('solve',))
+            histogram.observe(0.5)
+            gauge.inc()
+            
+            drained = metrics.drain()
+            
+            self.assertEqual((counter.getSnapshot(), histogram.getSnapshot()), ({}, {}))
+            self.assertEqual(metrics.drain(), {})
+            
+            counter.inc(labels = ('solve',))
+            metrics.merge(drained)
+        finally:
+            metrics.REGISTRY.clear()
+            metrics.REGISTRY.update(registry)
+        
+        self.assertEqual(counter.getSnapshot(), {('solve',): 2})
+        self.assertEqual(histogram.getSnapshot()[()], {'buckets': {1: 1, float('inf'): 0}, 'sum': 0.5, 'count': 1})
+        self.assertEqual(gauge.getSnapshot(), {(): 1})
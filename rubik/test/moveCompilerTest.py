@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+import rubik.moveCompiler as moveCompiler
+from rubik.cube import Cube
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.faceRotationDirection import FaceRotationDirection
+
+class MoveCompilerTest(TestCase):
+    
+    ''' moveCompiler.normalize -- POSITIVE TESTS '''
+    
+    def test_moveCompiler_normalize_20010_ShouldRemoveRotationsFollowedByTheirInverse(self):
+        """ a rotation immediately undone should be removed, even when nested """
+        
+        self.assertEqual(moveCompiler.normalize('UFRrfD'), 'UD')
+    
+    def test_moveCompiler_normalize_20020_ShouldRemoveFourIdenticalRotations(self):
+        """ 4 identical rotations in a row should be removed """
+        
+        self.assertEqual(moveCompiler.normalize('RllllrB'), 'B')
+    
+    def test_moveCompiler_normalize_20030_ShouldKeepIrreducibleSequences(self):
+        """ a sequence with nothing to cancel should be left as is """
+        
+        self.assertEqual(moveCompiler.normalize('FURurf'), 'FURurf')
+    
+    ''' moveCompiler.compileMoves -- NEGATIVE TESTS '''
+    
+    def test_moveCompiler_compileMoves_10010_ShouldThrowExceptionForInvalidRotationCode(self):
+        """ compiling a sequence containing an invalid rotation code should throw exception """
+        
+        with self.assertRaises(Exception):
+            moveCompiler.compileMoves('FRx')
+    
+    ''' moveCompiler.applyMoves -- POSITIVE TESTS '''
+    
+    def test_moveCompiler_applyMoves_20010_ShouldMatchRotatingCubeOneMoveAtATime(self):
+        """ applying a compiled sequence should match rotating a Cube one quarter turn at a time """
+        
+        code = 'rybybrygyoyrbrwrrygggogybggwbwrobwogorywyobgwowbbwwroo'
+        rotationCodes = 'FRuLLdBfrUlDDbRRfu'
+        
+        cube = Cube(code)
+        for rotationCode in rotationCodes:
+            direction = (
+                FaceRotationDirection.CLOCKWISE
+                if rotationCode.isupper()
+                else FaceRotationDirection.COUNTERCLOCKWISE
+            )
+            cube.rotateFace(CubeFacePosition(rotationCode.upper()), direction)
+        
+        self.assertEqual(moveCompiler.applyMoves(code, rotationCodes), cube.toCode())
+    
+    def test_moveCompiler_applyMoves_20020_ShouldLeaveCubeUnchangedForEmptySequence(self):
+        """ applying an empty sequence should leave the cube code unchanged """
+        
+        code = 'wrbbbwyyrywbbrgwywobrwggggggorooryrbyowwyrgyorbbgwooyo'
+        
+        self.assertEqual(moveCompiler.applyMoves(code, ''), code)
+    
+    def test_moveCompiler_applyMoves_20030_ShouldReuseCompiledSequences(self):
+        """ applying the same sequence again should hit the compiled sequence cache """
+        
+        rotationCodes = 'DDrBuLfUFRbdl'
+        moveCompiler.applyMoves('bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww', rotationCodes)
+        
+        hits = moveCompiler.cacheInfo().hits
+        moveCompiler.applyMoves('rybybrygyoyrbrwrrygggogybggwbwrobwogorywyobgwowbbwwroo', rotationCodes)
+        
+        self.assertEqual(moveCompiler.cacheInfo().hits, hits + 1)
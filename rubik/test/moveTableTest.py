@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+import rubik.moveTable as moveTable
+from rubik.cube import Cube
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.faceRotationDirection import FaceRotationDirection
+
+class MoveTableTest(TestCase):
+    
+    ''' moveTable.PERMUTATIONS -- POSITIVE TESTS '''
+    
+    def test_moveTable_permutations_20010_ShouldHaveAPermutationForEveryQuarterTurn(self):
+        """ there should be a permutation of all 54 facelets for each of the 12 quarter turns """
+        
+        self.assertEqual(len(moveTable.PERMUTATIONS), 12)
+        
+        for permutation in moveTable.PERMUTATIONS.values():
+            self.assertEqual(sorted(permutation), list(range(54)))
+    
+    def test_moveTable_permutations_20020_ShouldMoveExactlyTwentyFacelets(self):
+        """ a quarter turn should move the 9 facelets of the face and the 12 bordering it, except the center """
+        
+        for permutation in moveTable.PERMUTATIONS.values():
+            movedCount = sum(1 for (index, source) in enumerate(permutation) if index != source)
+            self.assertEqual(movedCount, 20)
+    
+    ''' moveTable.applyMove -- POSITIVE TESTS '''
+    
+    def test_moveTable_applyMove_20010_ShouldMatchCubeForEveryQuarterTurn(self):
+        """ applying each quarter turn to a cube code should match rotating a Cube """
+        
+        code = 'rybybrygyoyrbrwrrygggogybggwbwrobwogorywyobgwowbbwwroo'
+        
+        for facePosition in CubeFacePosition:
+            for direction in FaceRotationDirection:
+                cube = Cube(code)
+                cube.rotateFace(facePosition, direction)
+                
+                self.assertEqual(moveTable.applyMove(code, facePosition, direction), cube.toCode())
+    
+    def test_moveTable_applyMove_20020_ShouldBeUnchangedAfterOppositeRotations(self):
+        """ rotating a face clockwise then counterclockwise should leave the cube code unchanged """
+        
+        code = 'wrbbbwyyrywbbrgwywobrwggggggorooryrbyowwyrgyorbbgwooyo'
+        
+        rotated = moveTable.applyMove(code, CubeFacePosition.UP, FaceRotationDirection.CLOCKWISE)
+        restored = moveTable.applyMove(rotated, CubeFacePosition.UP, FaceRotationDirection.COUNTERCLOCKWISE)
+        
+        self.assertEqual(restored, code)
@@ -0,0 +1,87 @@
+import json
+import logging
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.requestLog as requestLog
+from rubik.requestLog import JsonLinesFormatter
+
+class RequestLogTest(TestCase):
+    
+    ''' JsonLinesFormatter.format -- POSITIVE TESTS '''
+    
+    def test_requestLog_format_20010_ShouldFormatRecordAsOneLineOfJson(self):
+        """ a record should be formatted as a single line of JSON including its fields """
+        
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'request', None, None)
+        record.fields = {'op': 'solve', 'latency': 0.5}
+        
+        line = JsonLinesFormatter().format(record)
+        
+        self.assertNotIn('\n', line)
+        self.assertEqual(
+            json.loads(line),
+            {'time': record.created, 'level': 'INFO', 'message': 'request', 'op': 'solve', 'latency': 0.5}
+        )
+    
+    ''' requestLog.logRequest -- POSITIVE TESTS '''
+    
+    def test_requestLog_logRequest_20010_ShouldLogFailuresAsWarnings(self):
+        """ a successful request should be logged at INFO, and a failed one at WARNING """
+        
+        logger = requestLog.getLogger()
+        
+        with patch.object(logger, 'log') as log:
+            requestLog.logRequest('solve', 0.25, 'ok', 100)
+            requestLog.logRequest('solve', 0.25, 'error: invalid cube', 30)
+        
+        self.assertEqual([call.args[0] for call in log.call_args_list], [logging.INFO, logging.WARNING])
+        self.assertEqual(
+            log.call_args_list[0].kwargs['extra']['fields'],
+            {'op': 'solve', 'latency': 0.25, 'status': 'ok', 'resultSize': 100}
+        )
+    
+    def test_requestLog_logRequest_20020_ShouldSampleOnlySuccessfulRequests(self):
+        """ with a sample rate of 0, only failed requests should be logged """
+        
+        logger = requestLog.getLogger()
+        
+        with patch.object(requestLog, '_sampleRate', 0.0), patch.object(logger, 'log') as log:
+            requestLog.logRequest('solve', 0.25, 'ok', 100)
+            requestLog.logRequest('solve', 0.25, 'error: invalid cube', 30)
+        
+        self.assertEqual([call.args[0] for call in log.call_args_list], [logging.WARNING])
+    
+    def test_requestLog_logRequest_20030_ShouldRespectLevel(self):
+        """ with the level raised to WARNING, successful requests should not be logged """
+        
+        logger = requestLog.getLogger()
+        level = logger.level
+        logger.setLevel(logging.WARNING)
+        
+        try:
+            with patch.object(logger, 'log') as log:
+                requestLog.logRequest('solve', 0.25, 'ok', 100)
+        finally:
+            logger.setLevel(level)
+        
+        log.assert_not_called()
+    
+    def test_requestLog_logRequest_20040_ShouldLogRouteStatusCodeAndException(self):
+        """ a request that raised should be logged at WARNING with its route, HTTP status code, and exception """
+        
+        logger = requestLog.getLogger()
+        
+        with patch.object(requestLog, '_sampleRate', 0.0), patch.object(logger, 'log') as log:
+            requestLog.logRequest('batch', 0.25, 'error', None, route = '/rubik/batch', statusCode = 500, error = ValueError('bad items'))
+        
+        self.assertEqual(log.call_args.args[0], logging.WARNING)
+        self.assertEqual(log.call_args.kwargs['extra']['fields'], {
+            'op': 'batch',
+            'latency': 0.25,
+            'status': 'error',
+            'resultSize': None,
+            'route': '/rubik/batch',
+            'statusCode': 500,
+            'error': 'ValueError: bad items'
+        })
@@ -0,0 +1,68 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.responseFormat as responseFormat
+
+RESULT = {'status': 'ok', 'rotations': 'FRbl', 'token': 'abcd1234'}
+
+class ResponseFormatTest(TestCase):
+    
+    ''' responseFormat._negotiate -- POSITIVE TESTS '''
+    
+    def test_responseFormat_negotiate_20010_ShouldDefaultToCompactJson(self):
+        """ without a format param or Accept header, or with a browser's Accept header, JSON should be chosen """
+        
+        self.assertEqual(responseFormat._negotiate(), responseFormat.COMPACT_FORMAT)
+        self.assertEqual(
+            responseFormat._negotiate(None, 'text/html,application/xhtml+xml,*/*;q=0.8'),
+            responseFormat.COMPACT_FORMAT
+        )
+    
+    def test_responseFormat_negotiate_20020_ShouldChooseLegacyWhenTextPlainIsPreferred(self):
+        """ an Accept header preferring text/plain over JSON should choose the legacy format """
+        
+        self.assertEqual(responseFormat._negotiate(None, 'text/plain'), responseFormat.LEGACY_FORMAT)
+        self.assertEqual(
+            responseFormat._negotiate(None, 'application/json;q=0.5, text/*'),
+            responseFormat.LEGACY_FORMAT
+        )
+        self.assertEqual(
+            responseFormat._negotiate(None, 'application/json, text/plain;q=0.9'),
+            responseFormat.COMPACT_FORMAT
+        )
+    
+    def test_responseFormat_negotiate_20030_FormatParamShouldTakePrecedence(self):
+        """ a format param naming a format should be chosen whatever the Accept header says """
+        
+        self.assertEqual(responseFormat._negotiate('pretty', 'text/plain'), responseFormat.PRETTY_FORMAT)
+        self.assertEqual(responseFormat._negotiate('legacy', 'application/json'), responseFormat.LEGACY_FORMAT)
+        self.assertEqual(responseFormat._negotiate('bogus'), responseFormat.COMPACT_FORMAT)
+    
+    ''' responseFormat._formatResponse -- POSITIVE TESTS '''
+    
+    def test_responseFormat_formatResponse_20010_ShouldSerializeEachFormat(self):
+        """ each format should serialize the result with its content type """
+        
+        (compact, compactType) = responseFormat._formatResponse(RESULT, responseFormat.COMPACT_FORMAT)
+        (pretty, prettyType) = responseFormat._formatResponse(RESULT, responseFormat.PRETTY_FORMAT)
+        (legacy, legacyType) = responseFormat._formatResponse(RESULT, responseFormat.LEGACY_FORMAT)
+        
+        self.assertEqual(json.loads(compact), RESULT)
+        self.assertNotIn(' ', compact)
+        self.assertEqual(json.loads(pretty), RESULT)
+        self.assertIn('\n  "status"', pretty)
+        self.assertEqual(legacy, str(RESULT))
+        self.assertEqual(
+            (compactType, prettyType, legacyType),
+            (responseFormat.JSON_CONTENT_TYPE, responseFormat.JSON_CONTENT_TYPE, responseFormat.LEGACY_CONTENT_TYPE)
+        )
+    
+    def test_responseFormat_formatResponse_20020_ShouldSerializeWithoutOrjson(self):
+        """ without orjson installed, results should serialize the same way with the json module """
+        
+        expected = responseFormat._formatResponse(RESULT, responseFormat.COMPACT_FORMAT)
+        
+        with patch.object(responseFormat, 'orjson', None):
+            self.assertEqual(responseFormat._formatResponse(RESULT, responseFormat.COMPACT_FORMAT), expected)
+            self.assertEqual(json.loads(responseFormat._dumps(RESULT, pretty = True)), RESULT)
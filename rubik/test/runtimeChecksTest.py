@@ -0,0 +1,140 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.runtimeChecks as runtimeChecks
+from rubik.cube import Cube
+from rubik.cubelet import Cubelet
+from rubik.cubeSolver import CubeSolver
+from rubik.faceletCube import FaceletCube
+from rubik.cubeFacePosition import CubeFacePosition
+from rubik.faceRotationDirection import FaceRotationDirection
+from rubik.cubeRotationDirection import CubeRotationDirection
+
+class RuntimeChecksTest(TestCase):
+    
+    def setUp(self):
+        self.addCleanup(runtimeChecks.enable)
+    
+    ''' runtimeChecks.disable -- POSITIVE TESTS '''
+    
+    def test_runtimeChecks_disable_20010_ShouldSkipChecksOfCubeModel(self):
+        """ invalid params should get past the cube model's checks once they are disabled """
+        
+        cube = Cube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        
+        runtimeChecks.disable()
+        
+        self.assertFalse(runtimeChecks.isEnabled())
+        
+        # only the lookups themselves fail, rather than the checks before them
+        with self.assertRaises(KeyError):
+            cube[3, 3, 3]
+        
+        with self.assertRaises(KeyError):
+            Cubelet()[CubeFacePosition.UP.value]
+        
+        with self.assertRaises(KeyError):
+            FaceletCube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb').rotateFace('F', 'r')
+    
+    def test_runtimeChecks_disable_20020_ShouldNotChangeResults(self):
+        """ the cube model should behave the same on valid params with checks disabled """
+        
+        code = 'gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb'
+        
+        checkedSolution = CubeSolver(Cube(code)).getSolution()
+        
+        cube = Cube(code)
+        cubelet = Cubelet({CubeFacePosition.UP: cube.getFaceColor(CubeFacePosition.UP)})
+        cube.rotateFace(CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE)
+        cubelet.rotate(CubeRotationDirection.FLIP_FORWARD)
+        checkedResults = (cube.toCode(), cubelet.getFaceColors())
+        
+        runtimeChecks.disable()
+        
+        self.assertEqual(CubeSolver(Cube(code)).getSolution(), checkedSolution)
+        self.assertEqual(CubeSolver(code).getSolution(), checkedSolution)
+        
+        cube = Cube(code)
+        cubelet = Cubelet({CubeFacePosition.UP: cube.getFaceColor(CubeFacePosition.UP)})
+        cube.rotateFace(CubeFacePosition.FRONT, FaceRotationDirection.CLOCKWISE)
+        cubelet.rotate(CubeRotationDirection.FLIP_FORWARD)
+        self.assertEqual((cube.toCode(), cubelet.getFaceColors()), checkedResults)
+    
+    def test_runtimeChecks_disable_20030_ShouldSwapInheritedAndSolverHelperMethods(self):
+        """ methods the facelet cube shares with the cube, and the solver's helpers, should be unchecked too """
+        
+        runtimeChecks.disable()
+        
+        self.assertIs(FaceletCube.rotateCoord, FaceletCube._rotateCoordUnchecked)
+        self.assertIs(CubeSolver._trigger, CubeSolver._triggerUnchecked)
+        self.assertIs(CubeSolver._executeRurr, CubeSolver._executeRurrUnchecked)
+        self.assertIs(CubeSolver._handleMatchedTopCornerCandidateColor, CubeSolver._handleMatchedTopCornerCandidateColorUnchecked)
+        
+        # only the lookup itself fails, rather than the check before it
+        cube = FaceletCube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        
+        with self.assertRaises(KeyError):
+            cube.rotateCoord((0, 0, 0), 'F', FaceRotationDirection.CLOCKWISE)
+        
+        runtimeChecks.enable()
+        
+        with self.assertRaises(AssertionError):
+            cube.rotateCoord((0, 0, 0), 'F', FaceRotationDirection.CLOCKWISE)
+    
+    ''' runtimeChecks.enable -- POSITIVE TESTS '''
+    
+    def test_runtimeChecks_enable_20010_ShouldRestoreChecks(self):
+        """ invalid params should fail their checks again once checks are enabled """
+        
+        runtimeChecks.disable()
+        runtimeChecks.enable()
+        
+        self.assertTrue(runtimeChecks.isEnabled())
+        
+        with self.assertRaises(AssertionError):
+            Cube('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')[3, 3, 3]
+        
+        with self.assertRaises(AssertionError):
+            Cubelet()['U']
+    
+    ''' runtimeChecks.configure -- POSITIVE TESTS '''
+    
+    def test_runtimeChecks_configure_20010_ShouldUseDefaultWithoutEnvironment(self):
+        """ checks should be enabled or disabled by default when the environment does not say """
+        
+        with patch.dict(os.environ):
+            os.environ.pop(runtimeChecks.CHECKS_VARIABLE, None)
+            
+            self.assertFalse(runtimeChecks.configure(default = False))
+            self.assertTrue(runtimeChecks.configure(default = True))
+    
+    def test_runtimeChecks_configure_20020_ShouldLetEnvironmentOverrideDefault(self):
+        """ the environment should decide whether checks are enabled, whatever the default """
+        
+        with patch.dict(os.environ, {runtimeChecks.CHECKS_VARIABLE: '1'}):
+            self.assertTrue(runtimeChecks.configure(default = False))
+        
+        with patch.dict(os.environ, {runtimeChecks.CHECKS_VARIABLE: 'off'}):
+            self.assertFalse(runtimeChecks.configure(default = True))
+    
+    ''' runtimeChecks.register -- POSITIVE TESTS '''
+    
+    def test_runtimeChecks_register_20010_ShouldStartUncheckedWhileDisabled(self):
+        """ a class registered while checks are disabled should start out unchecked, and be checked once enabled """
+        
+        class Checked:
+            def get(self):
+                return 'checked'
+        
+        runtimeChecks.disable()
+        runtimeChecks.register(Checked, {'get': lambda self: 'unchecked'})
+        
+        # leave the registry as it was
+        self.addCleanup(runtimeChecks._methods.pop)
+        
+        self.assertEqual(Checked().get(), 'unchecked')
+        
+        runtimeChecks.enable()
+        
+        self.assertEqual(Checked().get(), 'checked')
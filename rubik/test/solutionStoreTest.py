@@ -0,0 +1,151 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.solve as solve
+import rubik.solveCache as solveCache
+import rubik.solutionStore as solutionStore
+from rubik.solutionStore import SolutionStore
+
+SOLVED_CUBE = 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'
+SCRAMBLED_CUBE = 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'
+
+class SolutionStoreTest(TestCase):
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'solutions')
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    ''' SolutionStore.__init__ -- NEGATIVE TESTS '''
+    
+    def test_solutionStore_init_10010_ShouldThrowExceptionForNonPositiveCapacity(self):
+        """ supplying a capacity of 0 should throw exception """
+        
+        with self.assertRaises(Exception):
+            SolutionStore(self.path, 0)
+    
+    ''' SolutionStore.get -- POSITIVE TESTS '''
+    
+    def test_solutionStore_get_20010_ShouldReturnStoredSolution(self):
+        """ a stored solution should be returned, and an unstored one should not """
+        
+        store = SolutionStore(self.path, 16)
+        store.put(SOLVED_CUBE, '')
+        store.put(SCRAMBLED_CUBE, 'FRUbl')
+        
+        self.assertEqual(store.get(SOLVED_CUBE), '')
+        self.assertEqual(store.get(SCRAMBLED_CUBE), 'FRUbl')
+        self.assertIsNone(store.get('w' + SCRAMBLED_CUBE[1:]))
+        
+        store.close()
+    
+    def test_solutionStore_get_20020_ShouldPersistAcrossReopening(self):
+        """ a solution stored before closing should be returned after reopening """
+        
+        store = SolutionStore(self.path, 16)
+        store.put(SCRAMBLED_CUBE, 'FRUbl')
+        store.close()
+        
+        store = SolutionStore(self.path)
+        
+        self.assertEqual(store.capacity, 16)
+        self.assertEqual(store.get(SCRAMBLED_CUBE), 'FRUbl')
+        
+        store.close()
+    
+    def test_solutionStore_get_20030_ShouldSeeSolutionsStoredByAnotherHandle(self):
+        """ a solution stored through one handle should be returned through another already open """
+        
+        reader = SolutionStore(self.path, 16)
+        reader.put(SOLVED_CUBE, '')
+        self.assertIsNone(reader.get(SCRAMBLED_CUBE))
+        
+        writer = SolutionStore(self.path)
+        writer.put(SCRAMBLED_CUBE, 'FRUbl')
+        
+        self.assertEqual(reader.get(SCRAMBLED_CUBE), 'FRUbl')
+        
+        writer.close()
+        reader.close()
+    
+    ''' SolutionStore.put -- POSITIVE TESTS '''
+    
+    def test_solutionStore_put_20010_ShouldKeepFirstSolutionStored(self):
+        """ storing a cube again should not append another record """
+        
+        store = SolutionStore(self.path, 16)
+        store.put(SCRAMBLED_CUBE, 'FRUbl')
+        size = os.path.getsize(self.path + '.dat')
+        store.put(SCRAMBLED_CUBE, 'LLL')
+        
+        self.assertEqual(store.get(SCRAMBLED_CUBE), 'FRUbl')
+        self.assertEqual(os.path.getsize(self.path + '.dat'), size)
+        
+        store.close()
+    
+    def test_solutionStore_put_20020_ShouldIgnoreSolutionsBeyondCapacity(self):
+        """ a full store should keep its solutions and ignore new ones """
+        
+        store = SolutionStore(self.path, 1)
+        store.put(SOLVED_CUBE, '')
+        store.put(SCRAMBLED_CUBE, 'FRUbl')
+        
+        self.assertEqual(store.get(SOLVED_CUBE), '')
+        self.assertIsNone(store.get(SCRAMBLED_CUBE))
+        
+        store.close()
+    
+    def test_solutionStore_put_20030_ShouldKeepEverySolutionStoredByConcurrentThreads(self):
+        """ threads storing and reading solutions through one handle at once should lose none of them """
+        
+        store = SolutionStore(self.path, 4096)
+        errors = []
+        
+        def putAll(thread):
+            try:
+                for index in range(300):
+                    cube = '%054d' % (thread * 300 + index)
+                    store.put(cube, 'FRUbl'[:index % 6])
+                    store.get(SCRAMBLED_CUBE)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target = putAll, args = (thread,)) for thread in range(8)]
+        
+        for thread in threads:
+            thread.start()
+        
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        
+        for cube in range(8 * 300):
+            self.assertEqual(store.get('%054d' % cube), 'FRUbl'[:cube % 300 % 6])
+        
+        store.close()
+    
+    ''' solve._solve -- persistence -- POSITIVE TESTS '''
+    
+    def test_solutionStore_solve_20010_ShouldReuseSolutionAfterCacheIsCleared(self):
+        """ a solution persisted by one solve should be reused once the in-process cache is lost """
+        
+        store = SolutionStore(self.path, 16)
+        
+        with patch.object(solutionStore, 'getStore', return_value = store):
+            solveCache.getCache().clear()
+            first = solve._solve({'op': 'solve', 'cube': SCRAMBLED_CUBE})
+            
+            solveCache.getCache().clear()
+            
+            with patch.object(solve, '_solveCube', side_effect = AssertionError):
+                second = solve._solve({'op': 'solve', 'cube': SCRAMBLED_CUBE})
+        
+        self.assertEqual(second['rotations'], first['rotations'])
+        
+        store.close()
@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+import rubik.rotate as rotate
+import rubik.solve as solve
+import rubik.cubeSymmetry as cubeSymmetry
+import rubik.solveCache as solveCache
+from rubik.solveCache import SolveCache
+
+class SolveCacheTest(TestCase):
+    
+    ''' SolveCache.__init__ -- NEGATIVE TESTS '''
+    
+    def test_solveCache_init_10010_ShouldThrowExceptionForNegativeSize(self):
+        """ supplying a negative cache size should throw exception """
+        
+        with self.assertRaises(Exception):
+            SolveCache(-1)
+    
+    ''' SolveCache.get -- POSITIVE TESTS '''
+    
+    def test_solveCache_get_20010_ShouldCountHitsAndMisses(self):
+        """ looking up cached and uncached cubes should count hits and misses """
+        
+        cache = SolveCache(10)
+        cache.put('cubeA', 'FRU')
+        
+        self.assertEqual(cache.get('cubeA'), 'FRU')
+        self.assertIsNone(cache.get('cubeB'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+    
+    def test_solveCache_get_20020_ShouldEvictLeastRecentlyUsedSolution(self):
+        """ exceeding the cache size should evict the least recently used solution """
+        
+        cache = SolveCache(2)
+        cache.put('cubeA', 'F')
+        cache.put('cubeB', 'R')
+        cache.get('cubeA')
+        cache.put('cubeC', 'U')
+        
+        self.assertEqual(cache.get('cubeA'), 'F')
+        self.assertIsNone(cache.get('cubeB'))
+        self.assertEqual(cache.evictions, 1)
+    
+    def test_solveCache_get_20030_ShouldExpireSolutionsAfterTtl(self):
+        """ a solution older than the ttl should no longer be returned """
+        
+        now = [100.0]
+        cache = SolveCache(10, ttl = 5, clock = lambda: now[0])
+        cache.put('cubeA', 'F')
+        
+        now[0] += 4
+        self.assertEqual(cache.get('cubeA'), 'F')
+        
+        now[0] += 2
+        self.assertIsNone(cache.get('cubeA'))
+        self.assertEqual(len(cache), 0)
+    
+    def test_solveCache_get_20040_ShouldNotCacheAnythingWhenSizeIsZero(self):
+        """ a cache of size 0 should be disabled """
+        
+        cache = SolveCache(0)
+        cache.put('cubeA', 'F')
+        
+        self.assertIsNone(cache.get('cubeA'))
+    
+    ''' solve._solve -- caching -- POSITIVE TESTS '''
+    
+    def test_solveCache_solve_20010_RepeatedCubeShouldHitCacheWithFreshToken(self):
+        """ solving a cube again should reuse its cached rotations while still yielding a token """
+        
+        cube = 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'
+        cache = solveCache.getCache()
+        
+        first = solve._solve({'op': 'solve', 'cube': cube})
+        hits = cache.hits
+        second = solve._solve({'op': 'solve', 'cube': cube})
+        
+        self.assertEqual(cache.hits, hits + 1)
+        self.assertEqual(second['rotations'], first['rotations'])
+        self.assertEqual(len(second['token']), 8)
+    
+    def test_solveCache_solve_20020_SolutionShouldNotDependOnSolveOrder(self):
+        """ solving two orientations of a cube should yield the same rotations for each whatever order they are solved in """
+        
+        solved = 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'
+        cube = rotate._rotate({'op': 'rotate', 'cube': solved, 'dir': 'u'})['cube']
+        reoriented = ''.join(cubeSymmetry._ORIENTATION_GATHERS[5](cube))
+        cache = solveCache.getCache()
+        
+        cache.clear()
+        first = solve._cachedSolveCube(cube)
+        firstReoriented = solve._cachedSolveCube(reoriented)
+        
+        cache.clear()
+        secondReoriented = solve._cachedSolveCube(reoriented)
+        second = solve._cachedSolveCube(cube)
+        
+        self.assertNotEqual(reoriented, cube)
+        self.assertEqual(second, first)
+        self.assertEqual(secondReoriented, firstReoriented)
@@ -0,0 +1,111 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+import rubik.metrics as metrics
+import rubik.solve as solve
+from rubik.cubeSolver import CubeSolver
+from rubik.solveStats import SolveStats
+
+class SolveStatsTest(TestCase):
+    
+    ''' SolveStats.exit -- POSITIVE TESTS '''
+    
+    def test_solveStats_exit_20010_ShouldTotalNestedSections(self):
+        """ a section's totals should include those of the sections it calls """
+        
+        now = [0.0]
+        stats = SolveStats(clock = lambda: now[0])
+        
+        outer = stats.enter()
+        stats.moves += 2
+        
+        inner = stats.enter()
+        stats.moves += 3
+        stats.predicates += 1
+        now[0] += 0.5
+        stats.exit('inner', inner)
+        
+        now[0] += 0.25
+        stats.exit('outer', outer)
+        
+        sections = stats.getSections()
+        
+        self.assertEqual(sections['inner'], {'calls': 1, 'seconds': 0.5, 'moves': 3, 'predicates': 1})
+        self.assertEqual(sections['outer'], {'calls': 1, 'seconds': 0.75, 'moves': 5, 'predicates': 1})
+    
+    ''' CubeSolver -- instrumentation -- POSITIVE TESTS '''
+    
+    def test_solveStats_cubeSolver_20010_ShouldNotGatherStatsByDefault(self):
+        """ a solver that is not instrumented should have no stats """
+        
+        solver = CubeSolver('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb')
+        
+        self.assertIsNone(solver.stats)
+    
+    def test_solveStats_cubeSolver_20020_ShouldAccountForEveryMove(self):
+        """ an instrumented solve should total every move made and predicate evaluated under its stages """
+        
+        solver = CubeSolver('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb', instrument = True)
+        sections = solver.stats.getSections()
+        
+        self.assertEqual(sections['solve']['moves'], solver.stats.moves)
+        self.assertEqual(sections['solve']['predicates'], solver.stats.predicates)
+        self.assertGreater(solver.stats.predicates, 0)
+        self.assertIn('solveEntireCube', sections)
+        self.assertIn('trigger', sections)
+    
+    def test_solveStats_cubeSolver_20030_InstrumentingShouldNotChangeSolution(self):
+        """ an instrumented solve should find the same solution as one that is not """
+        
+        cube = 'gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb'
+        
+        self.assertEqual(CubeSolver(cube, instrument = True).getSolution(), CubeSolver(cube).getSolution())
+    
+    ''' SolveStats.observe -- POSITIVE TESTS '''
+    
+    def test_solveStats_observe_20010_ShouldAddSectionsToHistograms(self):
+        """ observing stats should record each section in the process-wide histograms """
+        
+        histogram = metrics.REGISTRY['rubik_solve_section_moves']
+        before = histogram.getSnapshot().get(('solve',), {'count': 0})['count']
+        
+        CubeSolver('gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb', instrument = True).stats.observe()
+        
+        self.assertEqual(histogram.getSnapshot()[('solve',)]['count'], before + 1)
+    
+    ''' solve._solveCube -- instrumentation -- POSITIVE TESTS '''
+    
+    def test_solveStats_solveCube_20010_ShouldOnlyInstrumentSampledSolves(self):
+        """ solves should only be instrumented and observed at the configured sample rate, a small one by default """
+        
+        cube = 'gooybrgbbbwwyrrrwwogowgrobbyorgogyorgogbygywywywywbrrb'
+        histogram = metrics.REGISTRY['rubik_solve_section_moves']
+        
+        def count():
+            return histogram.getSnapshot().get(('solve',), {'count': 0})['count']
+        
+        before = count()
+        
+        with patch.dict(os.environ):
+            os.environ.pop(solve.STATS_SAMPLE_RATE_VARIABLE, None)
+            
+            with patch.object(solve.random, 'random', return_value = solve.DEFAULT_STATS_SAMPLE_RATE):
+                solve._solveCube(cube)
+            
+            self.assertEqual(count(), before)
+            
+            with patch.object(solve.random, 'random', return_value = solve.DEFAULT_STATS_SAMPLE_RATE / 2):
+                solve._solveCube(cube)
+            
+            self.assertEqual(count(), before + 1)
+        
+        with patch.dict(os.environ, {solve.STATS_SAMPLE_RATE_VARIABLE: '0'}), patch.object(solve.random, 'random', return_value = 0.0):
+            solve._solveCube(cube)
+        
+        self.assertEqual(count(), before + 1)
+        
+        with patch.dict(os.environ, {solve.STATS_SAMPLE_RATE_VARIABLE: '1'}):
+            solve._solveCube(cube)
+        
+        self.assertEqual(count(), before + 2)
@@ -1,11 +1,14 @@
 
 import hashlib
 from unittest import TestCase
+from unittest.mock import patch
 
 import rubik.solve as solve
 import rubik.rotate as rotate
+import rubik.verify as verify
 from rubik.cube import Cube
 from rubik.cubeFacePosition import CubeFacePosition
+from rubik.solveBudgetExceeded import SolveBudgetExceeded
 
 class SolveTest(TestCase):
     
@@ -85,6 +88,28 @@ class SolveTest(TestCase):
         self.assertIn('status', result)
         self.assertEqual(result['status'], solve.ERROR_INVALID_CUBE)
     
+    def test_solve_10080_ShouldErrorOnCubeThatCannotBeSolved(self):
+        """ supplying a cube with a single flipped edge should result in error status without solving """
+        
+        result = solve._solve({
+            'op': 'solve',
+            'cube': 'bbbobbbbbrrrrrrrrrgggggggggoooooboooyyyyyyyyywwwwwwwww'
+        })
+        
+        self.assertIn('status', result)
+        self.assertEqual(result['status'], verify.ERROR_FLIPPED_EDGE)
+    
+    def test_solve_10090_ShouldErrorWhenSolveRunsOutOfBudget(self):
+        """ a solve that runs out of budget should result in error status """
+        
+        with patch.object(solve, '_cachedSolveCube', side_effect = SolveBudgetExceeded('up face', 'time', 5.0)):
+            result = solve._solve({
+                'op': 'solve',
+                'cube': 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'
+            })
+        
+        self.assertEqual(result['status'], solve.ERROR_BUDGET_EXCEEDED)
+    
     ''' solve -- POSITIVE TESTS '''
     
     def test_solve_20010_ShouldReturnStatusOKForValidParams(self):
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+import rubik.batch as batch
+import rubik.metrics as metrics
+from rubik.solverPool import SolverPool
+
+class SolverPoolTest(TestCase):
+    
+    ''' SolverPool.__init__ -- NEGATIVE TESTS '''
+    
+    def test_solverPool_init_10010_ShouldThrowExceptionForNonPositiveSize(self):
+        """ supplying a pool size that is not positive should throw exception """
+        
+        with self.assertRaises(Exception):
+            SolverPool(-2)
+    
+    ''' SolverPool.__init__ -- POSITIVE TESTS '''
+    
+    def test_solverPool_init_20010_ShouldNotForkWorkersFromThisProcess(self):
+        """ workers should be started by a fork server, so they cannot inherit locks held by other threads """
+        
+        with SolverPool(1) as pool:
+            self.assertEqual(pool._executor._mp_context.get_start_method(), 'forkserver')
+    
+    ''' SolverPool.dispatch -- POSITIVE TESTS '''
+    
+    def test_solverPool_dispatch_20010_ShouldMatchDispatchingBatchInProcess(self):
+        """ a batch dispatched through the pool should get the same statuses and rotations, in order """
+        
+        items = [
+            {'op': 'solve', 'cube': 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'},
+            {'op': 'solve'},
+            batch._parseLine('{"op": '),
+        ] * batch.MIN_PARALLEL_BATCH_SIZE
+        
+        with SolverPool(2) as pool:
+            results = batch._batch(items, pool)
+        
+        expected = batch._batch(items)
+        
+        self.assertEqual(
+            [(result['status'], result.get('rotations')) for result in results],
+            [(result['status'], result.get('rotations')) for result in expected]
+        )
+    
+    def test_solverPool_dispatch_20020_ShouldCountMetricsOfWorkersInThisProcess(self):
+        """ ops dispatched by worker processes should be counted in the metrics of this process """
+        
+        items = [{'op': 'solve', 'cube': 'owyobygwwowyrrorygbgbbggrrbwwgroywywroroyrybbogggwboby'}] * batch.MIN_PARALLEL_BATCH_SIZE
+        counter = metrics.REGISTRY['rubik_op_requests_total']
+        before = counter.getSnapshot().get(('solve', 'ok'), 0)
+        
+        with SolverPool(2) as pool:
+            batch._batch(items, pool)
+        
+        self.assertEqual(counter.getSnapshot()[('solve', 'ok')], before + len(items))
@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+import rubik.verify as verify
+import rubik.moveCompiler as moveCompiler
+
+SOLVED_CUBE = 'bbbbbbbbbrrrrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'
+
+class VerifyTest(TestCase):
+    
+    ''' verify -- NEGATIVE TESTS '''
+    
+    def test_verify_10010_ShouldErrorOnMissingCube(self):
+        """ supplying no cube param should result in error status """
+        
+        result = verify._verify({'op': 'verify'})
+        
+        self.assertEqual(result['status'], verify.ERROR_MISSING_CUBE)
+    
+    def test_verify_10020_ShouldErrorOnInvalidCube(self):
+        """ supplying a cube with an uneven distribution of colors should result in error status """
+        
+        result = verify._verify({'op': 'verify', 'cube': 'b' * 54})
+        
+        self.assertEqual(result['status'], verify.ERROR_INVALID_CUBE)
+    
+    def test_verify_10030_ShouldErrorOnCornerWithImpossibleColors(self):
+        """ supplying a cube with a corner colored by opposite faces should result in error status """
+        
+        result = verify._verify({'op': 'verify', 'cube': 'rbbbbbbbbrrbrrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'})
+        
+        self.assertEqual(result['status'], verify.ERROR_INVALID_CORNERS)
+    
+    def test_verify_10040_ShouldErrorOnEdgeWithImpossibleColors(self):
+        """ supplying a cube with an edge colored by opposite faces should result in error status """
+        
+        result = verify._verify({'op': 'verify', 'cube': 'bbbrbbbbbrrrbrrrrrgggggggggoooooooooyyyyyyyyywwwwwwwww'})
+        
+        self.assertEqual(result['status'], verify.ERROR_INVALID_EDGES)
+    
+    def test_verify_10050_ShouldErrorOnTwistedCorner(self):
+        """ supplying a cube with a single twisted corner should result in error status """
+        
+        result = verify._verify({'op': 'verify', 'cube': 'bbbbbbbbbrrrrrrrrrggoggggggyoooooooogyyyyyyyywwwwwwwww'})
+        
+        self.assertEqual(result['status'], verify.ERROR_TWISTED_CORNER)
+    
+    def test_verify_10060_ShouldErrorOnFlippedEdge(self):
+        """ supplying a cube with a single flipped edge should result in error status """
+        
+        result = verify._verify({'op': 'verify', 'cube': 'bbbobbbbbrrrrrrrrrgggggggggoooooboooyyyyyyyyywwwwwwwww'})
+        
+        self.assertEqual(result['status'], verify.ERROR_FLIPPED_EDGE)
+    
+    def test_verify_10070_ShouldErrorOnSwappedEdges(self):
+        """ supplying a cube with a single pair of edges swapped should result in error status """
+        
+        result = verify._verify({'op': 'verify', 'cube': 'bbbbbbbbbrrrorrrrrgggggggggoooooroooyyyyyyyyywwwwwwwww'})
+        
+        self.assertEqual(result['status'], verify.ERROR_PERMUTATION_PARITY)
+    
+    ''' verify -- POSITIVE TESTS '''
+    
+    def test_verify_20010_ShouldAcceptSolvedCube(self):
+        """ a solved cube should be verified """
+        
+        result = verify._verify({'op': 'verify', 'cube': SOLVED_CUBE})
+        
+        self.assertEqual(result['status'], verify.STATUS_OK)
+    
+    def test_verify_20020_ShouldAcceptRotatedCubes(self):
+        """ any cube reached by rotating a solved cube should be verified """
+        
+        for rotationCodes in ['F', 'RUru', 'FRBLUDfrbludFFRR', 'LLbDRuRfBBdlUUf']:
+            cube = moveCompiler.applyMoves(SOLVED_CUBE, rotationCodes)
+            
+            self.assertEqual(verify._checkSolvable(cube), verify.STATUS_OK)
+    
+    def test_verify_20030_ShouldAcceptRecoloredCube(self):
+        """ a rotated cube with its colors relabeled should be verified """
+        
+        cube = moveCompiler.applyMoves(SOLVED_CUBE, 'FRBLUDfrblud').translate(str.maketrans('brgoyw', 'wyobgr'))
+        
+        self.assertEqual(verify._checkSolvable(cube), verify.STATUS_OK)
@@ -1,11 +1,204 @@
+from collections import defaultdict
 
-import rubik.cube as rubik
+from rubik.cube import Cube
+from rubik.cubeCode import CubeCode
+from rubik.cubeFacePosition import CubeFacePosition
+import rubik.cubeSymmetry as cubeSymmetry
+import rubik.moveTable as moveTable
 
-def _verify(parms):
-    """Determines if the provided cube is physically valid. Returns:
-       {'status': 'ok'} if valid 
-       {'status': 'error: xxx} if invalid"""
-    result = {}
-    encodedCube = parms.get('cube',None)       #STUB:  get "cube" parameter if present
-    result['status'] = 'ok'                     
-    return result
\ No newline at end of file
+ERROR_MISSING_CUBE = 'error: missing cube'
+ERROR_INVALID_CUBE = 'error: invalid cube'
+ERROR_INVALID_CORNERS = 'error: corners have invalid colors'
+ERROR_INVALID_EDGES = 'error: edges have invalid colors'
+ERROR_TWISTED_CORNER = 'error: corners are twisted'
+ERROR_FLIPPED_EDGE = 'error: edges are flipped'
+ERROR_PERMUTATION_PARITY = 'error: pieces are swapped'
+STATUS_OK = 'ok'
+
+def _verify(params):
+    """ Determines whether the provided cube can be physically reached from a solved cube """
+    
+    # validate that 'cube' param exists
+    if 'cube' not in params:
+        return __missingCubeError__()
+    
+    cube = params['cube']
+    
+    # validate that 'cube' param conforms to spec
+    if not CubeCode.isValid(cube):
+        return __invalidCubeError__()
+    
+    return {'status': _checkSolvable(cube)}
+
+def _checkSolvable(cube: str) -> str:
+    """
+    returns STATUS_OK if a valid cube code can be reached by rotating a solved cube,
+    otherwise the status of the first check it fails
+    """
+    
+    # with its centers relabeled to fixed colors, every piece's home is known in advance
+    cube = cubeSymmetry.canonicalizeColors(cube)
+    
+    # find which corner piece is in each corner slot, and how it is twisted
+    cornerPermutation = []
+    cornerTwist = 0
+    
+    for indices in _CORNER_SLOTS:
+        colors = tuple(cube[index] for index in indices)
+        piece = None
+        
+        for twist in range(3):
+            piece = _HOME_CORNERS.get(colors[twist:] + colors[:twist])
+            
+            if piece is not None:
+                break
+        
+        if piece is None:
+            return ERROR_INVALID_CORNERS
+        
+        cornerPermutation.append(piece)
+        cornerTwist += twist
+    
+    # find which edge piece is in each edge slot, and whether it is flipped
+    edgePermutation = []
+    edgeFlip = 0
+    
+    for indices in _EDGE_SLOTS:
+        colors = tuple(cube[index] for index in indices)
+        piece = _HOME_EDGES.get(colors)
+        
+        if piece is None:
+            piece = _HOME_EDGES.get(colors[::-1])
+            edgeFlip += 1
+        
+        if piece is None:
+            return ERROR_INVALID_EDGES
+        
+        edgePermutation.append(piece)
+    
+    # every piece must appear exactly once
+    if len(set(cornerPermutation)) != len(_CORNER_SLOTS):
+        return ERROR_INVALID_CORNERS
+    
+    if len(set(edgePermutation)) != len(_EDGE_SLOTS):
+        return ERROR_INVALID_EDGES
+    
+    # rotating a face twists corners in opposing pairs, and flips edges in pairs
+    if cornerTwist % 3 != 0:
+        return ERROR_TWISTED_CORNER
+    
+    if edgeFlip % 2 != 0:
+        return ERROR_FLIPPED_EDGE
+    
+    # rotating a face cycles four corners and four edges, so both permutations share a parity
+    if _permutationParity(cornerPermutation) != _permutationParity(edgePermutation):
+        return ERROR_PERMUTATION_PARITY
+    
+    return STATUS_OK
+
+def _permutationParity(permutation) -> int:
+    """ 0 if a permutation is even, 1 if it is odd """
+    
+    seen = set()
+    cycles = 0
+    
+    for start in range(len(permutation)):
+        if start in seen:
+            continue
+        
+        cycles += 1
+        index = start
+        
+        while index not in seen:
+            seen.add(index)
+            index = permutation[index]
+    
+    return (len(permutation) - cycles) % 2
+
+def _faceNormal(facePosition: CubeFacePosition):
+    """ the outward direction of a face, derived from the coordinates of its cubelets """
+    
+    coords = Cube.CUBELET_COORDS[facePosition]
+    axis = next(axis for axis in range(Cube.DIM) if len({coord[axis] for coord in coords}) == 1)
+    
+    normal = [0] * Cube.DIM
+    normal[axis] = coords[0][axis] - (Cube.WIDTH // 2)
+    
+    return normal
+
+def _determinant(a, b, c) -> int:
+    """ the determinant of three vectors, whose sign tells the handedness of their order """
+    
+    return (
+        a[0] * (b[1] * c[2] - b[2] * c[1])
+        - a[1] * (b[0] * c[2] - b[2] * c[0])
+        + a[2] * (b[0] * c[1] - b[1] * c[0])
+    )
+
+def _deriveSlots():
+    """
+    derives the facelet indices of each corner and edge slot, in a fixed order: a corner's
+    up or down facelet comes first and the rest follow with the same handedness at every corner,
+    and an edge's up or down facelet comes first, else its front or back facelet
+    """
+    
+    facePositionsByCoord = defaultdict(list)
+    
+    for (coord, facePosition) in moveTable.FACELET_INDICES:
+        facePositionsByCoord[coord].append(facePosition)
+    
+    primaryFacePositions = [
+        (CubeFacePosition.UP, CubeFacePosition.DOWN),
+        (CubeFacePosition.FRONT, CubeFacePosition.BACK),
+    ]
+    
+    def primaryRank(facePosition):
+        """ how strongly a facelet on a face position is preferred as a piece's primary facelet """
+        
+        return next(
+            (rank for (rank, faces) in enumerate(primaryFacePositions) if facePosition in faces),
+            len(primaryFacePositions)
+        )
+    
+    cornerSlots = []
+    edgeSlots = []
+    
+    for (coord, facePositions) in facePositionsByCoord.items():
+        facePositions = sorted(facePositions, key = primaryRank)
+        
+        if len(facePositions) == 3:
+            
+            # order the remaining facelets so the three normals are right-handed
+            normals = [_faceNormal(facePosition) for facePosition in facePositions]
+            
+            if _determinant(*normals) < 0:
+                facePositions[1:] = facePositions[:0:-1]
+            
+            cornerSlots.append(tuple(moveTable.FACELET_INDICES[coord, facePosition] for facePosition in facePositions))
+        
+        elif len(facePositions) == 2:
+            edgeSlots.append(tuple(moveTable.FACELET_INDICES[coord, facePosition] for facePosition in facePositions))
+    
+    return (sorted(cornerSlots), sorted(edgeSlots))
+
+def _homePieces(slots):
+    """ the colors a canonical solved cube has in each slot, mapped to the slot's number """
+    
+    solvedCube = ''.join(color * Cube.FACE_AREA for color in cubeSymmetry.CANONICAL_CENTER_COLORS)
+    
+    return {tuple(solvedCube[index] for index in indices): slot for (slot, indices) in enumerate(slots)}
+
+(_CORNER_SLOTS, _EDGE_SLOTS) = _deriveSlots()
+
+_HOME_CORNERS = _homePieces(_CORNER_SLOTS)
+_HOME_EDGES = _homePieces(_EDGE_SLOTS)
+
+def __missingCubeError__():
+    """ returns error for missing cube param """
+    
+    return {'status': ERROR_MISSING_CUBE}
+
+def __invalidCubeError__():
+    """ returns error for invalid cube param """
+    
+    return {'status': ERROR_INVALID_CUBE}